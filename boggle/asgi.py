@@ -0,0 +1,169 @@
+"""
+ASGI entry point for the Boggle server.
+
+Werkzeug's development server handles one short-lived connection per request,
+which falls over once a room full of phones and the polling TV windows hit it
+at the same time. This module exposes the same Flask app as an ASGI
+application so it can be served by uvicorn: connections (and HTTP keep-alive)
+are handled on the event loop, and the WSGI handlers run on a thread pool.
+
+We don't use asgiref's WsgiToAsgi because it pins every request to a single
+thread, which serialises the whole server and blocks behind any streaming
+response.
+
+    uvicorn asgi:create_app --factory --app-dir boggle --port 8080
+
+or simply `python boggle/server.py --server asgi`.
+"""
+import asyncio
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_DONE = object()
+
+
+class WSGIBridge:
+    """Serve a WSGI app over ASGI, running handlers on a thread pool."""
+
+    def __init__(self, wsgi_app: Callable[..., Iterable[bytes]], max_workers: int = 64):
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wsgi")
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any],
+                       send: Callable[..., Any]) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        body = await self._read_body(receive)
+        environ = self._build_environ(scope, body)
+        loop = asyncio.get_running_loop()
+
+        status, headers, chunks, first = await loop.run_in_executor(
+            self.executor, self._start, environ
+        )
+
+        # Watch for the client going away so streaming responses stop promptly
+        disconnected = asyncio.Event()
+
+        async def watch() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    return
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            chunk = first
+            while chunk is not _DONE and not disconnected.is_set():
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                chunk = await loop.run_in_executor(self.executor, next, chunks, _DONE)
+            if not disconnected.is_set():
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            watcher.cancel()
+            close = getattr(chunks, "close", None)
+            if close:
+                await loop.run_in_executor(self.executor, close)
+
+    def _start(self, environ: Dict[str, Any]) -> Tuple[int, List[Tuple[bytes, bytes]],
+                                                      Iterator[bytes], Any]:
+        """Call the WSGI app and pull the first chunk in one trip to the pool."""
+        started: Dict[str, Any] = {}
+
+        def start_response(status: str, headers: List[Tuple[str, str]],
+                           exc_info: Optional[Any] = None) -> Callable[[bytes], None]:
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = [
+                (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers
+            ]
+            return lambda data: None  # legacy write() callable, unused by Flask
+
+        result = self.wsgi_app(environ, start_response)
+        chunks = iter(result)
+        first = next(chunks, _DONE)
+        if not hasattr(chunks, "close") and hasattr(result, "close"):
+            chunks = _Closing(chunks, result.close)
+        return started["status"], started["headers"], chunks, first
+
+    async def _read_body(self, receive: Callable[..., Any]) -> bytes:
+        parts = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            parts.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        return b"".join(parts)
+
+    def _build_environ(self, scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client") or ("", 0)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+            "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server[0],
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0],
+            "REMOTE_PORT": str(client[1]),
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for raw_name, raw_value in scope.get("headers", []):
+            name = raw_name.decode("latin-1").upper().replace("-", "_")
+            value = raw_value.decode("latin-1")
+            if name == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+                continue
+            if name == "CONTENT_LENGTH":
+                continue
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+    async def _lifespan(self, receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+class _Closing:
+    """Iterator wrapper that forwards close() to the original WSGI result."""
+
+    def __init__(self, chunks: Iterator[bytes], close: Callable[[], None]):
+        self._chunks = chunks
+        self.close = close
+
+    def __iter__(self) -> "_Closing":
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self._chunks)
+
+
+def create_app(max_workers: int = 64) -> WSGIBridge:
+    """Factory for `uvicorn --factory`; imports the server lazily."""
+    from server import app
+    return WSGIBridge(app, max_workers=max_workers)
@@ -7,6 +7,14 @@ import subprocess
 # Add parent dir to path to import engine
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engine import HyprlandEngine
+from engine import zygote
+from engine.browser import Browser
+from engine.session import Session, SessionError, http_probe
+from lan import detect_lan_ip
+
+ZYGOTE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "engine", "zygote.py")
+# Imported once by the zygote; every TUI window is forked with these loaded
+TUI_PRELOAD = ["requests", "screen", "tui"]
 
 def start_server():
     """Starts the Flask server in a separate thread (or process for robustness)"""
@@ -16,111 +24,139 @@ def start_server():
     
     # Actually, if we run it as subprocess, we need to ensure we kill it.
     server_path = os.path.join(os.path.dirname(__file__), "server.py")
-    cmd = [sys.executable, server_path]
+    # BOGGLE_SERVER=asgi selects the uvicorn-backed server for big groups
+    cmd = [sys.executable, server_path, "--server", os.environ.get("BOGGLE_SERVER", "dev")]
     return subprocess.Popen(cmd)
 
+def start_zygote():
+    """Fork server for the TUI windows; returns (process, socket path) or (None, None)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+    socket_path = os.path.join(runtime_dir, f"boggle-zygote-{os.getpid()}.sock")
+    cmd = [sys.executable, ZYGOTE_PATH, "serve", "--socket", socket_path,
+           "--path", os.path.dirname(os.path.abspath(__file__))]
+    for module in TUI_PRELOAD:
+        cmd += ["--preload", module]
+    proc = subprocess.Popen(cmd)
+    if zygote.wait_ready(socket_path, timeout=10):
+        return proc, socket_path
+    # Windows fall back to starting their own interpreters
+    proc.terminate()
+    return None, None
+
+def window_layout(zygote_socket=None, browser=None):
+    """The game windows: (terminal windows, browser windows)."""
+    # We use Ghostty for the "Terminal Game" aesthetic
+    # Absolute path to tui.py needed for robustness
+    tui_path = os.path.join(os.path.dirname(__file__), "tui.py")
+    # Use absolute path instead of relative path manipulation that might be fragile
+    config_path = os.path.expanduser("~/code/games/ghostty_game.conf")
+    
+    # Explicitly quote command for ghostty if needed, but ghostty handles spaces in args if quoted in shell
+    # Actually, let's verify if 'python' is in path
+    python_cmd = sys.executable
+    
+    def get_cmd(mode, font_size=20, title="BoggleApp"):
+        # Ensure proper quoting if paths have spaces, though our paths don't
+        # The title is crucial for the engine to identify the window if we don't use class
+        # NOTE: Ghostty 1.0 uses --font-size=N directly or configuration overrides
+        # -o might not be valid for font-size directly in all versions?
+        # Let's try explicit flag if supported or config override syntax
+        # The help says --key=value for config keys. font-size is a config key.
+        if zygote_socket:
+            # Forked from the zygote: no interpreter start or imports per window
+            run = f"{python_cmd} -S {ZYGOTE_PATH} run --socket {zygote_socket} -- {tui_path} {mode}"
+        else:
+            run = f"{python_cmd} {tui_path} {mode}"
+        return f"ghostty --config-file={config_path} --title={title} --font-size={font_size} -e {run}"
+
+    # Layout based on 2048x1080 resolution (Logical)
+    # Content Width = 1900
+    # Margin = (2048 - 1900) / 2 = 74
+    
+    start_x = 74
+    col_2_x = start_x + 1000 + 30 # 1104
+    
+    # Vertical Spacing for Sidebar (Total Height ~1000px available)
+    # Timer: 250px
+    # Leaderboard: 500px
+    # Join: 230px
+    # Gap: 10px
+    # Total: 250 + 10 + 500 + 10 + 230 = 1000 (Fits exactly in 20-1020 range)
+    
+    # Use localhost for internal windows (faster, reliable)
+    internal_host = "127.0.0.1"
+    
+    terminals = [
+        {
+            # Timer (Top Right)
+            "command": get_cmd('timer', 60, "BoggleTimer"),
+            "name_pattern": "BoggleTimer",
+            "x": col_2_x, "y": 20, 
+            "width": 850, "height": 250
+        },
+        {
+            # Leaderboard (Middle Right)
+            "command": get_cmd('leaderboard', 18, "BoggleLeaderboard"),
+            "name_pattern": "BoggleLeaderboard",
+            "x": col_2_x, "y": 280, 
+            "width": 850, "height": 450 
+        },
+    ]
+    # All app windows share one Chromium instance (dedicated profile), so
+    # a second view costs a renderer rather than another browser
+    browser = browser or Browser()
+    board = {"x": start_x, "y": 20, "width": 1000, "height": 1000}
+    if os.environ.get("BOGGLE_BOARD") == "terminal":
+        # Main Board (Left) drawn in Ghostty with the kitty graphics protocol
+        terminals.append({"command": get_cmd('board', 14, "BoggleBoard"),
+                          "name_pattern": "BoggleBoard", **board})
+        browsers = []
+    else:
+        # Main Board (Left)
+        browsers = [browser.app_window(f"http://{internal_host}:8080/view/board", **board)]
+    # Join Info (Bottom Right)
+    browsers.append(browser.app_window(f"http://{internal_host}:8080/view/join", col_2_x, 740, 850, 300))
+    return terminals, browsers
+
 def main():
     engine = HyprlandEngine(target_workspace=2)
     game_patterns = ["BoggleBoard", "BoggleTimer", "BoggleLeaderboard", "BoggleJoin", "BoggleController"]
+    procs = {}
     
-    server_proc = None
+    # Bring-up as a dependency graph: independent steps run in parallel and
+    # each dependent starts the moment what it needs is actually ready
+    # (HTTP health check, zygote socket, window-opened events), not after
+    # a fixed sleep.
+    session = Session()
+    session.step("server", lambda: procs.setdefault("server", start_server()),
+                 probe=http_probe("http://127.0.0.1:8080/state"))
+    # Never fails: without a zygote the terminals start plain interpreters
+    session.step("zygote", lambda: procs.setdefault("zygote", start_zygote()))
+    session.step("clean_slate", lambda: engine.clean_slate(game_patterns))
+    # engine.switch_to_workspace() # DISABLED per user request
+    session.step("background", lambda: engine.set_background(color="#1e1e2e"),
+                 after=["clean_slate"])
+    session.step("animations", engine.set_animations) # Enable bouncy animations
+    # Terminals don't need the server (the TUI reconnects); browsers do,
+    # since chromium won't retry a refused first load
+    session.step("terminals", lambda: engine.spawn_batch(window_layout(procs["zygote"][1])[0]),
+                 after=["zygote", "clean_slate", "animations"])
+    session.step("browsers", lambda: engine.spawn_batch(window_layout(browser=engine.browser)[1]),
+                 after=["server", "clean_slate", "animations"])
     
     try:
-        # 1. Start Game Server
-        print("Starting Boggle Server...")
-        server_proc = start_server()
-        time.sleep(2) # Give Flask a moment
-        
-        # 2. Clean Slate
-        engine.clean_slate(game_patterns)
-        
-        # 3. Setup Layout
-        # engine.switch_to_workspace() # DISABLED per user request
-        engine.set_background(color="#1e1e2e") 
-        engine.set_animations() # Enable bouncy animations
-        
-        print("Spawning Boggle Windows (Ghostty)...")
-        
-        # We use Ghostty for the "Terminal Game" aesthetic
-        term_cmd = "ghostty --config=../ghostty_game.conf -e python tui.py"
-        
-        # Absolute path to tui.py needed for robustness
-        tui_path = os.path.join(os.path.dirname(__file__), "tui.py")
-        # Use absolute path instead of relative path manipulation that might be fragile
-        config_path = os.path.expanduser("~/code/games/ghostty_game.conf")
-        
-        # Explicitly quote command for ghostty if needed, but ghostty handles spaces in args if quoted in shell
-        # Actually, let's verify if 'python' is in path
-        python_cmd = sys.executable
-        
-        def get_cmd(mode, font_size=20, title="BoggleApp"):
-            # Ensure proper quoting if paths have spaces, though our paths don't
-            # The title is crucial for the engine to identify the window if we don't use class
-            # NOTE: Ghostty 1.0 uses --font-size=N directly or configuration overrides
-            # -o might not be valid for font-size directly in all versions?
-            # Let's try explicit flag if supported or config override syntax
-            # The help says --key=value for config keys. font-size is a config key.
-            return f"ghostty --config-file={config_path} --title={title} --font-size={font_size} -e {python_cmd} {tui_path} {mode}"
-
-        # Layout based on 2048x1080 resolution (Logical)
-        # Content Width = 1900
-        # Margin = (2048 - 1900) / 2 = 74
-        
-        start_x = 74
-        col_2_x = start_x + 1000 + 30 # 1104
-        
-        # Vertical Spacing for Sidebar (Total Height ~1000px available)
-        # Timer: 250px
-        # Leaderboard: 500px
-        # Join: 230px
-        # Gap: 10px
-        # Total: 250 + 10 + 500 + 10 + 230 = 1000 (Fits exactly in 20-1020 range)
-        
-        # Use localhost for internal windows (faster, reliable)
-        # But display the LAN IP for external players
-        internal_host = "127.0.0.1"
-        external_host = "192.168.1.31" 
-        
-        windows = [
-            {
-                # Main Board (Left)
-                "command": f"chromium --app=http://{internal_host}:8080/view/board",
-                # Matches class generated by chromium for localhost
-                "name_pattern": f"chrome-{internal_host}__view_board-Default",
-                "x": start_x, "y": 20, 
-                "width": 1000, "height": 1000,
-                "is_class": True 
-            },
-            {
-                # Timer (Top Right)
-                "command": get_cmd('timer', 60, "BoggleTimer"),
-                "name_pattern": "BoggleTimer",
-                "x": col_2_x, "y": 20, 
-                "width": 850, "height": 250
-            },
-            {
-                # Leaderboard (Middle Right)
-                "command": get_cmd('leaderboard', 18, "BoggleLeaderboard"),
-                "name_pattern": "BoggleLeaderboard",
-                "x": col_2_x, "y": 280, 
-                "width": 850, "height": 450 
-            },
-            {
-                # Join Info (Bottom Right)
-                "command": f"chromium --app=http://{internal_host}:8080/view/join",
-                "name_pattern": f"chrome-{internal_host}__view_join-Default",
-                "x": col_2_x, "y": 740, 
-                "width": 850, "height": 300, 
-                "is_class": True 
-            }
-        ]
-
-        
-        engine.spawn_batch(windows)
+        print("Starting Boggle...")
+        try:
+            report = session.run()
+        except SessionError as e:
+            print(f"Error: {e}")
+            report = e.report
+        if report:
+            print(report.format())
         
         print("Boggle Game Running on Workspace 2.")
 
-        print(f"Server at http://{external_host}:8080")
+        print(f"Server at http://{detect_lan_ip()}:8080")
         print("Press Ctrl+C to stop.")
         
         while True:
@@ -131,8 +167,10 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        if server_proc:
-            server_proc.terminate()
+        if "server" in procs:
+            procs["server"].terminate()
+        if procs.get("zygote", (None,))[0]:
+            procs["zygote"][0].terminate()
         engine.cleanup()
         engine.clean_slate(game_patterns)
 
@@ -0,0 +1,294 @@
+"""
+Cluster mode: shard Boggle rooms across worker processes.
+
+All game state lives in Python objects, so one server process can only use
+one core. Here each worker is a complete Boggle server (server.py) listening
+on its own Unix socket, and a small stateless ASGI router in front maps every
+room code to a worker by hash and proxies the request over that socket.
+The top-level routes (the default table) always land on the same worker.
+
+Because the router keeps no state it can itself run as several processes
+sharing the listening socket.
+
+    python boggle/cluster.py --workers 4 --routers 2 --port 8080
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import secrets
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+
+from rooms import CODE_ALPHABET, CODE_LENGTH
+
+BOGGLE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ROOM = "MAIN"
+
+# Headers that describe a single hop and must not be forwarded
+HOP_BY_HOP = {
+    b"connection", b"keep-alive", b"transfer-encoding", b"te", b"trailer",
+    b"upgrade", b"proxy-connection", b"content-length",
+}
+
+
+def worker_for(code: str, n_workers: int) -> int:
+    """Stable room -> worker mapping shared by every router process."""
+    return zlib.crc32(code.upper().encode()) % n_workers
+
+
+class ClusterRouter:
+    """ASGI app forwarding each request to the worker that owns its room."""
+
+    def __init__(self, sockets: List[str]):
+        self.sockets = sockets
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any],
+                       send: Callable[..., Any]) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = await self._read_body(receive)
+        path, method = scope["path"], scope["method"]
+
+        if path == "/rooms" and method == "POST":
+            await self._create_room(send)
+        elif path == "/rooms":
+            await self._list_rooms(send)
+        else:
+            parts = path.split("/")
+            code = parts[2] if len(parts) > 2 and parts[1] == "room" else DEFAULT_ROOM
+            sock = self.sockets[worker_for(code, len(self.sockets))]
+            await self._forward(sock, scope, body, receive, send)
+
+    async def _create_room(self, send: Callable[..., Any]) -> None:
+        # Pick the code here so the hash decides the owning worker
+        for _ in range(10):
+            code = "".join(secrets.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+            sock = self.sockets[worker_for(code, len(self.sockets))]
+            status, _, content = await self._request(
+                sock, "POST", "/rooms", json.dumps({"room": code}).encode()
+            )
+            if status != 409:
+                await self._respond(send, status, content)
+                return
+        await self._respond(send, 503, b'{"error": "no free room code"}')
+
+    async def _list_rooms(self, send: Callable[..., Any]) -> None:
+        results = await asyncio.gather(
+            *(self._request(sock, "GET", "/rooms") for sock in self.sockets)
+        )
+        codes: List[str] = []
+        for index, (status, _, content) in enumerate(results):
+            if status != 200:
+                continue
+            # Every worker has its own default table; only report reachable rooms
+            codes.extend(
+                code for code in json.loads(content)["rooms"]
+                if worker_for(code, len(self.sockets)) == index
+            )
+        await self._respond(send, 200, json.dumps({"rooms": codes}).encode())
+
+    async def _forward(self, sock: str, scope: Dict[str, Any], body: bytes,
+                       receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        """Proxy one request and stream the response back (event streams included)."""
+        target = scope.get("raw_path") or scope["path"].encode()
+        if scope.get("query_string"):
+            target += b"?" + scope["query_string"]
+        headers = [(k, v) for k, v in scope.get("headers", []) if k.lower() not in HOP_BY_HOP]
+        try:
+            reader, writer = await self._open(sock, scope["method"], target, headers, body)
+            status, resp_headers = await self._read_head(reader)
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            await self._respond(send, 502, b'{"error": "worker unavailable"}')
+            return
+
+        disconnected = asyncio.Event()
+
+        async def watch() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await send({"type": "http.response.start", "status": status,
+                        "headers": [(k, v) for k, v in resp_headers
+                                    if k.lower() not in HOP_BY_HOP - {b"content-length"}]})
+            while not disconnected.is_set():
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            if not disconnected.is_set():
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            watcher.cancel()
+            writer.close()
+
+    async def _request(self, sock: str, method: str, path: str,
+                       body: bytes = b"") -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+        headers = [(b"content-type", b"application/json")] if body else []
+        try:
+            reader, writer = await self._open(sock, method, path.encode(), headers, body)
+            status, resp_headers = await self._read_head(reader)
+            content = await reader.read()
+            writer.close()
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            return 502, [], b""
+        return status, resp_headers, content
+
+    async def _open(self, sock: str, method: str, target: bytes,
+                    headers: List[Tuple[bytes, bytes]], body: bytes
+                    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_unix_connection(sock)
+        # HTTP/1.0 + close: the worker streams the body and ends it with EOF,
+        # so we never have to decode chunked encoding
+        lines = [method.encode() + b" " + target + b" HTTP/1.0"]
+        lines += [k + b": " + v for k, v in headers if k.lower() != b"host"]
+        lines += [b"Host: worker", b"Connection: close", b"Content-Length: %d" % len(body)]
+        writer.write(b"\r\n".join(lines) + b"\r\n\r\n" + body)
+        await writer.drain()
+        return reader, writer
+
+    async def _read_head(self, reader: asyncio.StreamReader
+                         ) -> Tuple[int, List[Tuple[bytes, bytes]]]:
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head[:-4].split(b"\r\n")
+        status = int(status_line.split(b" ", 2)[1])
+        headers = []
+        for line in header_lines:
+            name, _, value = line.partition(b":")
+            headers.append((name.strip().lower(), value.strip()))
+        return status, headers
+
+    async def _read_body(self, receive: Callable[..., Any]) -> bytes:
+        parts = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            parts.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        return b"".join(parts)
+
+    async def _respond(self, send: Callable[..., Any], status: int, content: bytes) -> None:
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": content})
+
+
+def start_workers(n_workers: int, sock_dir: str, server_mode: str = "asgi",
+                  timeout: float = 15.0) -> Tuple[List[subprocess.Popen], List[str]]:
+    """Spawn `n_workers` game servers on Unix sockets and wait until they accept."""
+    server_path = os.path.join(BOGGLE_DIR, "server.py")
+    sockets = [os.path.join(sock_dir, f"worker{i}.sock") for i in range(n_workers)]
+    procs = [
+        subprocess.Popen([sys.executable, server_path, "--server", server_mode, "--uds", sock])
+        for sock in sockets
+    ]
+    deadline = time.monotonic() + timeout
+    pending = list(sockets)
+    while pending and time.monotonic() < deadline:
+        pending = [sock for sock in pending if not _accepts(sock)]
+        time.sleep(0.05)
+    if pending:
+        for proc in procs:
+            proc.terminate()
+        raise RuntimeError(f"Workers did not come up: {pending}")
+    return procs, sockets
+
+
+def _accepts(sock: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(sock)
+            return True
+        except OSError:
+            return False
+
+
+def serve_router(router: ClusterRouter, listener: socket.socket) -> None:
+    import uvicorn
+    config = uvicorn.Config(router, log_level="warning", access_log=False, timeout_keep_alive=30)
+    uvicorn.Server(config).run(sockets=[listener])
+
+
+def run_cluster(n_workers: int, host: str = "0.0.0.0", port: int = 8080,
+                routers: int = 1, server_mode: str = "asgi") -> None:
+    try:
+        import uvicorn  # noqa: F401
+    except ImportError:
+        raise SystemExit("Cluster mode needs uvicorn: pip install 'hyprland-game-engine[server]'")
+
+    # Turn SIGTERM into a normal exit so the workers below are always reaped
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # We bind the listener ourselves so every router process can share it.
+    # Accepted connections inherit TCP_NODELAY from it; without that, uvicorn
+    # serving a pre-bound socket stalls ~40ms per response (Nagle + delayed ACK).
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    listener.bind((host, port))
+    listener.listen(2048)
+
+    sock_dir = tempfile.mkdtemp(prefix="boggle-cluster-")
+    procs: List[subprocess.Popen] = []
+    router_procs: List[multiprocessing.Process] = []
+    try:
+        procs, sockets = start_workers(n_workers, sock_dir, server_mode)
+        router = ClusterRouter(sockets)
+        print(f"Boggle cluster: {n_workers} workers, {routers} routers on {host}:{port}")
+        if routers == 1:
+            serve_router(router, listener)
+        else:
+            ctx = multiprocessing.get_context("fork")
+            router_procs = [
+                ctx.Process(target=serve_router, args=(router, listener), daemon=True)
+                for _ in range(routers)
+            ]
+            for proc in router_procs:
+                proc.start()
+            for proc in router_procs:
+                proc.join()
+    finally:
+        for router_proc in router_procs:
+            router_proc.terminate()
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.wait()
+        listener.close()
+        shutil.rmtree(sock_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Boggle server sharded across processes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="game server processes (rooms are sharded across them)")
+    parser.add_argument("--routers", type=int, default=1,
+                        help="front router processes sharing the port")
+    parser.add_argument("--server", choices=["dev", "asgi"], default="asgi",
+                        help="HTTP server each worker runs")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    run_cluster(args.workers, args.host, args.port, args.routers, args.server)
@@ -1,8 +1,10 @@
 import random
 import string
+import threading
 import time
 import json
 import os
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional, Tuple
 
@@ -14,7 +16,7 @@ BOGGLE_DICE = [
     "EEGHNW", "AFFKPS", "HLNNRZ", "DEILRX"
 ]
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     score: int = 0
@@ -105,7 +107,26 @@ class BoardGenerator:
             
         return False
 
+@lru_cache(maxsize=None)
+def shared_generator(words_path: str) -> BoardGenerator:
+    """One generator (and word list) per path, shared by every game in the process."""
+    return BoardGenerator(words_path)
+
 class BoggleGame:
+    """
+    Game state shared by every request handler of the server.
+
+    All mutations happen under `self.lock`. Readers never see a half-applied
+    update: `to_json` hands out an immutable snapshot that is rebuilt only
+    when `version` changes (read-copy-update), so the hot `/state` polling
+    path does not hold the lock while Flask serialises the response.
+    Event streams block in `wait_for_change` until the version moves.
+    """
+    __slots__ = (
+        "board", "players", "state", "timer_end", "duration", "valid_words",
+        "lock", "changed", "version", "_snapshot", "_snapshot_version", "generator",
+    )
+
     def __init__(self):
         self.board: List[List[str]] = []
         self.players: Dict[str, Player] = {}
@@ -113,23 +134,36 @@ class BoggleGame:
         self.timer_end: float = 0
         self.duration: int = 180 # 3 minutes
         self.valid_words: Set[str] = set() 
+
+        # Concurrency: one re-entrant lock per game, bumped version per mutation
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self.version: int = 0
+        self._snapshot: Optional[dict] = None
+        self._snapshot_version: int = -1
         
         # Path resolution
         base_dir = os.path.dirname(os.path.abspath(__file__))
         words_path = os.path.join(base_dir, "../../boggle/assets/words_alpha.txt")
-        self.generator = BoardGenerator(words_path)
-        
-    def to_json(self):
-        return {
-            "board": self.board,
-            "players": {name: {"score": p.score, "words": list(p.words)} for name, p in self.players.items()},
-            "state": self.state,
-            "time_remaining": self.get_time_remaining()
-        }
+        self.generator = shared_generator(os.path.normpath(words_path))
 
+    def _touch(self):
+        # Must be called with the lock held
+        self.version += 1
+        self.changed.notify_all()
+
+    def wait_for_change(self, version: int, timeout: Optional[float] = None) -> int:
+        """Block until the game version differs from `version`; returns the current one."""
+        with self.lock:
+            self.changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+        
     def generate_board(self, width=5, height=5):
-        self.board = self.generator.generate(width, height)
-        return self.board
+        board = self.generator.generate(width, height)
+        with self.lock:
+            self.board = board
+            self._touch()
+        return board
 
     def to_svg(self) -> str:
         if not self.board:
@@ -178,42 +212,67 @@ class BoggleGame:
         return "".join(svg_parts)
 
     def start_game(self):
+        # Generate outside the lock, the DFS embedding is the slow part
+        board = self.generator.generate(5, 5)
+        with self.lock:
+            self.board = board
+            self.state = "PLAYING"
+            self.timer_end = time.time() + self.duration
+            # Reset player words for new round
+            for p in self.players.values():
+                p.words = set()
+            self._touch()
 
-        self.generate_board()
-        self.state = "PLAYING"
-        self.timer_end = time.time() + self.duration
-        # Reset player words for new round
-        for p in self.players.values():
-            p.words = set()
+    def reset(self, host: Optional[str] = None):
+        """Back to the lobby with an empty table (optionally keeping the host)."""
+        with self.lock:
+            self.state = "LOBBY"
+            self.players = {}
+            if host:
+                self.players[host] = Player(name=host)
+            self._touch()
 
     def add_player(self, name: str):
-        if name not in self.players:
-            self.players[name] = Player(name=name)
+        with self.lock:
+            if name not in self.players:
+                self.players[name] = Player(name=name)
+                self._touch()
 
     def submit_word(self, player_name: str, word: str):
-        if self.state != "PLAYING":
-            return False
         word = word.upper()
         # Basic validation (length, etc) - Dictionary check skipped for prototype
         if len(word) < 3:
             return False
-        
-        if player_name in self.players:
-            self.players[player_name].words.add(word)
+
+        with self.lock:
+            if self.state != "PLAYING":
+                return False
+            player = self.players.get(player_name)
+            if player is None:
+                return False
+            if word not in player.words:
+                player.words.add(word)
+                self._touch()
             return True
-        return False
 
     def get_time_remaining(self) -> int:
-        if self.state != "PLAYING":
-            return 0
-        remaining = int(self.timer_end - time.time())
-        if remaining <= 0:
-            self.state = "SCORING"
-            self.score_round()
-            return 0
-        return remaining
+        with self.lock:
+            if self.state != "PLAYING":
+                return 0
+            remaining = int(self.timer_end - time.time())
+            if remaining <= 0:
+                # State flips before scoring so concurrent pollers score exactly once
+                self.state = "SCORING"
+                self.score_round()
+                return 0
+            return remaining
 
     def score_round(self):
+        with self.lock:
+            self._score_round()
+            self._touch()
+
+    def _score_round(self):
         # Naive scoring: 1 point per word, no unique checks yet
         # Real rules: check uniqueness across all players
         all_words = []
@@ -242,13 +301,22 @@ class BoggleGame:
             p.score += round_score
 
     def to_json(self):
-        return {
-            "state": self.state,
-            "board": self.board,
-            "time_remaining": self.get_time_remaining(),
-            # Return as dict for TUI compatibility: {name: {score: ..., words: ...}}
-            "players": {
-                p.name: {"score": p.score, "words": list(p.words)}
-                for p in self.players.values()
-            }
-        }
+        with self.lock:
+            remaining = self.get_time_remaining()
+            if self._snapshot_version != self.version:
+                self._snapshot = {
+                    "state": self.state,
+                    # Absolute deadline (server epoch seconds, 0 outside a
+                    # round): clients count down locally against it
+                    "timer_end": self.timer_end if self.state == "PLAYING" else 0,
+                    "board": [list(row) for row in self.board],
+                    # Return as dict for TUI compatibility: {name: {score: ..., words: ...}}
+                    "players": {
+                        p.name: {"score": p.score, "words": list(p.words)}
+                        for p in self.players.values()
+                    }
+                }
+                self._snapshot_version = self.version
+            snapshot = self._snapshot
+        # Callers get a fresh top-level dict; the nested values are never mutated
+        return {**snapshot, "time_remaining": remaining, "server_time": time.time()}
@@ -0,0 +1,258 @@
+"""
+Board images for terminals that speak the kitty graphics protocol (Ghostty,
+kitty, WezTerm), so the board can live in a terminal instead of a browser.
+
+The board is rasterised in pure Python (same geometry and colours as
+`BoggleGame.to_svg`, letters from a built-in 5x7 font) into raw RGB, which
+is zlib-compressed and uploaded once under an image id. `BoardImages` keeps
+the ids of recently uploaded boards: showing a board the terminal already
+has, or re-fitting it after a resize, is a placement command of a few dozen
+bytes, and an unchanged frame sends nothing at all.
+
+    images = BoardImages(sys.stdout)
+    images.show(board, col=3, row=2, cols=60, rows=30)
+"""
+import base64
+import fcntl
+import os
+import struct
+import sys
+import termios
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
+
+ESC = "\033"
+APC = f"{ESC}_G"
+ST = f"{ESC}\\"
+# Base64 payload per escape sequence, as the protocol requires
+CHUNK = 4096
+
+# Catppuccin, as in the SVG board
+BACKGROUND = bytes((0x1e, 0x1e, 0x2e))
+TILE = bytes((0xf5, 0xe0, 0xdc))
+INK = bytes((0x1e, 0x1e, 0x2e))
+
+CELL = 100
+PADDING = 10
+RADIUS = 12
+
+# Boards the terminal keeps for us; older ones are freed
+CAPACITY = 8
+
+FONT: Dict[str, Tuple[str, ...]] = {
+    "A": (" ### ", "#   #", "#   #", "#####", "#   #", "#   #", "#   #"),
+    "B": ("#### ", "#   #", "#   #", "#### ", "#   #", "#   #", "#### "),
+    "C": (" ### ", "#   #", "#    ", "#    ", "#    ", "#   #", " ### "),
+    "D": ("#### ", "#   #", "#   #", "#   #", "#   #", "#   #", "#### "),
+    "E": ("#####", "#    ", "#    ", "#### ", "#    ", "#    ", "#####"),
+    "F": ("#####", "#    ", "#    ", "#### ", "#    ", "#    ", "#    "),
+    "G": (" ### ", "#   #", "#    ", "# ###", "#   #", "#   #", " ####"),
+    "H": ("#   #", "#   #", "#   #", "#####", "#   #", "#   #", "#   #"),
+    "I": (" ### ", "  #  ", "  #  ", "  #  ", "  #  ", "  #  ", " ### "),
+    "J": ("  ###", "   # ", "   # ", "   # ", "   # ", "#  # ", " ##  "),
+    "K": ("#   #", "#  # ", "# #  ", "##   ", "# #  ", "#  # ", "#   #"),
+    "L": ("#    ", "#    ", "#    ", "#    ", "#    ", "#    ", "#####"),
+    "M": ("#   #", "## ##", "# # #", "# # #", "#   #", "#   #", "#   #"),
+    "N": ("#   #", "#   #", "##  #", "# # #", "#  ##", "#   #", "#   #"),
+    "O": (" ### ", "#   #", "#   #", "#   #", "#   #", "#   #", " ### "),
+    "P": ("#### ", "#   #", "#   #", "#### ", "#    ", "#    ", "#    "),
+    "Q": (" ### ", "#   #", "#   #", "#   #", "# # #", "#  # ", " ## #"),
+    "R": ("#### ", "#   #", "#   #", "#### ", "# #  ", "#  # ", "#   #"),
+    "S": (" ####", "#    ", "#    ", " ### ", "    #", "    #", "#### "),
+    "T": ("#####", "  #  ", "  #  ", "  #  ", "  #  ", "  #  ", "  #  "),
+    "U": ("#   #", "#   #", "#   #", "#   #", "#   #", "#   #", " ### "),
+    "V": ("#   #", "#   #", "#   #", "#   #", "#   #", " # # ", "  #  "),
+    "W": ("#   #", "#   #", "#   #", "# # #", "# # #", "# # #", " # # "),
+    "X": ("#   #", "#   #", " # # ", "  #  ", " # # ", "#   #", "#   #"),
+    "Y": ("#   #", "#   #", " # # ", "  #  ", "  #  ", "  #  ", "  #  "),
+    "Z": ("#####", "    #", "   # ", "  #  ", " #   ", "#    ", "#####"),
+    "u": ("     ", "     ", "#   #", "#   #", "#   #", "#  ##", " ## #"),
+}
+GLYPH_W, GLYPH_H = 5, 7
+
+Board = Sequence[Sequence[str]]
+
+
+def supported(env=os.environ) -> bool:
+    """Whether the terminal we run in understands the graphics protocol."""
+    forced = env.get("BOGGLE_GRAPHICS")
+    if forced is not None:
+        return forced not in ("", "0", "no", "off")
+    return (env.get("TERM") in ("xterm-kitty", "xterm-ghostty")
+            or env.get("TERM_PROGRAM") in ("ghostty", "WezTerm")
+            or "KITTY_WINDOW_ID" in env)
+
+
+def cell_pixels(fd: Optional[int] = None) -> Optional[Tuple[float, float]]:
+    """(width, height) of one terminal cell in pixels, if the terminal reports it."""
+    fd = sys.stdout.fileno() if fd is None else fd
+    try:
+        rows, cols, xpixel, ypixel = struct.unpack(
+            "HHHH", fcntl.ioctl(fd, termios.TIOCGWINSZ, b"\0" * 8))
+    except (OSError, ValueError):
+        return None
+    if not (rows and cols and xpixel and ypixel):
+        return None
+    return xpixel / cols, ypixel / rows
+
+
+def fit(width: int, height: int, cols: int, rows: int,
+        cell: Optional[Tuple[float, float]] = None) -> Tuple[int, int]:
+    """The most cells (cols, rows) an image can cover in the area, keeping its aspect."""
+    cw, ch = cell or (1.0, 2.0)  # typical cell shape when the size is unknown
+    scale = min(cols * cw / width, rows * ch / height)
+    return max(1, int(width * scale / cw)), max(1, int(height * scale / ch))
+
+
+# --- rasterising -----------------------------------------------------------------
+
+def _corner_insets(size: int, radius: int) -> List[int]:
+    """How far each row of a rounded square starts in from its edges."""
+    insets = [0] * size
+    for i in range(radius):
+        dy = radius - i - 0.5
+        dx = (radius * radius - dy * dy) ** 0.5
+        insets[i] = insets[size - 1 - i] = int(round(radius - dx))
+    return insets
+
+
+def image_size(board: Board) -> Tuple[int, int]:
+    """(width, height) in pixels of the rasterised board."""
+    return (len(board[0]) * (CELL + PADDING) + PADDING,
+            len(board) * (CELL + PADDING) + PADDING)
+
+
+def rasterize(board: Board) -> Tuple[int, int, bytes]:
+    """(width, height, RGB pixels) for the board, laid out like `to_svg`."""
+    rows, cols = len(board), len(board[0])
+    width, height = image_size(board)
+    stride = width * 3
+    canvas = bytearray(BACKGROUND * (width * height))
+    insets = _corner_insets(CELL, RADIUS)
+
+    def span(x: int, y: int, w: int, color: bytes) -> None:
+        start = y * stride + x * 3
+        canvas[start:start + w * 3] = color * w
+
+    for r in range(rows):
+        for c in range(cols):
+            px = PADDING + c * (CELL + PADDING)
+            py = PADDING + r * (CELL + PADDING)
+            for dy, inset in enumerate(insets):
+                span(px + inset, py + dy, CELL - 2 * inset, TILE)
+
+            text = board[r][c]
+            glyphs = [FONT[ch] for ch in text if ch in FONT]
+            if not glyphs:
+                continue
+            # About the SVG's 70px letters, smaller for "Qu"
+            scale = 7 if len(glyphs) == 1 else 5
+            text_w = (len(glyphs) * (GLYPH_W + 1) - 1) * scale
+            gx = px + (CELL - text_w) // 2
+            gy = py + (CELL - GLYPH_H * scale) // 2
+            for glyph in glyphs:
+                for row, bits in enumerate(glyph):
+                    for col, bit in enumerate(bits):
+                        if bit != " ":
+                            for k in range(scale):
+                                span(gx + col * scale, gy + row * scale + k, scale, INK)
+                gx += (GLYPH_W + 1) * scale
+    return width, height, bytes(canvas)
+
+
+# --- protocol --------------------------------------------------------------------
+
+def transmit(image_id: int, width: int, height: int, rgb: bytes) -> str:
+    """Upload raw RGB pixels under `image_id` without displaying them."""
+    payload = base64.standard_b64encode(zlib.compress(rgb)).decode("ascii")
+    chunks = [payload[i:i + CHUNK] for i in range(0, len(payload), CHUNK)] or [""]
+    parts = []
+    for n, chunk in enumerate(chunks):
+        more = int(n < len(chunks) - 1)
+        # q=2: no replies, they would arrive on our stdin
+        keys = f"a=t,q=2,f=24,o=z,s={width},v={height},i={image_id},m={more}" if n == 0 else f"m={more}"
+        parts.append(f"{APC}{keys};{chunk}{ST}")
+    return "".join(parts)
+
+
+def place(image_id: int, col: int, row: int, cols: int, rows: int) -> str:
+    """Show an uploaded image scaled to cols x rows cells at (col, row), 0-based."""
+    # C=1 leaves the cursor where it was; the placement id makes a second
+    # placement of the same image replace the first
+    return f"{ESC}[{row + 1};{col + 1}H{APC}a=p,q=2,i={image_id},p=1,c={cols},r={rows},C=1{ST}"
+
+
+def hide(image_id: int) -> str:
+    """Remove the image's placements but keep its data for later."""
+    return f"{APC}a=d,q=2,d=i,i={image_id}{ST}"
+
+
+def delete(image_id: int) -> str:
+    """Remove the image's placements and free its data."""
+    return f"{APC}a=d,q=2,d=I,i={image_id}{ST}"
+
+
+class BoardImages:
+    """Uploads each distinct board once and re-places it from the terminal's copy."""
+
+    def __init__(self, out: TextIO = sys.stdout, capacity: int = CAPACITY):
+        self.out = out
+        self.capacity = capacity
+        self.ids: "OrderedDict[Tuple[Tuple[str, ...], ...], int]" = OrderedDict()
+        self.next_id = 1
+        self.shown: Optional[Tuple[int, Tuple[int, int, int, int]]] = None  # (id, placement)
+        self.bytes_written = 0
+        self.uploads = 0
+
+    def show(self, board: Board, col: int, row: int, cols: int, rows: int) -> int:
+        """Display `board` over the given cells; returns the number of characters written."""
+        key = tuple(tuple(line) for line in board)
+        placement = (col, row, cols, rows)
+        parts = []
+        image_id = self.ids.get(key)
+        if image_id is None:
+            image_id = self.next_id
+            self.next_id += 1
+            parts.append(transmit(image_id, *rasterize(board)))
+            self.uploads += 1
+            self.ids[key] = image_id
+            while len(self.ids) > self.capacity:
+                _, old = self.ids.popitem(last=False)
+                parts.append(delete(old))
+                if self.shown and self.shown[0] == old:
+                    self.shown = None
+        else:
+            self.ids.move_to_end(key)
+            if self.shown == (image_id, placement):
+                return 0
+        if self.shown and self.shown[0] != image_id:
+            parts.append(hide(self.shown[0]))
+        parts.append(place(image_id, *placement))
+        self.shown = (image_id, placement)
+        return self._write("".join(parts))
+
+    def clear(self) -> int:
+        """Take the board off the screen (it stays cached)."""
+        if self.shown is None:
+            return 0
+        data = hide(self.shown[0])
+        self.shown = None
+        return self._write(data)
+
+    def invalidate(self) -> None:
+        """The screen was cleared, which also removed our placement."""
+        self.shown = None
+
+    def close(self) -> None:
+        """Free every uploaded board."""
+        self._write("".join(delete(image_id) for image_id in self.ids.values()))
+        self.ids.clear()
+        self.shown = None
+
+    def _write(self, data: str) -> int:
+        if data:
+            self.out.write(data)
+            self.out.flush()
+            self.bytes_written += len(data)
+        return len(data)
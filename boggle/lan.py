@@ -0,0 +1,28 @@
+"""
+Which address phones on the same network should use to reach this machine.
+"""
+import os
+import socket
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def detect_lan_ip() -> str:
+    """
+    The IPv4 address of the interface that routes off-box.
+
+    Connecting a UDP socket sends nothing; it only asks the kernel to pick a
+    route, whose source address is the one other devices can reach. Falls
+    back to loopback on a machine with no network. BOGGLE_PUBLIC_HOST
+    overrides the guess (e.g. behind a hotspot or with several interfaces).
+    """
+    override = os.environ.get("BOGGLE_PUBLIC_HOST")
+    if override:
+        return override
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            # Any non-local address works; it is never contacted
+            s.connect(("10.254.254.254", 1))
+            return s.getsockname()[0]
+        except OSError:
+            return "127.0.0.1"
@@ -0,0 +1,356 @@
+"""
+Minimal QR code encoder (byte mode, versions 1-40), rendered to SVG.
+
+The join window used to pull its QR image from an online service. That
+blocked on an outbound fetch, and without internet it failed. This module
+builds the symbol in-process, following ISO/IEC 18004:
+- byte-mode data
+- Reed-Solomon error correction
+- the usual function patterns
+- the lowest-penalty of the eight masks
+
+`qr_svg` caches the SVG per text, so a join URL is encoded once per process.
+
+    svg = qr_svg("http://192.168.1.20:8080/controller")
+"""
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+Matrix = List[List[bool]]
+
+# Error correction level -> (index into the tables below, format bits)
+LEVELS = {"L": (0, 1), "M": (1, 0), "Q": (2, 3), "H": (3, 2)}
+
+# Per version (index 0 unused): EC codewords per block, and number of blocks
+ECC_CODEWORDS_PER_BLOCK = (
+    (-1, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28,
+     28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (-1, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26,
+     26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    (-1, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30,
+     28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (-1, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28,
+     30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+)
+NUM_ERROR_CORRECTION_BLOCKS = (
+    (-1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8,
+     8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    (-1, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16,
+     17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    (-1, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+     23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    (-1, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+     25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+)
+
+MASKS = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+# Modules of light margin required around the symbol
+QUIET_ZONE = 4
+
+
+# --- Reed-Solomon over GF(2^8) -------------------------------------------------
+
+def _gf_multiply(x: int, y: int) -> int:
+    z = 0
+    for i in reversed(range(8)):
+        z = (z << 1) ^ ((z >> 7) * 0x11D)
+        z ^= ((y >> i) & 1) * x
+    return z
+
+
+@lru_cache(maxsize=None)
+def _rs_divisor(degree: int) -> Tuple[int, ...]:
+    result = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = _gf_multiply(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = _gf_multiply(root, 0x02)
+    return tuple(result)
+
+
+def _rs_remainder(data: Sequence[int], divisor: Sequence[int]) -> List[int]:
+    result = [0] * len(divisor)
+    for byte in data:
+        factor = byte ^ result.pop(0)
+        result.append(0)
+        for i, coef in enumerate(divisor):
+            result[i] ^= _gf_multiply(coef, factor)
+    return result
+
+
+# --- capacity ------------------------------------------------------------------
+
+def _raw_data_modules(version: int) -> int:
+    """Modules left for data + EC after the function patterns."""
+    result = (16 * version + 128) * version + 64
+    if version >= 2:
+        align = version // 7 + 2
+        result -= (25 * align - 10) * align - 55
+        if version >= 7:
+            result -= 36
+    return result
+
+
+def _data_codewords(version: int, level: int) -> int:
+    return (_raw_data_modules(version) // 8
+            - ECC_CODEWORDS_PER_BLOCK[level][version] * NUM_ERROR_CORRECTION_BLOCKS[level][version])
+
+
+def _alignment_positions(version: int) -> List[int]:
+    if version == 1:
+        return []
+    size = version * 4 + 17
+    align = version // 7 + 2
+    step = (version * 8 + align * 3 + 5) // (align * 4 - 4) * 2
+    return [6] + sorted(size - 7 - i * step for i in range(align - 1))
+
+
+# --- encoding ------------------------------------------------------------------
+
+def _codewords(data: bytes, version: int, level: int) -> List[int]:
+    """Mode, length, data, terminator and padding, packed into bytes."""
+    bits: List[int] = []
+
+    def put(value: int, length: int) -> None:
+        bits.extend((value >> i) & 1 for i in reversed(range(length)))
+
+    put(0b0100, 4)  # byte mode
+    put(len(data), 8 if version < 10 else 16)
+    for byte in data:
+        put(byte, 8)
+    capacity = _data_codewords(version, level) * 8
+    put(0, min(4, capacity - len(bits)))
+    put(0, -len(bits) % 8)
+    words = [int("".join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits), 8)]
+    pad = 0xEC
+    while len(words) < capacity // 8:
+        words.append(pad)
+        pad ^= 0xEC ^ 0x11
+    return words
+
+
+def _interleave(data: List[int], version: int, level: int) -> List[int]:
+    """Split into blocks, append each block's EC codewords, interleave."""
+    num_blocks = NUM_ERROR_CORRECTION_BLOCKS[level][version]
+    ecc_len = ECC_CODEWORDS_PER_BLOCK[level][version]
+    raw = _raw_data_modules(version) // 8
+    num_short = num_blocks - raw % num_blocks
+    short_len = raw // num_blocks
+    divisor = _rs_divisor(ecc_len)
+    blocks = []
+    k = 0
+    for i in range(num_blocks):
+        block = data[k:k + short_len - ecc_len + (0 if i < num_short else 1)]
+        k += len(block)
+        ecc = _rs_remainder(block, divisor)
+        if i < num_short:
+            block = block + [0]  # placeholder so every block has the same length
+        blocks.append(block + ecc)
+    result = []
+    for i in range(len(blocks[0])):
+        for j, block in enumerate(blocks):
+            if i != short_len - ecc_len or j >= num_short:
+                result.append(block[i])
+    return result
+
+
+class _Symbol:
+    def __init__(self, version: int):
+        self.version = version
+        self.size = version * 4 + 17
+        self.modules: Matrix = [[False] * self.size for _ in range(self.size)]
+        self.function: Matrix = [[False] * self.size for _ in range(self.size)]
+
+    def set_function(self, x: int, y: int, dark: bool) -> None:
+        self.modules[y][x] = dark
+        self.function[y][x] = True
+
+    def draw_function_patterns(self, format_bits: int) -> None:
+        size = self.size
+        for i in range(size):
+            self.set_function(6, i, i % 2 == 0)
+            self.set_function(i, 6, i % 2 == 0)
+        for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+            for dy in range(-4, 5):
+                for dx in range(-4, 5):
+                    x, y = cx + dx, cy + dy
+                    if 0 <= x < size and 0 <= y < size:
+                        self.set_function(x, y, max(abs(dx), abs(dy)) not in (2, 4))
+        positions = _alignment_positions(self.version)
+        last = len(positions) - 1
+        for i, cx in enumerate(positions):
+            for j, cy in enumerate(positions):
+                if (i, j) in ((0, 0), (0, last), (last, 0)):
+                    continue  # those corners hold finder patterns
+                for dy in range(-2, 3):
+                    for dx in range(-2, 3):
+                        self.set_function(cx + dx, cy + dy, max(abs(dx), abs(dy)) != 1)
+        self.draw_format(format_bits)
+        if self.version >= 7:
+            rem = self.version
+            for _ in range(12):
+                rem = (rem << 1) ^ ((rem >> 11) * 0x1F25)
+            bits = self.version << 12 | rem
+            for i in range(18):
+                dark = (bits >> i) & 1 == 1
+                a, b = size - 11 + i % 3, i // 3
+                self.set_function(a, b, dark)
+                self.set_function(b, a, dark)
+
+    def draw_format(self, format_bits: int) -> None:
+        size = self.size
+        bits = [(format_bits >> i) & 1 == 1 for i in range(15)]
+        for i in range(6):
+            self.set_function(8, i, bits[i])
+        self.set_function(8, 7, bits[6])
+        self.set_function(8, 8, bits[7])
+        self.set_function(7, 8, bits[8])
+        for i in range(9, 15):
+            self.set_function(14 - i, 8, bits[i])
+        for i in range(8):
+            self.set_function(size - 1 - i, 8, bits[i])
+        for i in range(8, 15):
+            self.set_function(8, size - 15 + i, bits[i])
+        self.set_function(8, size - 8, True)  # always dark
+
+    def draw_codewords(self, data: List[int]) -> None:
+        size = self.size
+        i = 0
+        right = size - 1
+        while right >= 1:
+            if right == 6:
+                right = 5  # skip the vertical timing pattern
+            upward = ((right + 1) & 2) == 0
+            for vert in range(size):
+                y = size - 1 - vert if upward else vert
+                for x in (right, right - 1):
+                    if not self.function[y][x] and i < len(data) * 8:
+                        self.modules[y][x] = (data[i >> 3] >> (7 - (i & 7))) & 1 == 1
+                        i += 1
+            right -= 2
+
+    def masked(self, mask: int) -> Matrix:
+        test = MASKS[mask]
+        return [[dark ^ (not self.function[y][x] and test(x, y)) for x, dark in enumerate(row)]
+                for y, row in enumerate(self.modules)]
+
+
+def _format_bits(level_bits: int, mask: int) -> int:
+    data = level_bits << 3 | mask
+    rem = data
+    for _ in range(10):
+        rem = (rem << 1) ^ ((rem >> 9) * 0x537)
+    return (data << 10 | rem) ^ 0x5412
+
+
+FINDER_LIKE = [True, False, True, True, True, False, True]
+
+
+def _finder_like(line: List[bool]) -> int:
+    """1:1:3:1:1 patterns with four light modules (or the edge) on one side."""
+    count = 0
+    padded = [False] * 4 + line + [False] * 4
+    i = 4
+    while i <= len(padded) - 11:
+        if padded[i:i + 7] == FINDER_LIKE:
+            if not any(padded[i - 4:i]) or not any(padded[i + 7:i + 11]):
+                count += 1
+                i += 7
+                continue
+        i += 1
+    return count
+
+
+def _penalty(modules: Matrix) -> int:
+    size = len(modules)
+    score = 0
+    for line in modules + [list(col) for col in zip(*modules)]:
+        # Runs of five or more same-coloured modules
+        run = 1
+        for a, b in zip(line, line[1:]):
+            if a == b:
+                run += 1
+            else:
+                if run >= 5:
+                    score += run - 2
+                run = 1
+        if run >= 5:
+            score += run - 2
+        score += 40 * _finder_like(line)
+    # 2x2 blocks of one colour
+    for y in range(size - 1):
+        for x in range(size - 1):
+            c = modules[y][x]
+            if c == modules[y][x + 1] == modules[y + 1][x] == modules[y + 1][x + 1]:
+                score += 3
+    # Dark/light balance, 10 points per full 5% away from half
+    dark = sum(map(sum, modules))
+    score += 10 * (abs(dark * 200 - size * size * 100) // (size * size * 10))
+    return score
+
+
+def encode(text: str, level: str = "M", mask: Optional[int] = None) -> Matrix:
+    """The module matrix (True = dark) for `text`, smallest version that fits."""
+    index, level_bits = LEVELS[level]
+    data = text.encode("utf-8")
+    for version in range(1, 41):
+        header = 4 + (8 if version < 10 else 16)
+        if header + len(data) * 8 <= _data_codewords(version, index) * 8:
+            break
+    else:
+        raise ValueError(f"{len(data)} bytes is too long for a QR code")
+
+    symbol = _Symbol(version)
+    symbol.draw_function_patterns(_format_bits(level_bits, 0))
+    symbol.draw_codewords(_interleave(_codewords(data, version, index), version, index))
+
+    candidates = range(8) if mask is None else (mask,)
+    best: Optional[Matrix] = None
+    best_score = 0
+    for m in candidates:
+        symbol.draw_format(_format_bits(level_bits, m))
+        modules = symbol.masked(m)
+        score = _penalty(modules) if mask is None else 0
+        if best is None or score < best_score:
+            best, best_score = modules, score
+    assert best is not None
+    return best
+
+
+def to_svg(modules: Matrix, scale: int = 4, dark: str = "#000", light: str = "#fff") -> str:
+    """One <path> made of a rectangle per horizontal run of dark modules."""
+    size = len(modules) + 2 * QUIET_ZONE
+    parts = []
+    for y, row in enumerate(modules):
+        x = 0
+        while x < len(row):
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < len(row) and row[x]:
+                x += 1
+            parts.append(f"M{start + QUIET_ZONE} {y + QUIET_ZONE}h{x - start}v1h-{x - start}z")
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" '
+            f'width="{size * scale}" height="{size * scale}" shape-rendering="crispEdges">'
+            f'<rect width="{size}" height="{size}" fill="{light}"/>'
+            f'<path fill="{dark}" d="{"".join(parts)}"/></svg>')
+
+
+@lru_cache(maxsize=64)
+def qr_svg(text: str, scale: int = 4) -> str:
+    """SVG QR code for `text`, encoded once per process."""
+    return to_svg(encode(text), scale)
@@ -0,0 +1,157 @@
+"""
+Rooms: many independent Boggle tables in one server process.
+
+A RoomManager hosts BoggleGame instances keyed by a short room code. Round
+timers for every room share a single scheduler thread instead of relying on
+someone polling /state after the deadline.
+
+Idle lobbies are cheap: games are slotted objects, the board is only built
+when a round starts, and every game shares the same BoardGenerator word list.
+"""
+import heapq
+import itertools
+import secrets
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from game_state import BoggleGame
+
+# No I/O/0/1 lookalikes, codes are read off a TV across the room
+CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ"
+CODE_LENGTH = 4
+
+
+class InvalidRoomCode(ValueError):
+    """A requested room code that can't be used (wrong type, length or letters)."""
+
+
+def normalize_code(code: object, pinned: bool = False) -> str:
+    """
+    The canonical (upper-case) form of a requested room code. Codes players
+    pick must look like generated ones; pinned rooms, which the server names
+    itself (MAIN), only need to be plain letters and digits.
+    """
+    if not isinstance(code, str):
+        raise InvalidRoomCode("Room code must be a string")
+    code = code.upper()
+    if pinned:
+        if not (code.isascii() and code.isalnum()):
+            raise InvalidRoomCode(f"Invalid room code {code!r}")
+    elif len(code) != CODE_LENGTH or any(ch not in CODE_ALPHABET for ch in code):
+        raise InvalidRoomCode(f"Room codes are {CODE_LENGTH} letters from {CODE_ALPHABET}")
+    return code
+
+
+class RoundScheduler:
+    """One background thread firing callbacks at absolute (time.time) deadlines."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Callable[[], object]]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, deadline: float, callback: Callable[[], object]) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._counter), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rounds", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._heap)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, callback = self._heap[0]
+                delay = deadline - time.time()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception as e:
+                print(f"Scheduled callback failed: {e}")
+
+
+class Room:
+    __slots__ = ("code", "game", "last_active", "pinned")
+
+    def __init__(self, code: str, game: BoggleGame, pinned: bool = False):
+        self.code = code
+        self.game = game
+        self.last_active = time.monotonic()
+        self.pinned = pinned
+
+
+class RoomManager:
+    def __init__(self, scheduler: Optional[RoundScheduler] = None):
+        self.scheduler = scheduler or RoundScheduler()
+        self._rooms: Dict[str, Room] = {}
+        self._lock = threading.Lock()
+
+    def create(self, code: Optional[str] = None, pinned: bool = False) -> Tuple[str, BoggleGame]:
+        """
+        Create a room (random code unless given). Pinned rooms are never
+        reaped. Raises InvalidRoomCode for a malformed code and ValueError
+        if the room exists.
+        """
+        if code is not None:
+            code = normalize_code(code, pinned)
+        with self._lock:
+            if code is None:
+                code = self._new_code()
+            elif code in self._rooms:
+                raise ValueError(f"Room {code} already exists")
+            room = Room(code, BoggleGame(), pinned)
+            self._rooms[code] = room
+            return code, room.game
+
+    def get(self, code: str) -> Optional[BoggleGame]:
+        room = self._rooms.get(code.upper())
+        if room is None:
+            return None
+        room.last_active = time.monotonic()
+        return room.game
+
+    def remove(self, code: str) -> bool:
+        with self._lock:
+            return self._rooms.pop(code.upper(), None) is not None
+
+    def codes(self) -> List[str]:
+        return list(self._rooms)
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def start_round(self, game: BoggleGame) -> None:
+        """Start a round and have the shared scheduler close it at the deadline."""
+        game.start_game()
+        # get_time_remaining ends the round if it is due; stale timers are no-ops
+        self.scheduler.schedule(game.timer_end, game.get_time_remaining)
+
+    def reap_idle(self, max_idle: float) -> List[str]:
+        """Drop unpinned rooms untouched for `max_idle` seconds and not mid-round."""
+        cutoff = time.monotonic() - max_idle
+        with self._lock:
+            stale = [
+                code for code, room in self._rooms.items()
+                if not room.pinned and room.last_active < cutoff
+                and room.game.state != "PLAYING"
+            ]
+            for code in stale:
+                del self._rooms[code]
+        return stale
+
+    def _new_code(self) -> str:
+        while True:
+            code = "".join(secrets.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+            if code not in self._rooms:
+                return code
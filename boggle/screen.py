@@ -0,0 +1,161 @@
+"""
+Differential terminal renderer for the Boggle TUI windows.
+
+A frame is composed in memory (`begin`, `text`, `fill`), then `present`
+compares it with the frame currently on the terminal and emits only the
+cells that changed, as one buffered write: a cursor move where the changes
+jump, an SGR sequence only when the style changes, and nothing at all when
+the frame is identical. The write is wrapped in synchronized-output mode
+(DEC 2026, honoured by Ghostty/kitty and ignored elsewhere) so the terminal
+never shows a half-drawn frame.
+
+    screen = Screen()
+    with screen:
+        while True:
+            screen.begin()
+            screen.text(2, 1, "hello", BOLD)
+            screen.present()
+"""
+import shutil
+import sys
+import unicodedata
+from typing import List, Optional, TextIO, Tuple
+
+CSI = "\033["
+RESET = f"{CSI}0m"
+SYNC_BEGIN = f"{CSI}?2026h"
+SYNC_END = f"{CSI}?2026l"
+
+# Cell = (text, style). A wide character's second column holds WIDE_TAIL.
+Cell = Tuple[str, str]
+BLANK: Cell = (" ", "")
+WIDE_TAIL: Cell = ("", "")
+
+# Rewriting a few unchanged cells is cheaper than a cursor-move sequence
+MAX_SKIP = 4
+
+
+def char_width(ch: str) -> int:
+    if unicodedata.combining(ch):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+
+class Screen:
+    def __init__(self, out: TextIO = sys.stdout, size: Optional[Tuple[int, int]] = None):
+        self.out = out
+        self.fixed_size = size
+        self.width, self.height = size or self._terminal_size()
+        self.frame: List[List[Cell]] = self._blank()
+        self.shown: Optional[List[List[Cell]]] = None  # what the terminal has; None = unknown
+        self.bytes_written = 0
+
+    def _terminal_size(self) -> Tuple[int, int]:
+        size = shutil.get_terminal_size((80, 24))
+        return size.columns, size.lines
+
+    def _blank(self) -> List[List[Cell]]:
+        return [[BLANK] * self.width for _ in range(self.height)]
+
+    # --- session ---------------------------------------------------------------
+
+    def __enter__(self) -> "Screen":
+        self._write(f"{CSI}?25l{CSI}2J")
+        self.shown = self._blank()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._write(f"{RESET}{CSI}?25h")
+
+    # --- composing -------------------------------------------------------------
+
+    def begin(self) -> None:
+        """Start a new, empty frame (picking up terminal resizes)."""
+        if not self.fixed_size:
+            size = self._terminal_size()
+            if size != (self.width, self.height):
+                self.width, self.height = size
+                self.shown = None  # the terminal reflowed; repaint everything
+        self.frame = self._blank()
+
+    def text(self, x: int, y: int, text: str, style: str = "") -> int:
+        """Write `text` at column x, row y (0-based), clipped; returns the next column."""
+        if not 0 <= y < self.height:
+            return x
+        row = self.frame[y]
+        for ch in text:
+            width = char_width(ch)
+            if width == 0:
+                continue
+            if x + width > self.width:
+                break
+            if x >= 0:
+                row[x] = (ch, style)
+                if width == 2:
+                    row[x + 1] = WIDE_TAIL
+            x += width
+        return x
+
+    def centered(self, y: int, text: str, style: str = "") -> None:
+        width = sum(char_width(ch) for ch in text)
+        self.text(max(0, (self.width - width) // 2), y, text, style)
+
+    def fill(self, x: int, y: int, w: int, h: int, ch: str = " ", style: str = "") -> None:
+        for row in range(y, y + h):
+            self.text(x, row, ch * w, style)
+
+    # --- output ----------------------------------------------------------------
+
+    def render(self) -> str:
+        """Escape sequences turning the shown frame into the composed one."""
+        full = self.shown is None
+        parts: List[str] = []
+        cursor = None  # (x, y) where the terminal cursor is, if known
+        style = None
+        for y, row in enumerate(self.frame):
+            old = None if full else self.shown[y]
+            x = 0
+            while x < self.width:
+                cell = row[x]
+                if not full and cell == old[x] and not self._wide_changed(row, old, x):
+                    x += 1
+                    continue
+                if cell == WIDE_TAIL:
+                    x += 1
+                    continue
+                if cursor != (x, y):
+                    gap = x - cursor[0] if cursor and cursor[1] == y else -1
+                    if 0 < gap <= MAX_SKIP and all(row[i][1] == style and row[i] != WIDE_TAIL
+                                                   for i in range(cursor[0], x)):
+                        parts.extend(row[i][0] for i in range(cursor[0], x))
+                    else:
+                        parts.append(f"{CSI}{y + 1};{x + 1}H")
+                if cell[1] != style:
+                    parts.append(RESET + cell[1])
+                    style = cell[1]
+                parts.append(cell[0])
+                x += 2 if x + 1 < self.width and row[x + 1] == WIDE_TAIL else 1
+                cursor = (x, y)
+        if not parts:
+            return ""
+        if full:
+            parts.insert(0, f"{RESET}{CSI}2J")
+        return SYNC_BEGIN + "".join(parts) + RESET + SYNC_END
+
+    @staticmethod
+    def _wide_changed(row: List[Cell], old: List[Cell], x: int) -> bool:
+        # A narrow cell left over from a wide one (or vice versa) must be redrawn
+        return x + 1 < len(row) and (row[x + 1] == WIDE_TAIL) != (old[x + 1] == WIDE_TAIL)
+
+    def present(self) -> int:
+        """Send the changes in one write; returns the number of characters written."""
+        data = self.render()
+        self.shown = self.frame
+        if data:
+            self._write(data)
+        return len(data)
+
+    def _write(self, data: str) -> None:
+        self.out.write(data)
+        self.out.flush()
+        self.bytes_written += len(data)
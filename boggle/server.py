@@ -1,7 +1,14 @@
-from flask import Flask, jsonify, request, render_template_string
+from flask import Blueprint, Flask, Response, abort, g, jsonify, request
+from functools import lru_cache
+import hashlib
+import json
 import threading
 import time
 from game_state import BoggleGame
+from lan import detect_lan_ip
+from markupsafe import Markup
+from qr import qr_svg
+from rooms import InvalidRoomCode, RoomManager
 import logging
 
 # Disable flask startup banner
@@ -9,82 +16,109 @@ log = logging.getLogger('werkzeug')
 log.setLevel(logging.ERROR)
 
 app = Flask(__name__)
-game = BoggleGame()
+rooms = RoomManager()
+
+# The default table, served at the top-level routes (and as /room/MAIN)
+DEFAULT_ROOM = "MAIN"
+_, game = rooms.create(DEFAULT_ROOM, pinned=True)
 
 # Add some dummy players for demo
 game.add_player("MVB")
 game.add_player("Guest")
 
-@app.route('/state')
+# Idle lobbies are dropped after this long without a request
+ROOM_IDLE_TIMEOUT = 30 * 60
+# Event streams send a comment line this often so proxies keep them open
+EVENT_KEEPALIVE = 15
+
+# Every game route lives on this blueprint, registered twice: at the root for
+# the default table and under /room/<room> for every other one.
+bp = Blueprint('game', __name__)
+
+@bp.url_value_preprocessor
+def pull_room(endpoint, values):
+    code = values.pop('room', None) if values else None
+    g.room = code
+    g.game = rooms.get(code) if code else game
+    if g.game is None:
+        abort(404)
+
+@app.route('/rooms', methods=['GET'])
+def list_rooms():
+    rooms.reap_idle(ROOM_IDLE_TIMEOUT)
+    return jsonify({"rooms": rooms.codes()})
+
+@app.route('/rooms', methods=['POST'])
+def create_room():
+    rooms.reap_idle(ROOM_IDLE_TIMEOUT)
+    # The cluster router picks codes itself so it knows which worker owns them
+    data = request.get_json(silent=True) or {}
+    try:
+        code, _ = rooms.create(data.get("room"))
+    except InvalidRoomCode as e:
+        return jsonify({"error": str(e)}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 409
+    return jsonify({"room": code}), 201
+
+@bp.route('/state')
 def get_state():
-    # Trigger timer update side-effects
-    game.get_time_remaining() 
-    return jsonify(game.to_json())
+    # to_json also triggers the timer update side-effects
+    return jsonify(g.game.to_json())
+
+@bp.route('/time')
+def server_time():
+    """Clock-offset handshake: clients time the round trip around this (NTP-style)."""
+    return jsonify({"server_time": time.time()})
+
+@bp.route('/events')
+def events():
+    """Server-sent events: the full state whenever the game version changes."""
+    room_game = g.game
 
-@app.route('/start', methods=['POST'])
+    def stream():
+        version = -1
+        while True:
+            current = room_game.wait_for_change(version, timeout=EVENT_KEEPALIVE)
+            if current == version:
+                yield ": keepalive\n\n"
+                continue
+            version = current
+            yield f"id: {version}\ndata: {json.dumps(room_game.to_json())}\n\n"
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@bp.route('/start', methods=['POST'])
 def start_game():
-    game.start_game()
+    rooms.start_round(g.game)
     return jsonify({"status": "started"})
 
-@app.route('/reset', methods=['POST'])
+@bp.route('/reset', methods=['POST'])
 def reset_game():
-    game.state = "LOBBY"
-    game.players = {} # clear players?
-    game.add_player("MVB") # restore host
+    # The default table keeps its host; rooms start empty
+    g.game.reset(host="MVB" if g.room is None else None)
     return jsonify({"status": "reset"})
 
-@app.route('/join', methods=['POST'])
+@bp.route('/join', methods=['POST'])
 def join():
     data = request.json
     name = data.get('name')
     if name:
-        game.add_player(name)
+        g.game.add_player(name)
         return jsonify({"status": "joined", "name": name})
     return jsonify({"error": "no name"}), 400
 
 # Components Rendering (HTML for the windows)
+#
+# Templates are compiled once at import. Pages that never change for a given
+# table (join, controller) are rendered once to bytes and served with an ETag
+# and Cache-Control; the timer and leaderboard memoize their last outputs,
+# since every TV window asks for the same page several times a second.
 
-@app.route('/view/board')
-def view_board():
-    # Auto-refreshing HTML page wrapper around the SVG
-    html_head = """
-    <html>
-    <head>
-        <meta http-equiv="refresh" content="1">
-        <style>
-            body { 
-                background-color: #1e1e2e; 
-                margin: 0; 
-                display: flex; 
-                justify-content: center; 
-                align-items: center; 
-                height: 100vh; 
-                overflow: hidden; 
-            }
-            .waiting { font-family: sans-serif; font-size: 3rem; color: #89b4fa; font-weight: bold; }
-        </style>
-    </head>
-    <body>
-    """
-    
-    if game.state == 'PLAYING' or game.state == 'SCORING':
-        content = game.to_svg()
-    else:
-        content = """
-        <div class="waiting">
-            Waiting for Start...
-        </div>
-        """
-        
-    return html_head + content + "</body></html>"
-
-
-@app.route('/view/timer')
-def view_timer():
-    html = """
+TIMER_HTML = """
     <html>
     <head>
-        <meta http-equiv="refresh" content="0.5">
         <style>
             body { background-color: #1e1e2e; color: #fab387; font-family: monospace; display: flex; justify-content: center; align-items: center; height: 100vh; margin: 0; overflow: hidden; }
             .timer { font-size: 8rem; font-weight: bold; }
@@ -93,18 +127,63 @@ def view_timer():
     </head>
     <body>
         {% if state == 'PLAYING' %}
-            <div class="timer">{{ time }}</div>
+            <div id="timer" class="timer">{{ time }}</div>
         {% else %}
-            <div class="sc-state">{{ state }}</div>
+            <div id="timer" class="sc-state">{{ state }}</div>
         {% endif %}
+        <script>
+            // Counts down locally to the round's deadline. The server clock
+            // offset comes from a few /time pings (lowest round trip wins);
+            // /events only pushes when the game changes
+            const el = document.getElementById('timer');
+            let state = {{ state|tojson }}, timerEnd = {{ timer_end|tojson }};
+            let offset = 0, tick = null; // server clock - local clock, seconds
+
+            async function syncClock() {
+                let best = Infinity;
+                for (let i = 0; i < 5; i++) {
+                    const t0 = Date.now() / 1000;
+                    try {
+                        const res = await fetch('../time', { cache: 'no-store' });
+                        const serverTime = (await res.json()).server_time;
+                        const t1 = Date.now() / 1000;
+                        if (t1 - t0 < best) {
+                            best = t1 - t0;
+                            offset = serverTime - (t0 + t1) / 2;
+                        }
+                    } catch (e) { break; }
+                }
+                draw();
+            }
+
+            function draw() {
+                clearTimeout(tick);
+                if (state !== 'PLAYING') {
+                    el.className = 'sc-state';
+                    el.textContent = state;
+                    return;
+                }
+                const left = timerEnd - (Date.now() / 1000 + offset);
+                el.className = 'timer';
+                el.textContent = Math.max(0, Math.floor(left));
+                // Wake at the next whole second; the server ends the round
+                if (left > 0) tick = setTimeout(draw, ((left % 1) || 1) * 1000 + 5);
+            }
+
+            new EventSource('../events').onmessage = (e) => {
+                const s = JSON.parse(e.data);
+                const resync = s.state !== state;
+                state = s.state;
+                timerEnd = s.timer_end;
+                if (resync) syncClock(); else draw();
+            };
+            syncClock();
+        </script>
     </body>
     </html>
     """
-    return render_template_string(html, state=game.state, time=game.get_time_remaining())
 
-@app.route('/view/leaderboard')
-def view_leaderboard():
-    html = """
+LEADERBOARD_HTML = """
     <html>
     <head>
         <meta http-equiv="refresh" content="2">
@@ -128,11 +207,8 @@ def view_leaderboard():
     </body>
     </html>
     """
-    return render_template_string(html, players=game.players.values())
 
-@app.route('/view/join')
-def view_join():
-    html = """
+JOIN_HTML = """
     <html>
     <head>
         <style>
@@ -161,6 +237,7 @@ def view_join():
             h2 { margin: 0; font-size: 1.5rem; text-align: right; }
             p { margin: 5px 0 0 0; font-size: 1.2rem; color: #cdd6f4; font-family: monospace; }
             .code { background: white; padding: 10px; border-radius: 8px; line-height: 0; }
+            .code svg { width: 120px; height: 120px; }
             .text-block { text-align: right; }
         </style>
     </head>
@@ -168,32 +245,15 @@ def view_join():
         <div class="content">
             <div class="text-block">
                 <h2>JOIN GAME</h2>
-                <p>http://192.168.1.31:8080/controller</p>
-            </div>
-            <div class="code">
-                <!-- Placeholder for QR -->
-                <img src="https://api.qrserver.com/v1/create-qr-code/?size=120x120&data=http://192.168.1.31:8080/controller" />
+                <p>{{ url }}</p>
             </div>
+            <div class="code">{{ qr }}</div>
         </div>
     </body>
     </html>
     """
-    return render_template_string(html)
 
-@app.route('/submit', methods=['POST'])
-def submit_word():
-    data = request.json
-    name = data.get('name')
-    word = data.get('word')
-    if name and word:
-        success = game.submit_word(name, word)
-        return jsonify({"status": "submitted", "accepted": success, "word": word})
-    return jsonify({"error": "missing data"}), 400
-
-@app.route('/controller')
-def view_controller():
-    # Simple mobile controller
-    html = """
+CONTROLLER_HTML = """
     <html>
     <head>
         <meta name="viewport" content="width=device-width, initial-scale=1">
@@ -221,8 +281,8 @@ def view_controller():
 
         <div class="admin">
             <h3>Admin Controls</h3>
-            <button class="btn-start" onclick="fetch('/start', {method: 'POST'})">START GAME</button>
-            <button onclick="fetch('/reset', {method: 'POST'})">RESET</button>
+            <button class="btn-start" onclick="fetch('start', {method: 'POST'})">START GAME</button>
+            <button onclick="fetch('reset', {method: 'POST'})">RESET</button>
         </div>
 
         <script>
@@ -231,7 +291,7 @@ def view_controller():
                 myName = document.getElementById('pname').value;
                 if(!myName) return;
                 
-                fetch('/join', {
+                fetch('join', {
                     method: 'POST',
                     headers: {'Content-Type': 'application/json'},
                     body: JSON.stringify({name: myName})
@@ -248,7 +308,7 @@ def view_controller():
                 let w = document.getElementById('word').value;
                 if(!w) return;
                 
-                fetch('/submit', {
+                fetch('submit', {
                     method: 'POST',
                     headers: {'Content-Type': 'application/json'},
                     body: JSON.stringify({name: myName, word: w})
@@ -269,10 +329,174 @@ def view_controller():
     </body>
     </html>
     """
-    return render_template_string(html)
 
-def run_server():
-    app.run(host='0.0.0.0', port=8080, debug=False, use_reloader=False)
+BOARD_HEAD = """
+    <html>
+    <head>
+        <meta http-equiv="refresh" content="1">
+        <style>
+            body { 
+                background-color: #1e1e2e; 
+                margin: 0; 
+                display: flex; 
+                justify-content: center; 
+                align-items: center; 
+                height: 100vh; 
+                overflow: hidden; 
+            }
+            .waiting { font-family: sans-serif; font-size: 3rem; color: #89b4fa; font-weight: bold; }
+        </style>
+    </head>
+    <body>
+    """
+
+BOARD_WAITING = """
+        <div class="waiting">
+            Waiting for Start...
+        </div>
+        """
+
+TIMER_TEMPLATE = app.jinja_env.from_string(TIMER_HTML)
+LEADERBOARD_TEMPLATE = app.jinja_env.from_string(LEADERBOARD_HTML)
+JOIN_TEMPLATE = app.jinja_env.from_string(JOIN_HTML)
+CONTROLLER_TEMPLATE = app.jinja_env.from_string(CONTROLLER_HTML)
+
+# Static pages may be cached by the TV/phone browser for this long (seconds)
+STATIC_PAGE_MAX_AGE = 300
+
+class StaticPage:
+    """A page rendered once, with its ETag precomputed."""
+    __slots__ = ("body", "etag", "mimetype")
+
+    def __init__(self, html, mimetype="text/html"):
+        self.body = html.encode()
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.mimetype = mimetype
+
+    def response(self):
+        resp = Response(self.body, mimetype=self.mimetype)
+        resp.set_etag(self.etag)
+        resp.cache_control.public = True
+        resp.cache_control.max_age = STATIC_PAGE_MAX_AGE
+        # Answers If-None-Match with an empty 304
+        return resp.make_conditional(request)
+
+CONTROLLER_PAGE = StaticPage(CONTROLLER_TEMPLATE.render())
+
+# Port phones should connect to (run_server updates it)
+PUBLIC_PORT = 8080
+
+def join_url(prefix=""):
+    """The controller URL for players on the LAN (see lan.py)."""
+    return f"http://{detect_lan_ip()}:{PUBLIC_PORT}{prefix}/controller"
+
+# Keyed by URL: the QR code is encoded in-process once per room, no
+# outbound request, and the join window renders it inline
+@lru_cache(maxsize=256)
+def join_page(url):
+    return StaticPage(JOIN_TEMPLATE.render(url=url, qr=Markup(qr_svg(url))))
+
+@lru_cache(maxsize=256)
+def join_qr(url):
+    return StaticPage(qr_svg(url), mimetype="image/svg+xml")
+
+@lru_cache(maxsize=64)
+def timer_page(state, remaining, timer_end):
+    return TIMER_TEMPLATE.render(state=state, time=remaining, timer_end=timer_end)
+
+@lru_cache(maxsize=64)
+def leaderboard_page(players):
+    # players: ((name, score), ...) so the argument is hashable
+    return LEADERBOARD_TEMPLATE.render(players=[{"name": n, "score": sc} for n, sc in players])
+
+@bp.route('/view/board')
+def view_board():
+    # Auto-refreshing HTML page wrapper around the SVG
+    with g.game.lock:
+        showing = g.game.state == 'PLAYING' or g.game.state == 'SCORING'
+        svg = g.game.to_svg() if showing else ""
+
+    return BOARD_HEAD + (svg if showing else BOARD_WAITING) + "</body></html>"
+
+
+@bp.route('/view/timer')
+def view_timer():
+    # Loaded once per window; the page counts down and follows /events itself
+    state = g.game.to_json()
+    return timer_page(state["state"], state["time_remaining"], state["timer_end"])
+
+@bp.route('/view/leaderboard')
+def view_leaderboard():
+    # Render from a snapshot; iterating the live players dict races with /join
+    players = tuple(
+        (name, p["score"]) for name, p in g.game.to_json()["players"].items()
+    )
+    return leaderboard_page(players)
+
+@bp.route('/view/join')
+def view_join():
+    prefix = f"/room/{g.room}" if g.room else ""
+    return join_page(join_url(prefix)).response()
+
+@bp.route('/qr.svg')
+def join_qr_svg():
+    prefix = f"/room/{g.room}" if g.room else ""
+    return join_qr(join_url(prefix)).response()
+
+@bp.route('/submit', methods=['POST'])
+def submit_word():
+    data = request.json
+    name = data.get('name')
+    word = data.get('word')
+    if name and word:
+        success = g.game.submit_word(name, word)
+        return jsonify({"status": "submitted", "accepted": success, "word": word})
+    return jsonify({"error": "missing data"}), 400
+
+@bp.route('/controller')
+def view_controller():
+    # Simple mobile controller; relative fetch paths make it work for every room
+    return CONTROLLER_PAGE.response()
+
+app.register_blueprint(bp)
+app.register_blueprint(bp, url_prefix='/room/<room>', name='room')
+
+def run_server(mode="dev", host='0.0.0.0', port=8080, workers=64, uds=None):
+    """
+    Serve the game.
+    dev:  Werkzeug's threaded development server (fine for a couple of players).
+    asgi: uvicorn with keep-alive and a thread pool (see asgi.py), for parties.
+    `uds` listens on a Unix socket instead of host/port (used by cluster.py).
+    """
+    global PUBLIC_PORT
+    if not uds:
+        PUBLIC_PORT = port
+    if mode == "asgi":
+        try:
+            import uvicorn
+        except ImportError:
+            raise SystemExit("ASGI mode needs uvicorn: pip install 'hyprland-game-engine[server]'")
+        from asgi import WSGIBridge
+        uvicorn.run(
+            WSGIBridge(app, max_workers=workers),
+            host=host, port=port, uds=uds,
+            log_level="warning", access_log=False,
+            timeout_keep_alive=30,
+        )
+    else:
+        if uds:
+            host = f"unix://{uds}"
+        app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True)
 
 if __name__ == "__main__":
-    run_server()
+    import argparse
+    parser = argparse.ArgumentParser(description="Boggle game server")
+    parser.add_argument("--server", choices=["dev", "asgi"], default="dev",
+                        help="HTTP server to run the app under")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--uds", help="listen on this Unix socket instead")
+    parser.add_argument("--workers", type=int, default=64,
+                        help="handler threads in asgi mode")
+    args = parser.parse_args()
+    run_server(args.server, args.host, args.port, args.workers, args.uds)
@@ -1,9 +1,15 @@
+import json
+import signal
 import sys
+import threading
 import time
 import requests
 import os
 import math
 
+from screen import Screen
+import kitty
+
 # ANSI Colors & Control
 ESC = "\033"
 CSI = f"{ESC}["
@@ -25,188 +31,285 @@ HOME = f"{CSI}H"
 
 SERVER_URL = "http://127.0.0.1:8080"
 
-def get_state():
-    try:
-        r = requests.get(f"{SERVER_URL}/state", timeout=0.1)
-        if r.status_code == 200:
-            return r.json()
-    except:
-        pass
-    return None
-
-def draw_box(x, y, w, h, color=WHITE):
+# Round trips per clock sync; the fastest one gives the tightest estimate
+CLOCK_SAMPLES = 5
+
+class StateFeed:
+    """
+    Latest game state, pushed by the server's /events stream over one
+    persistent connection (reconnecting with backoff). Windows block in
+    `wait` and redraw only when something changed, instead of polling.
+    `offset` is the server clock minus ours, so round deadlines
+    (`timer_end`) can be counted down locally.
+    """
+    def __init__(self, url=SERVER_URL):
+        self.url = url
+        self.session = requests.Session()
+        self.cond = threading.Condition()
+        self.state = None # None while disconnected
+        self.version = 0 # bumped on every update (and on resize)
+        self.received_at = 0.0
+        self.offset = 0.0
+        threading.Thread(target=self._run, daemon=True).start()
+        # Terminal resizes need a repaint even if the game didn't change
+        if hasattr(signal, "SIGWINCH"):
+            signal.signal(signal.SIGWINCH, lambda signum, frame: self.poke())
+
+    def _run(self):
+        backoff = 0.5
+        while True:
+            try:
+                # Read timeout well past the server's keepalive comments
+                with self.session.get(f"{self.url}/events", stream=True, timeout=(2, 60)) as r:
+                    r.raise_for_status()
+                    backoff = 0.5
+                    self.sync_clock()
+                    data = []
+                    for line in r.iter_lines(chunk_size=None, decode_unicode=True):
+                        if line.startswith("data:"):
+                            data.append(line[5:].lstrip())
+                        elif not line and data:
+                            state = json.loads("\n".join(data))
+                            if self.state and state.get("state") != self.state.get("state"):
+                                # New round (or round over): re-measure the offset
+                                self.sync_clock()
+                            self._publish(state)
+                            data = []
+            except (requests.RequestException, ValueError):
+                pass
+            self._publish(None)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 5)
+
+    def sync_clock(self, samples=CLOCK_SAMPLES):
+        """NTP-style offset estimate from a few /time round trips."""
+        best = None
+        for _ in range(samples):
+            t0 = time.time()
+            try:
+                server_time = self.session.get(f"{self.url}/time", timeout=2).json()["server_time"]
+            except (requests.RequestException, ValueError, KeyError):
+                break
+            t1 = time.time()
+            if best is None or t1 - t0 < best:
+                best = t1 - t0
+                self.offset = server_time - (t0 + t1) / 2
+
+    def remaining(self, state):
+        """Seconds left in the round, counted against the server's clock."""
+        return state.get("timer_end", 0) - (time.time() + self.offset)
+
+    def _publish(self, state):
+        with self.cond:
+            if state is None and self.state is None:
+                return
+            self.state = state
+            self.received_at = time.monotonic()
+            self.version += 1
+            self.cond.notify_all()
+
+    def poke(self):
+        # Called from a signal handler: never block on the condition's lock
+        self.version += 1
+
+    def wait(self, version, timeout=None):
+        """Block until the feed moves past `version` (or timeout); returns (version, state)."""
+        with self.cond:
+            self.cond.wait_for(lambda: self.version != version, timeout)
+            return self.version, self.state
+
+# Every mode composes a whole frame into a Screen; only changed cells reach
+# the terminal, in one write (see screen.py)
+
+def draw_box(screen, x, y, w, h, color=WHITE):
     # Box drawing chars
     TL, TR, BL, BR = "┌", "┐", "└", "┘"
     H, V = "─", "│"
-    
-    # Draw Top
-    print(f"{CSI}{y};{x}H{color}{TL}{H*(w-2)}{TR}")
-    # Draw Sides
+    screen.text(x, y, f"{TL}{H*(w-2)}{TR}", color)
     for i in range(1, h-1):
-        print(f"{CSI}{y+i};{x}H{V}{' '*(w-2)}{V}")
-    # Draw Bottom
-    print(f"{CSI}{y+h-1};{x}H{BL}{H*(w-2)}{BR}{RESET}")
-
-def centered_text(y, text, width, color=WHITE):
-    x = max(1, (width - len(text)) // 2)
-    print(f"{CSI}{y};{x}H{color}{text}")
+        screen.text(x, y + i, V, color)
+        screen.text(x + w - 1, y + i, V, color)
+    screen.text(x, y + h - 1, f"{BL}{H*(w-2)}{BR}", color)
 
 def render_timer():
-    print(HIDE_CURSOR + CLEAR_SCREEN)
-    last_val = -1
-    
-    while True:
-        state = get_state()
-        if not state:
-            time.sleep(0.5)
-            continue
-            
-        remaining = state.get("time_remaining", 0)
-        game_state = state.get("state", "UNKNOWN")
-        
-        # Don't redraw if same second (save CPU)
-        if remaining == last_val and game_state == "PLAYING":
-            time.sleep(0.1)
-            continue
-        last_val = remaining
-            
-        mins = remaining // 60
-        secs = remaining % 60
-        time_str = f"{mins:02}:{secs:02}"
-        
-        # Color Logic
-        color = GREEN
-        if remaining < 60: color = YELLOW
-        if remaining < 10: color = RED
-        if game_state != "PLAYING": 
-            color = BLUE
-            time_str = game_state[:8] # Truncate if needed
-            
-        # Draw
-        print(HOME)
-        # Assuming width ~20 chars (font size 60 makes it fill screen)
-        # Just print big and centered
-        print(f"\n\n{color}{BOLD}   {time_str}{RESET}")
-        
-        time.sleep(0.1)
+    feed = StateFeed()
+    screen = Screen()
+    with screen:
+        version, state = 0, None
+        while True:
+            # The stream only pushes changes; the seconds tick down locally
+            # to the round's deadline, waking at each second boundary
+            timeout = None
+            if state and state.get("state") == "PLAYING":
+                timeout = max(0.05, feed.remaining(state) % 1 or 1)
+            version, state = feed.wait(version, timeout)
+            if not state:
+                screen.begin()
+                screen.text(3, 3, "--:--", BLUE)
+                screen.present()
+                continue
+
+            game_state = state.get("state", "UNKNOWN")
+            remaining = 0
+            if game_state == "PLAYING":
+                remaining = max(0, math.floor(feed.remaining(state)))
+
+            mins = remaining // 60
+            secs = remaining % 60
+            time_str = f"{mins:02}:{secs:02}"
+
+            # Color Logic
+            color = GREEN
+            if remaining < 60: color = YELLOW
+            if remaining < 10: color = RED
+            if game_state != "PLAYING":
+                color = BLUE
+                time_str = game_state[:8] # Truncate if needed
+
+            # Assuming width ~20 chars (font size 60 makes it fill screen)
+            # Just print big and centered; an unchanged second writes nothing
+            screen.begin()
+            screen.text(3, 3, time_str, color + BOLD)
+            screen.present()
 
 def render_leaderboard():
-    print(HIDE_CURSOR + CLEAR_SCREEN)
-    
-    while True:
-        state = get_state()
-        if not state:
-            time.sleep(1)
-            continue
-            
-        players = state.get("players", {})
-        
-        # Handle if players is a list (JSON array) instead of dict
-        if isinstance(players, list):
-            # If it's a list, assume it's already list of dicts or we can't sort by .items()
-            # We need to adapt based on what the server sends.
-            # If server sends [{name:..., score:...}, ...], then we just sort that.
-            # But the code expected {name: {score:...}, ...}
-            # Let's just print a warning and try to use it if it's iterable
-            sorted_players = []
-            # Fallback empty
-        else:
-            sorted_players = sorted(players.items(), key=lambda x: x[1]['score'], reverse=True)
-        
-        # Draw - Use Home to overwrite instead of clear
-        print(HOME)
-        print(f"{BOLD}{MAGENTA}   🏆 LEADERBOARD 🏆{RESET}")
-        print(f"{CSI}2K") # Clear line
-        print(f"{CSI}2K{YELLOW}{'RK':<4} {'NAME':<15} {'PTS':<5}{RESET}")
-        print(f"{CSI}2K" + "-" * 30)
-        
-        # Clear remaining lines from previous frame roughly
-        for _ in range(10): print(f"{CSI}2K") 
-        print(f"{CSI}5;1H") # Back to start of list
-        
-        for i, (name, pdata) in enumerate(sorted_players):
-            score = pdata['score']
-            color = CYAN if i == 0 else WHITE
-            print(f"{CSI}2K{color}{i+1:<4} {name:<15} {score:<5}{RESET}")
-            
-        time.sleep(1)
+    feed = StateFeed()
+    screen = Screen()
+    with screen:
+        version = 0
+        while True:
+            # The short timeout only re-checks for a resize (SIGWINCH bumps
+            # the version without notifying); nothing is drawn unless it moved
+            latest, state = feed.wait(version, timeout=1)
+            if latest == version or not state:
+                continue
+            version = latest
+
+            players = state.get("players", {})
+
+            # Handle if players is a list (JSON array) instead of dict
+            if isinstance(players, list):
+                # The server sends {name: {score:...}, ...}; anything else is
+                # not something we know how to rank
+                sorted_players = []
+            else:
+                sorted_players = sorted(players.items(), key=lambda x: x[1]['score'], reverse=True)
+
+            # Rows from a longer previous frame simply aren't in this one
+            screen.begin()
+            screen.text(3, 1, "🏆 LEADERBOARD 🏆", BOLD + MAGENTA)
+            screen.text(0, 3, f"{'RK':<4} {'NAME':<15} {'PTS':<5}", YELLOW)
+            screen.text(0, 4, "-" * 30)
+            for i, (name, pdata) in enumerate(sorted_players):
+                score = pdata['score']
+                color = CYAN if i == 0 else WHITE
+                screen.text(0, 5 + i, f"{i+1:<4} {name:<15} {score:<5}", color)
+            screen.present()
+
+def grid_lines(rows, cols, cell_w):
+    """Horizontal border lines for a rows x cols grid, top to bottom."""
+    def line(left, mid, right):
+        return left + ("─" * (cell_w-1) + mid) * (cols-1) + "─" * (cell_w-1) + right
+    lines = [line("├", "┼", "┤")] * (rows + 1)
+    lines[0] = line("┌", "┬", "┐")
+    lines[-1] = line("└", "┴", "┘")
+    return lines
 
 def render_board():
-    print(HIDE_CURSOR + CLEAR_SCREEN)
-    
-    while True:
-        state = get_state()
-        if not state or not state.get("board"):
-            time.sleep(0.5)
-            continue
-            
-        board = state.get("board", [])
-        
-        # RENDER GRID
-        # Assume 4x4 or similar
-        rows = len(board)
-        cols = len(board[0])
-        
-        # Dimensions
-        cell_w = 6
-        cell_h = 3
-        
-        # Offset
-        start_x = 4
-        start_y = 3
-        
-        print(HOME)
-        print(f"{BOLD}{YELLOW}   LEXIGRID BOGGLE{RESET}")
-        
-        # Simple loops for grid lines to avoid complex logic
-        # Top Border
-        # A bit hacky but fast: just redraw everything cleanly
-        
-        for r in range(rows):
-            y_pos = start_y + (r * cell_h)
-            
-            # Draw row contents
-            row_line = ""
-            for c in range(cols):
-                char = board[r][c]
-                # Dynamic color?
-                color = WHITE
-                if char == "Qu": char_disp = "Qu"
-                else: char_disp = f" {char} " if len(char)==1 else char
-                
-                # Draw cell box slightly better
-                # Using simple box chars for cells
-                
-                # We draw the content centered
-                print(f"{CSI}{y_pos+1};{start_x + c*cell_w + 2}H{BOLD}{color}{char_disp}{RESET}")
-
-        # Draw Grid Lines (Overlay)
-        # Horizontal
-        for r in range(rows + 1):
-            py = start_y + (r * cell_h)
-            line = "├" + ("─" * (cell_w-1) + "┼") * (cols-1) + "─" * (cell_w-1) + "┤"
-            if r == 0: line = "┌" + ("─" * (cell_w-1) + "┬") * (cols-1) + "─" * (cell_w-1) + "┐"
-            if r == rows: line = "└" + ("─" * (cell_w-1) + "┴") * (cols-1) + "─" * (cell_w-1) + "┘"
-            print(f"{CSI}{py};{start_x}H{BLUE}{line}{RESET}")
-            
-        # Vertical
-        for r in range(rows):
-             for c in range(cols + 1):
-                px = start_x + (c * cell_w)
-                # middle parts
+    if kitty.supported():
+        return render_board_image()
+    feed = StateFeed()
+    screen = Screen()
+    with screen:
+        version = 0
+        while True:
+            latest, state = feed.wait(version, timeout=1)
+            if latest == version or not state or not state.get("board"):
+                continue
+            version = latest
+
+            board = state.get("board", [])
+            rows = len(board)
+            cols = len(board[0])
+
+            # Dimensions
+            cell_w = 6
+            cell_h = 3
+
+            # Offset (0-based screen coordinates)
+            start_x = 3
+            start_y = 2
+
+            screen.begin()
+            screen.text(3, 0, "LEXIGRID BOGGLE", BOLD + YELLOW)
+
+            # Grid lines: horizontal borders, then the verticals between them
+            for r, line in enumerate(grid_lines(rows, cols, cell_w)):
+                screen.text(start_x, start_y + r * cell_h, line, BLUE)
+            for r in range(rows):
                 for k in range(1, cell_h):
-                    print(f"{CSI}{start_y + r*cell_h + k};{px}H{BLUE}│{RESET}")
+                    for c in range(cols + 1):
+                        screen.text(start_x + c * cell_w, start_y + r * cell_h + k, "│", BLUE)
+
+            # Letters centered in their cells
+            for r in range(rows):
+                for c in range(cols):
+                    char = board[r][c]
+                    char_disp = f" {char} " if len(char) == 1 else char
+                    screen.text(start_x + c * cell_w + 1, start_y + r * cell_h + 1,
+                                char_disp, BOLD + WHITE)
+
+            # Once the board stops changing this writes nothing
+            screen.present()
+
+def render_board_image():
+    """The board as an image (kitty graphics protocol), like the browser view."""
+    feed = StateFeed()
+    screen = Screen()
+    images = kitty.BoardImages(screen.out)
+    with screen:
+        version = 0
+        try:
+            while True:
+                latest, state = feed.wait(version, timeout=1)
+                if latest == version:
+                    continue
+                version = latest
+
+                screen.begin()
+                repaint = screen.shown is None
+                screen.text(3, 0, "LEXIGRID BOGGLE", BOLD + YELLOW)
+                # Same rule as /view/board: letters only while a round is on
+                showing = state and state.get("board") and state.get("state") in ("PLAYING", "SCORING")
+                if not showing:
+                    screen.text(3, 2, "Waiting for game..." if state else "Connecting...", BLUE)
+                screen.present()
+                if repaint:
+                    # A full repaint cleared the screen, and the image with it
+                    images.invalidate()
 
-        time.sleep(1)
+                if not showing:
+                    images.clear()
+                    continue
+                # Rasterised and uploaded once per board; a resize or a
+                # repeat only re-places the copy the terminal already has
+                board = state["board"]
+                cols, rows = kitty.fit(*kitty.image_size(board), max(1, screen.width - 6),
+                                       max(1, screen.height - 3), kitty.cell_pixels())
+                images.show(board, 3, 2, cols, rows)
+        finally:
+            images.close()
 
 def render_join():
-    print(HIDE_CURSOR + CLEAR_SCREEN)
-    while True:
-        print(HOME)
-        print(f"\n{BOLD}{GREEN}   JOIN GAME{RESET}")
-        print(f"\n   {BLUE}{SERVER_URL}/controller{RESET}")
-        print(f"\n   {YELLOW}Waiting for players...{RESET}")
-        time.sleep(2)
+    screen = Screen()
+    with screen:
+        while True:
+            screen.begin()
+            screen.text(3, 1, "JOIN GAME", BOLD + GREEN)
+            screen.text(3, 3, f"{SERVER_URL}/controller", BLUE)
+            screen.text(3, 5, "Waiting for players...", YELLOW)
+            screen.present()
+            time.sleep(2)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,25 @@
+import os
 from typing import List, Dict, Any, Optional
 from .core import Hyprctl
 from .window import WindowManager
 from .background import BackgroundManager
+from .events import WindowEvents
+from .browser import Browser
+from .animation import Animator
+from .input import InputBus, KEY_HANDLER, key_handler_window
 
 class HyprlandEngine:
     def __init__(self, target_workspace: int = 2):
         self.hyprctl = Hyprctl()
-        self.wm = WindowManager(self.hyprctl, target_workspace)
-        self.bg = BackgroundManager(self.hyprctl, target_workspace)
+        # Window-opened events replace sleep-and-poll when the socket is there
+        self.events = WindowEvents.connect(self.hyprctl.event_socket_path)
+        self.wm = WindowManager(self.hyprctl, target_workspace, self.events)
+        self.bg = BackgroundManager(self.hyprctl, target_workspace, self.events)
+        # One Chromium instance hosts every --app window the game opens
+        self.browser = Browser()
+        # Moves many windows at once, one batch per frame
+        self.animator = Animator(self.hyprctl)
+        self.input: Optional[InputBus] = None
         self.workspace = target_workspace
 
     def switch_to_workspace(self) -> None:
@@ -28,6 +40,20 @@ class HyprlandEngine:
             
         return self.wm.spawn(command, title_pattern, x, y, width, height, is_class=use_class)
 
+    def start_input(self, socket_path: Optional[str] = None) -> InputBus:
+        """The input bus (started on first use); games subscribe to it with InputClient."""
+        if self.input is None:
+            runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+            self.input = InputBus(socket_path or os.path.join(runtime_dir, f"game-input-{os.getpid()}.sock")).start()
+        return self.input
+
+    def spawn_key_handler(self, x: int, y: int, width: int, height: int) -> None:
+        """Open the KeyHandler window, which publishes every key typed into it on the bus."""
+        bus = self.start_input()
+        self.wm.spawn_batch([key_handler_window(bus.socket_path, x, y, width, height)])
+        # Keys only go to the focused window
+        self.hyprctl.dispatch(f"focuswindow title:^({KEY_HANDLER})$")
+
     def set_background(self, *args: Any, **kwargs: Any) -> None:
         return self.bg.set(*args, **kwargs)
 
@@ -51,8 +77,12 @@ class HyprlandEngine:
 
     def cleanup(self) -> None:
         print("Engine shutting down...")
+        self.animator.stop()
+        if self.input:
+            self.input.stop()
         self.bg.cleanup()
         self.wm.cleanup()
+        self.browser.shutdown()
 
     def clean_slate(self, patterns: List[str]) -> None:
         """
@@ -0,0 +1,240 @@
+"""
+Frame-paced window animation.
+
+`spawn_batch` places each window once. Games that move pieces around
+(Memory Match, Battleship) need many windows in motion at the same time,
+and one `movewindowpixel` round trip per window per frame would flood the
+control socket. `Animator` keeps a tween per window and, on each tick of a
+fixed-rate clock, interpolates every window's geometry and sends all the
+moves and resizes for that frame as one `[[BATCH]]`:
+
+    animator = Animator(engine.hyprctl, fps=60)
+    for address, (x, y) in targets.items():
+        animator.move(address, x, y, duration=0.4)
+    animator.wait()
+    print(animator.stats.format())
+
+Positions are computed from the clock, not from the frame count. When a
+tick runs late the frames it missed are dropped rather than queued, so the
+animation stays on schedule and never bursts to catch up. `stats` keeps the
+frame times for tuning.
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .core import Hyprctl
+
+Geometry = Tuple[int, int, int, int]  # x, y, width, height
+Easing = Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: float) -> float:
+    return 4 * t ** 3 if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+@dataclass
+class Tween:
+    start: Geometry
+    end: Geometry
+    began: float
+    duration: float
+    easing: Easing = ease_out_cubic
+
+    def at(self, now: float) -> Tuple[Geometry, bool]:
+        """Geometry at `now`, and whether the tween is finished."""
+        t = 1.0 if self.duration <= 0 else min(1.0, max(0.0, (now - self.began) / self.duration))
+        k = self.easing(t)
+        geometry = tuple(round(a + (b - a) * k) for a, b in zip(self.start, self.end))
+        return geometry, t >= 1.0  # type: ignore[return-value]
+
+
+class FrameStats:
+    """Frame times (tick work plus the IPC round trip) over the last `window` frames."""
+
+    def __init__(self, window: int = 240):
+        self.times: Deque[float] = deque(maxlen=window)
+        self.frames = 0
+        self.dropped = 0
+        self.commands = 0
+
+    def record(self, seconds: float, commands: int) -> None:
+        self.times.append(seconds)
+        self.frames += 1
+        self.commands += commands
+
+    def summary(self) -> Dict[str, float]:
+        times = sorted(self.times)
+        if not times:
+            return {"frames": self.frames, "dropped": self.dropped, "commands": self.commands,
+                    "mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "commands": self.commands,
+            "mean_ms": sum(times) / len(times) * 1000,
+            "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+            "max_ms": times[-1] * 1000,
+        }
+
+    def format(self) -> str:
+        s = self.summary()
+        return (f"{s['frames']} frames ({s['dropped']} dropped), {s['commands']} commands, "
+                f"frame time mean {s['mean_ms']:.2f}ms p95 {s['p95_ms']:.2f}ms max {s['max_ms']:.2f}ms")
+
+
+class Animator:
+    """Interpolates window geometry and sends one batch per frame at `fps`."""
+
+    def __init__(self, hyprctl: Hyprctl, fps: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.hyprctl = hyprctl
+        self.interval = 1.0 / fps
+        self.clock = clock
+        self.tweens: Dict[str, Tween] = {}
+        self.current: Dict[str, Geometry] = {}  # address -> geometry last sent
+        self.sending = 0  # frames computed but not yet acknowledged by Hyprland
+        self.stats = FrameStats()
+        self.cond = threading.Condition()
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+
+    # --- scheduling ------------------------------------------------------------------
+
+    def animate(self, address: str, to: Geometry, duration: float = 0.3,
+                start: Optional[Geometry] = None, easing: Easing = ease_out_cubic) -> None:
+        """Tween a window to `to`; from `start`, or from wherever it is right now."""
+        if start is None:
+            self._locate(address)
+        now = self.clock()
+        with self.cond:
+            if start is None:
+                start = self._position(address, now)
+            self.tweens[address] = Tween(tuple(start), tuple(to), now, duration, easing)  # type: ignore[arg-type]
+            self.cond.notify_all()
+        self._ensure_thread()
+
+    def move(self, address: str, x: int, y: int, duration: float = 0.3,
+             easing: Easing = ease_out_cubic) -> None:
+        """Tween a window's position, keeping its size."""
+        self._locate(address)
+        now = self.clock()
+        with self.cond:
+            _, _, width, height = self._position(address, now)
+        self.animate(address, (x, y, width, height), duration, easing=easing)
+
+    def cancel(self, address: str) -> None:
+        """Stop animating a window where it is (e.g. before closing it)."""
+        with self.cond:
+            self.tweens.pop(address, None)
+            self.current.pop(address, None)
+            self.cond.notify_all()
+
+    def _locate(self, address: str) -> None:
+        """Ask Hyprland where a window we know nothing about is."""
+        with self.cond:
+            if address in self.tweens or address in self.current:
+                return
+        # Outside the lock, so the frame thread keeps ticking through the round trip
+        for client in self.hyprctl.get_clients():
+            if client.get("address") == address:
+                (x, y), (w, h) = client["at"], client["size"]
+                with self.cond:
+                    self.current.setdefault(address, (x, y, w, h))
+                return
+        raise KeyError(f"no window {address}")
+
+    def _position(self, address: str, now: float) -> Geometry:
+        # In-flight tween first (a retarget starts from where the window is
+        # on screen), then what we last sent (or _locate found)
+        if address in self.tweens:
+            return self.tweens[address].at(now)[0]
+        if address in self.current:
+            return self.current[address]
+        raise KeyError(f"no window {address}")
+
+    # --- frames ----------------------------------------------------------------------
+
+    def tick(self, now: Optional[float] = None) -> int:
+        """Send one frame for every moving window; returns the number of commands."""
+        started = self.clock()
+        now = started if now is None else now
+        commands: List[str] = []
+        with self.cond:
+            for address, tween in list(self.tweens.items()):
+                geometry, done = tween.at(now)
+                if done:
+                    del self.tweens[address]
+                old = self.current.get(address)
+                if geometry == old:
+                    continue
+                x, y, width, height = geometry
+                if old is None or old[2:] != geometry[2:]:
+                    commands.append(f"dispatch resizewindowpixel exact {width} {height},address:{address}")
+                if old is None or old[:2] != geometry[:2]:
+                    commands.append(f"dispatch movewindowpixel exact {x} {y},address:{address}")
+                self.current[address] = geometry
+            self.sending += 1
+        try:
+            if commands:
+                self.hyprctl.batch(commands)
+        finally:
+            with self.cond:
+                self.sending -= 1
+                if not self.tweens and not self.sending:
+                    self.cond.notify_all()  # wake wait(): the last frame is on screen
+        self.stats.record(self.clock() - started, len(commands))
+        return len(commands)
+
+    def _ensure_thread(self) -> None:
+        with self.cond:
+            if self.running:
+                return
+            self.running = True
+            self.thread = threading.Thread(target=self._run, name="animator", daemon=True)
+            self.thread.start()
+
+    def _run(self) -> None:
+        deadline = self.clock()
+        while True:
+            with self.cond:
+                if not self.tweens:
+                    self.cond.wait_for(lambda: self.tweens or not self.running)
+                    # Idle time isn't lateness: restart the frame clock
+                    deadline = self.clock()
+                if not self.running:
+                    return
+            self.tick(deadline)
+            deadline += self.interval
+            now = self.clock()
+            if now > deadline:
+                # Fell behind: drop the frames we missed instead of sending
+                # them in a burst; the next one lands back on the schedule
+                missed = int((now - deadline) / self.interval) + 1
+                self.stats.dropped += missed
+                deadline += missed * self.interval
+            time.sleep(max(0.0, deadline - now))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every animation has finished and its last frame was sent."""
+        with self.cond:
+            return self.cond.wait_for(lambda: not self.tweens and not self.sending, timeout)
+
+    def stop(self) -> None:
+        with self.cond:
+            self.running = False
+            self.tweens.clear()
+            self.cond.notify_all()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1)
+        self.thread = None
@@ -2,11 +2,13 @@ import subprocess
 import time
 from typing import Optional, List, Dict, Any
 from .core import Hyprctl
+from .events import WindowEvents
 
 class BackgroundManager:
-    def __init__(self, hyprctl: Hyprctl, workspace: int = 2):
+    def __init__(self, hyprctl: Hyprctl, workspace: int = 2, events: Optional[WindowEvents] = None):
         self.hyprctl = hyprctl
         self.workspace = workspace
+        self.events = events
         self.process: Optional[subprocess.Popen] = None
         self.address: Optional[str] = None
 
@@ -78,14 +80,21 @@ class BackgroundManager:
             f"dispatch exec [{rules}] {cmd}"
         ]
         print(f"Batch Spawning Background: {batch_cmds}")
+        since = self.events.mark() if self.events else 0
         self.hyprctl.batch(batch_cmds)
         
-        time.sleep(0.5)
+        if self.events:
+            # Wait for Hyprland to announce the window instead of guessing
+            self.address = self.events.wait_for(
+                lambda w: bg_class in w['class'] and w['workspace'] == str(self.workspace),
+                since, timeout=3)
+        else:
+            time.sleep(0.5)
         
         # Find it
         # We might need to retry finding it if it spawns slowly
         clients: List[Dict[str, Any]] = []
-        for attempt in range(10):
+        for attempt in range(0 if self.address else 10):
             clients = self.hyprctl.get_clients()
             for client in clients:
                 if bg_class in client.get('class', ''):
@@ -0,0 +1,162 @@
+"""
+One shared Chromium for every `--app` window.
+
+Each `chromium --app=URL` used to come up as its own browser: a browser
+process, GPU process, zygotes and a renderer per window, all started from
+scratch. `Browser` points every app window at one dedicated profile
+(`--user-data-dir`). The first launch becomes the browser; later launches
+find it through Chromium's process singleton, hand it the URL and exit, so
+an extra window costs one renderer instead of a whole process tree, and
+opens in a fraction of the time.
+
+    browser = Browser()
+    engine.spawn_batch([browser.app_window("http://127.0.0.1:8080/view/board",
+                                           74, 20, 1000, 1000)])
+    browser.close("http://127.0.0.1:8080/view/board")
+    browser.shutdown()
+
+Windows are still found by class: Chromium names an app window's class
+after the URL and profile (`chrome-127.0.0.1__view_board-Default`), which a
+separate user-data-dir doesn't change. The browser also listens for
+DevTools on a random local port, which is how windows are listed and closed
+without going through the compositor.
+"""
+import json
+import os
+import shlex
+import shutil
+import signal
+import socket
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, List, Optional, Sequence
+
+BINARIES = ("chromium", "chromium-browser", "google-chrome-stable", "google-chrome")
+
+# Keep the shared instance quiet: no first-run pages, no keyring prompt
+FLAGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--password-store=basic",
+    # Port 0: Chromium picks one and writes it to DevToolsActivePort
+    "--remote-debugging-port=0",
+)
+
+
+def default_profile() -> str:
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache, "hyprland-game-engine", "chromium")
+
+
+def app_class(url: str, profile: str = "Default") -> str:
+    """The window class Chromium gives an `--app=URL` window."""
+    parts = urllib.parse.urlsplit(url)
+    # The port is dropped; every "/" in the path becomes "_"
+    return f"chrome-{parts.hostname}_{parts.path.replace('/', '_')}-{profile}"
+
+
+class Browser:
+    """A dedicated Chromium profile whose single instance hosts all app windows."""
+
+    def __init__(self, profile_dir: Optional[str] = None, binary: Optional[str] = None,
+                 flags: Sequence[str] = ()):
+        self.profile_dir = profile_dir or default_profile()
+        self.binary = binary or os.environ.get("CHROMIUM") or next(
+            (name for name in BINARIES if shutil.which(name)), BINARIES[0])
+        self.flags = list(FLAGS) + list(flags)
+
+    def argv(self, url: str) -> List[str]:
+        # Only the launch that starts the instance uses the flags; the
+        # others just forward --app to it
+        return [self.binary, f"--user-data-dir={self.profile_dir}", *self.flags, f"--app={url}"]
+
+    def command(self, url: str) -> str:
+        """Shell command for `hyprctl dispatch exec`."""
+        return " ".join(shlex.quote(arg) for arg in self.argv(url))
+
+    def app_window(self, url: str, x: int, y: int, width: int, height: int) -> Dict[str, Any]:
+        """A `spawn_batch` entry that opens `url` in the shared instance."""
+        return {
+            "command": self.command(url),
+            "name_pattern": app_class(url),
+            "x": x, "y": y,
+            "width": width, "height": height,
+            "is_class": True,
+        }
+
+    # --- the running instance --------------------------------------------------------
+
+    def pid(self) -> Optional[int]:
+        """PID of the running instance, from the profile's singleton lock."""
+        try:
+            # A symlink to "HOSTNAME-PID"
+            target = os.readlink(os.path.join(self.profile_dir, "SingletonLock"))
+            host, _, pid_text = target.rpartition("-")
+            pid = int(pid_text)
+        except (OSError, ValueError):
+            return None
+        # A lock left by a crash (or from another machine sharing the home
+        # directory) can name a PID that now belongs to something else
+        if host != socket.gethostname() or not self._owns(pid):
+            return None
+        return pid
+
+    def _owns(self, pid: int) -> bool:
+        """Whether `pid` is a browser started on this profile."""
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                argv = f.read().decode("utf-8", "replace").split("\0")
+        except OSError:
+            return False
+        return f"--user-data-dir={self.profile_dir}" in argv
+
+    def running(self) -> bool:
+        return self.pid() is not None
+
+    def devtools_port(self) -> Optional[int]:
+        try:
+            with open(os.path.join(self.profile_dir, "DevToolsActivePort")) as f:
+                return int(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    def _devtools(self, path: str, timeout: float = 1.0) -> Any:
+        port = self.devtools_port()
+        if port is None:
+            raise ConnectionError("browser is not running")
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=timeout) as response:
+            body = response.read()
+        try:
+            return json.loads(body)
+        except ValueError:
+            return body.decode("utf-8", "replace")
+
+    def pages(self) -> List[Dict[str, Any]]:
+        """The instance's open pages (id, url, title), or [] when it isn't running."""
+        try:
+            targets = self._devtools("/json/list")
+        except OSError:
+            return []
+        return [t for t in targets if t.get("type") == "page"]
+
+    def close(self, url: str) -> int:
+        """Close every window showing `url`; returns how many were closed."""
+        closed = 0
+        for page in self.pages():
+            if page.get("url", "").rstrip("/") != url.rstrip("/"):
+                continue
+            try:
+                self._devtools(f"/json/close/{page['id']}")
+                closed += 1
+            except OSError:
+                pass
+        return closed
+
+    def shutdown(self) -> None:
+        """Stop the shared instance (it also exits by itself with its last window)."""
+        pid = self.pid()
+        if pid is not None:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
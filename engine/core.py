@@ -23,6 +23,11 @@ class Hyprctl:
         # Fallback to /tmp/hypr (legacy)
         self.socket_path = f"/tmp/hypr/{self.signature}/.socket.sock"
         
+    @property
+    def event_socket_path(self) -> str:
+        """Hyprland's event stream (socket2) next to the control socket."""
+        return os.path.join(os.path.dirname(self.socket_path), ".socket2.sock")
+
     def _send(self, command: str) -> str:
         """Send a raw command to the Hyprland socket."""
         try:
@@ -0,0 +1,98 @@
+import socket
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+# One window as seen on the event socket
+Window = Dict[str, str]  # address ("0x..."), class, title, workspace (name)
+
+
+class WindowEvents:
+    """
+    Follows Hyprland's event socket (.socket2.sock) and keeps the windows it
+    announces, so callers can wait for "this window appeared" instead of
+    sleeping and polling `clients`.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.cond = threading.Condition()
+        self.windows: Dict[str, Window] = {}
+        self.changed: Dict[str, int] = {}  # address -> seq of its last event
+        self.seq = 0
+        self.alive = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    @classmethod
+    def connect(cls, socket_path: str) -> Optional["WindowEvents"]:
+        """A listener on `socket_path`, or None if Hyprland isn't reachable there."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            sock.close()
+            return None
+        return cls(sock)
+
+    def _run(self) -> None:
+        try:
+            with self.sock as sock:
+                buffer = b""
+                while True:
+                    data = sock.recv(65536)
+                    if not data:
+                        break
+                    buffer += data
+                    *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        self._handle(line.decode("utf-8", "replace"))
+        except OSError:
+            pass
+        with self.cond:
+            self.alive = False
+            self.cond.notify_all()
+
+    def _handle(self, line: str) -> None:
+        event, _, data = line.partition(">>")
+        with self.cond:
+            if event == "openwindow":
+                # ADDRESS,WORKSPACE,CLASS,TITLE (the title may contain commas)
+                address, workspace, cls, title = (data.split(",", 3) + ["", "", ""])[:4]
+                address = "0x" + address
+                self.windows[address] = {"address": address, "workspace": workspace,
+                                         "class": cls, "title": title}
+            elif event == "windowtitlev2":
+                address, _, title = data.partition(",")
+                address = "0x" + address
+                if address not in self.windows:
+                    return
+                self.windows[address]["title"] = title
+            elif event == "closewindow":
+                self.windows.pop("0x" + data, None)
+                self.changed.pop("0x" + data, None)
+                return
+            else:
+                return
+            self.seq += 1
+            self.changed[address] = self.seq
+            self.cond.notify_all()
+
+    def mark(self) -> int:
+        """Call before spawning; pass to `wait_for` to only see later windows."""
+        with self.cond:
+            return self.seq
+
+    def wait_for(self, match: Callable[[Window], bool], since: int = 0, timeout: float = 5.0,
+                 exclude: Iterable[str] = ()) -> Optional[str]:
+        """Address of the first window (opened or retitled after `since`) that matches."""
+        skip = set(exclude)
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            while True:
+                for address, seq in self.changed.items():
+                    if seq > since and address not in skip and match(self.windows[address]):
+                        return address
+                left = deadline - time.monotonic()
+                if left <= 0 or not self.alive:
+                    return None
+                self.cond.wait(left)
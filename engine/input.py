@@ -0,0 +1,327 @@
+"""
+Centralised input for game windows.
+
+Keystrokes typed into the game's terminals used to go nowhere; games only
+heard from players through HTTP or SocketIO. Here a small "KeyHandler"
+window (a focused terminal running `capture`) reads raw keys and publishes
+them on a local pub/sub bus, and any game process can subscribe:
+
+    bus = InputBus(socket_path).start()          # in the orchestrator
+    engine.spawn_batch([key_handler_window(socket_path, 0, 0, 200, 80)])
+
+    with InputClient.connect(socket_path, topics=["key"]) as client:
+        for event in client:                     # {"topic": "key", "key": "up", "t": ...}
+            ...
+
+The bus is a Unix SOCK_SEQPACKET socket (one JSON event per datagram, so no
+framing), fanned out by a single selector thread: delivery is a couple of
+syscalls with no HTTP in the path (scripts/bench_input.py measures it). Every
+connection can publish; subscribing picks the topics it receives. A
+subscriber that stops reading loses events instead of stalling the others.
+
+    python engine/input.py serve --socket /run/user/1000/game-input.sock
+    python engine/input.py capture --socket /run/user/1000/game-input.sock
+    python engine/input.py listen --socket /run/user/1000/game-input.sock
+"""
+import json
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+MAX_EVENT = 64 * 1024
+
+# Title the capture window runs under; spawn_batch skips its animation
+KEY_HANDLER = "KeyHandler"
+
+# Escape sequences a terminal sends for special keys
+SEQUENCES = {
+    b"\x1b[A": "up", b"\x1b[B": "down", b"\x1b[C": "right", b"\x1b[D": "left",
+    b"\x1bOA": "up", b"\x1bOB": "down", b"\x1bOC": "right", b"\x1bOD": "left",
+    b"\x1b[H": "home", b"\x1b[F": "end", b"\x1bOH": "home", b"\x1bOF": "end",
+    b"\x1b[2~": "insert", b"\x1b[3~": "delete", b"\x1b[5~": "pageup", b"\x1b[6~": "pagedown",
+    b"\x1bOP": "f1", b"\x1bOQ": "f2", b"\x1bOR": "f3", b"\x1bOS": "f4",
+}
+SINGLE = {b"\r": "enter", b"\n": "enter", b"\t": "tab", b" ": "space",
+          b"\x7f": "backspace", b"\x08": "backspace", b"\x1b": "escape"}
+
+
+def decode_keys(data: bytes) -> List[str]:
+    """Key names for a chunk of raw terminal input."""
+    keys = []
+    i = 0
+    while i < len(data):
+        if data[i:i + 1] == b"\x1b" and i + 1 < len(data):
+            for seq, name in SEQUENCES.items():
+                if data.startswith(seq, i):
+                    keys.append(name)
+                    i += len(seq)
+                    break
+            else:
+                # Unknown sequence: skip to its final byte; Alt+key is ESC key
+                if data[i + 1:i + 2] in (b"[", b"O"):
+                    j = i + 2
+                    while j < len(data) and not 0x40 <= data[j] <= 0x7e:
+                        j += 1
+                    i = j + 1
+                else:
+                    keys.append("escape")
+                    i += 1
+            continue
+        byte = data[i:i + 1]
+        if byte in SINGLE:
+            keys.append(SINGLE[byte])
+            i += 1
+        elif data[i] < 0x20:
+            keys.append("ctrl+" + chr(data[i] + 0x60))
+            i += 1
+        else:
+            # One (possibly multi-byte) character
+            n = 1
+            while i + n < len(data) and 0x80 <= data[i + n] < 0xc0:
+                n += 1
+            keys.append(data[i:i + n].decode("utf-8", "replace"))
+            i += n
+    return keys
+
+
+# --- bus -------------------------------------------------------------------------
+
+class InputBus:
+    """Fans events out to subscribers over a Unix socket, on one thread."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.listener: Optional[socket.socket] = None
+        self.topics: Dict[socket.socket, Optional[Set[str]]] = {}  # None = not subscribed
+        self.published = 0
+        self.dropped = 0
+        self._wake_r, self._wake_w = socket.socketpair()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> "InputBus":
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.listener.bind(self.socket_path)
+        self.listener.listen(64)
+        self.thread = threading.Thread(target=self.serve, name="input-bus", daemon=True)
+        self.thread.start()
+        return self
+
+    def serve(self) -> None:
+        sel = selectors.DefaultSelector()
+        sel.register(self.listener, selectors.EVENT_READ, "accept")
+        sel.register(self._wake_r, selectors.EVENT_READ, "stop")
+        try:
+            while True:
+                for key, _ in sel.select():
+                    if key.data == "stop":
+                        return
+                    if key.data == "accept":
+                        conn, _ = self.listener.accept()
+                        conn.setblocking(False)
+                        self.topics[conn] = None
+                        sel.register(conn, selectors.EVENT_READ, "client")
+                    else:
+                        self._read(key.fileobj, sel)
+        finally:
+            for conn in list(self.topics):
+                conn.close()
+            self.topics.clear()
+            sel.close()
+            self.listener.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _read(self, conn: socket.socket, sel: selectors.BaseSelector) -> None:
+        try:
+            data = conn.recv(MAX_EVENT)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            sel.unregister(conn)
+            self.topics.pop(conn, None)
+            conn.close()
+            return
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return
+        if not isinstance(message, dict):
+            return
+        if "subscribe" in message:
+            topics = message["subscribe"]
+            if not (isinstance(topics, list) and all(isinstance(t, str) for t in topics)):
+                return
+            self.topics[conn] = set(topics) or {"*"}
+            # Acknowledged, so the subscriber knows nothing after this is missed
+            try:
+                conn.send(json.dumps({"subscribed": sorted(self.topics[conn])}).encode())
+            except OSError:
+                pass
+            return
+        topic = message.get("topic")
+        if topic is not None and not isinstance(topic, str):
+            return
+        self.publish(data, topic, sender=conn)
+
+    def publish(self, data: bytes, topic: Optional[str], sender: Optional[socket.socket] = None) -> None:
+        self.published += 1
+        for conn, topics in self.topics.items():
+            if conn is sender or topics is None or (topic not in topics and "*" not in topics):
+                continue
+            try:
+                conn.send(data)
+            except OSError:
+                # Its queue is full (or it's going away): skip it, don't wait
+                self.dropped += 1
+
+    def stop(self) -> None:
+        if self.thread is None:
+            return
+        self._wake_w.send(b"x")
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout=1)
+        self.thread = None
+
+
+# --- clients ---------------------------------------------------------------------
+
+class InputClient:
+    """One connection to the bus; publishes, and receives what it subscribed to."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+
+    @classmethod
+    def connect(cls, socket_path: str, topics: Optional[Sequence[str]] = None) -> "InputClient":
+        """Connect; with `topics` also subscribe (an empty list means every topic)."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            sock.close()
+            raise
+        client = cls(sock)
+        if topics is not None:
+            client.subscribe(topics)
+        return client
+
+    def subscribe(self, topics: Sequence[str], timeout: float = 5.0) -> None:
+        """Receive events for `topics` from now on (an empty list means every topic)."""
+        self.sock.send(json.dumps({"subscribe": list(topics)}).encode())
+        reply = self.recv(timeout)
+        if not reply or "subscribed" not in reply:
+            raise ConnectionError("input bus did not acknowledge the subscription")
+
+    def publish(self, topic: str, **fields: Any) -> None:
+        event = {"topic": topic, "t": time.time(), **fields}
+        self.sock.send(json.dumps(event, separators=(",", ":")).encode())
+
+    def recv(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """The next event, or None on timeout or when the bus goes away."""
+        self.sock.settimeout(timeout)
+        try:
+            data = self.sock.recv(MAX_EVENT)
+        except socket.timeout:
+            return None
+        return json.loads(data) if data else None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            event = self.recv()
+            if event is None:
+                return
+            yield event
+
+    def close(self) -> None:
+        self.sock.close()
+
+    def __enter__(self) -> "InputClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def key_handler_window(socket_path: str, x: int, y: int, width: int, height: int,
+                       python: str = sys.executable) -> Dict[str, Any]:
+    """A `spawn_batch` entry for the terminal that captures keys onto the bus."""
+    script = os.path.abspath(__file__)
+    return {
+        "command": f"ghostty --title={KEY_HANDLER} -e {python} -S {script} capture --socket {socket_path}",
+        "name_pattern": KEY_HANDLER,
+        "x": x, "y": y,
+        "width": width, "height": height,
+    }
+
+
+# --- capture ---------------------------------------------------------------------
+
+def capture(socket_path: str, fd: int = 0, retry: float = 0.5) -> None:
+    """Publish every key typed on `fd` (a terminal) as a "key" event."""
+    import termios
+    import tty
+    client = None
+    while client is None:
+        # The bus may come up after the window does
+        try:
+            client = InputClient.connect(socket_path)
+        except OSError:
+            time.sleep(retry)
+    saved = termios.tcgetattr(fd)
+    out = sys.stdout
+    try:
+        # Raw: every key (Ctrl+C included) arrives as bytes, unechoed
+        tty.setraw(fd)
+        out.write(f"\033[?25l\033[2J\033[H{KEY_HANDLER}: ready\r\n")
+        out.flush()
+        while True:
+            data = os.read(fd, 1024)
+            if not data:
+                break
+            for key in decode_keys(data):
+                client.publish("key", key=key)
+                out.write(f"\033[2;1H\033[K{key}")
+            out.flush()
+    except OSError:
+        pass  # the terminal went away
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+        out.write("\033[?25h")
+        out.flush()
+        client.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+    parser = argparse.ArgumentParser(description="Input bus for game windows")
+    parser.add_argument("command", choices=["serve", "capture", "listen"])
+    parser.add_argument("--socket", required=True)
+    parser.add_argument("--topic", action="append", default=[], help="listen: topics (default all)")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        bus = InputBus(args.socket).start()
+        try:
+            while bus.thread and bus.thread.is_alive():
+                bus.thread.join(1)
+        except KeyboardInterrupt:
+            bus.stop()
+    elif args.command == "capture":
+        capture(args.socket)
+    else:
+        with InputClient.connect(args.socket, topics=args.topic) as client:
+            for event in client:
+                latency = (time.time() - event.get("t", time.time())) * 1000
+                print(f"{event}  ({latency:.3f}ms)", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Dependency-graph bring-up for a game session.
+
+A launch is a handful of steps with a few real dependencies: the windows
+need the server, the background needs a clean workspace, and so on. Running
+them strictly in sequence with sleeps in between is slow and still racy.
+`Session` runs each step as soon as its dependencies are *ready*, on its
+own thread. A step is ready when its function has returned and its probe
+(if any) has passed: an HTTP health check, a socket accepting connections,
+a window announced by Hyprland. No fixed sleeps are involved.
+
+    session = Session()
+    session.step("server", start_server, probe=http_probe("http://127.0.0.1:8080/state"))
+    session.step("clean", clean_slate)
+    session.step("windows", spawn_windows, after=["server", "clean"])
+    report = session.run()
+    print(report.format())
+
+The report has each step's start, run and probe times relative to launch,
+and the critical path: the chain of dependencies that decided how long the
+launch took.
+"""
+import socket
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+Probe = Callable[[], bool]
+
+
+def wait_until(probe: Probe, timeout: float, interval: float = 0.02) -> bool:
+    """Poll `probe` until it returns truthy or `timeout` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if probe():
+                return True
+        except Exception:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def http_probe(url: str, timeout: float = 0.5) -> Probe:
+    """Ready when `url` answers with a 2xx."""
+    def probe() -> bool:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return 200 <= response.status < 300
+    return probe
+
+
+def socket_probe(host: str, port: int, timeout: float = 0.2) -> Probe:
+    """Ready when a TCP connection to host:port succeeds."""
+    def probe() -> bool:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    return probe
+
+
+class SessionError(RuntimeError):
+    def __init__(self, message: str, report: Optional["Report"] = None):
+        super().__init__(message)
+        self.report = report
+
+
+@dataclass
+class Step:
+    name: str
+    run: Callable[[], Any]
+    after: List[str] = field(default_factory=list)
+    probe: Optional[Probe] = None
+    timeout: float = 10.0  # for the probe
+    required: bool = True
+
+    # Filled in by Session.run, seconds since launch
+    started: float = 0.0
+    returned: float = 0.0
+    ready: float = 0.0
+    result: Any = None
+    error: Optional[BaseException] = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+class Report:
+    def __init__(self, steps: List[Step], total: float):
+        self.steps = steps
+        self.by_name = {step.name: step for step in steps}
+        self.total = total
+
+    def critical_path(self) -> List[Step]:
+        """From the last step to become ready, back through whichever dependency finished last."""
+        done = [s for s in self.steps if s.ok]
+        if not done:
+            return []
+        path = [max(done, key=lambda s: s.ready)]
+        while True:
+            deps = [self.by_name[name] for name in path[-1].after if self.by_name[name].ok]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda s: s.ready))
+        return list(reversed(path))
+
+    def format(self) -> str:
+        lines = [f"{'step':<16} {'start':>8} {'run':>8} {'probe':>8} {'ready':>8}"]
+        for step in sorted(self.steps, key=lambda s: (s.skipped, s.started)):
+            if step.skipped:
+                lines.append(f"{step.name:<16} {'skipped':>8}")
+                continue
+            status = f"  FAILED: {step.error}" if step.error else ""
+            lines.append(
+                f"{step.name:<16} {step.started * 1000:>6.0f}ms {(step.returned - step.started) * 1000:>6.0f}ms "
+                f"{(step.ready - step.returned) * 1000:>6.0f}ms {step.ready * 1000:>6.0f}ms{status}")
+        path = self.critical_path()
+        lines.append(f"critical path ({self.total * 1000:.0f}ms): "
+                     + " -> ".join(f"{s.name} {(s.ready - s.started) * 1000:.0f}ms" for s in path))
+        return "\n".join(lines)
+
+
+class Session:
+    def __init__(self, max_workers: int = 8):
+        self.steps: Dict[str, Step] = {}
+        self.max_workers = max_workers
+
+    def step(self, name: str, run: Callable[[], Any], after: Iterable[str] = (),
+             probe: Optional[Probe] = None, timeout: float = 10.0, required: bool = True) -> Step:
+        """Add a step; `after` names steps that must be ready before it starts."""
+        if name in self.steps:
+            raise ValueError(f"duplicate step {name!r}")
+        step = Step(name, run, list(after), probe, timeout, required)
+        self.steps[name] = step
+        return step
+
+    def _check(self) -> None:
+        for step in self.steps.values():
+            for dep in step.after:
+                if dep not in self.steps:
+                    raise ValueError(f"{step.name!r} depends on unknown step {dep!r}")
+        # Kahn's algorithm: anything left over sits on a cycle
+        indegree = {name: len(step.after) for name, step in self.steps.items()}
+        queue = [name for name, n in indegree.items() if n == 0]
+        seen = 0
+        while queue:
+            name = queue.pop()
+            seen += 1
+            for other in self.steps.values():
+                if name in other.after:
+                    indegree[other.name] -= 1
+                    if indegree[other.name] == 0:
+                        queue.append(other.name)
+        if seen != len(self.steps):
+            raise ValueError("steps form a dependency cycle")
+
+    def run(self) -> Report:
+        """
+        Run every step as early as its dependencies allow. Steps that depend
+        on a failed one are skipped; if a required step failed or was skipped,
+        SessionError is raised with the report attached.
+        """
+        self._check()
+        origin = time.monotonic()
+        lock = threading.Lock()
+        all_done = threading.Event()
+        waiting_on = {name: set(step.after) for name, step in self.steps.items()}
+        scheduled = set()
+        finished = 0
+
+        def clock() -> float:
+            return time.monotonic() - origin
+
+        def execute(step: Step) -> None:
+            step.started = clock()
+            try:
+                step.result = step.run()
+                step.returned = clock()
+                if step.probe and not wait_until(step.probe, step.timeout):
+                    raise SessionError(f"not ready after {step.timeout:.0f}s")
+            except Exception as e:
+                step.returned = step.returned or clock()
+                step.error = e
+            step.ready = clock()
+            complete(step)
+
+        def complete(step: Step) -> None:
+            nonlocal finished
+            start = []
+            with lock:
+                settled = [step]
+                while settled:
+                    done = settled.pop()
+                    finished += 1
+                    for other in self.steps.values():
+                        if other.name in scheduled or done.name not in other.after:
+                            continue
+                        if not done.ok:
+                            # Nothing that needs a failed step can run
+                            other.skipped = True
+                            scheduled.add(other.name)
+                            settled.append(other)
+                            continue
+                        waiting_on[other.name].discard(done.name)
+                        if not waiting_on[other.name]:
+                            scheduled.add(other.name)
+                            start.append(other)
+                if finished == len(self.steps):
+                    all_done.set()
+            for other in start:
+                pool.submit(execute, other)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="session") as pool:
+            roots = [step for step in self.steps.values() if not step.after]
+            scheduled.update(step.name for step in roots)
+            if not self.steps:
+                all_done.set()
+            for step in roots:
+                pool.submit(execute, step)
+            all_done.wait()
+
+        report = Report(list(self.steps.values()), clock())
+        failed = [step for step in self.steps.values() if step.required and not step.ok]
+        if failed:
+            raise SessionError("; ".join(
+                f"{step.name}: {'skipped' if step.skipped else step.error}" for step in failed),
+                report)
+        return report
@@ -2,11 +2,13 @@ import subprocess
 import time
 from typing import List, Dict, Any, Optional
 from .core import Hyprctl
+from .events import WindowEvents
 
 class WindowManager:
-    def __init__(self, hyprctl: Hyprctl, workspace: int = 2):
+    def __init__(self, hyprctl: Hyprctl, workspace: int = 2, events: Optional[WindowEvents] = None):
         self.hyprctl = hyprctl
         self.workspace = workspace
+        self.events = events
         self.windows: List[Dict[str, Any]] = []
         self.processes: List[subprocess.Popen] = []
 
@@ -21,6 +23,7 @@ class WindowManager:
         import os
         conf_path = os.path.expanduser("~/code/games/ghostty_game.conf")
 
+        since = self.events.mark() if self.events else 0
         spawn_cmds = []
         for cfg in windows_config:
             # Prepare command
@@ -72,6 +75,18 @@ class WindowManager:
         # We need the addresses to manage them later (close, etc)
         # found_windows maps index (in windows_config) -> address (str)
         found_windows = {} 
+        if self.events:
+            # Event-driven: each window is picked up the moment Hyprland
+            # announces it; whatever doesn't show up falls through to polling
+            deadline = time.monotonic() + 5
+            owned = {w['address'] for w in self.windows}
+            for i, cfg in enumerate(windows_config):
+                address = self.events.wait_for(
+                    lambda w, cfg=cfg: self._event_matches(cfg, w), since,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                    exclude=owned | set(found_windows.values()))
+                if address:
+                    found_windows[i] = address
         retries = 50
         while retries > 0 and len(found_windows) < len(windows_config):
             clients = self.hyprctl.get_clients()
@@ -154,6 +169,14 @@ class WindowManager:
         if len(found_windows) < len(windows_config):
             print(f"Warning: Only found {len(found_windows)}/{len(windows_config)} windows.")
 
+    def _event_matches(self, cfg: Dict[str, Any], window: Dict[str, str]) -> bool:
+        # Same rules as the polling loop: target workspace only, class or title
+        if window['workspace'] != str(self.workspace):
+            return False
+        if cfg.get('is_class', False):
+            return cfg['name_pattern'] in window['class']
+        return cfg['name_pattern'] in window['title']
+
     def spawn(self, command: str, name_pattern: str, x: int, y: int, width: int, height: int, is_class: bool = True) -> Optional[Dict[str, Any]]:
         """
         Spawn a single window using exec rules.
@@ -0,0 +1,356 @@
+"""
+Fork server ("zygote") for game windows.
+
+Every terminal window used to start its own interpreter and re-import
+`requests`, `rich`, Flask and friends, which costs a few hundred ms and a
+private copy of every module per window. The zygote imports all of that once
+and forks a worker per window instead:
+
+    python engine/zygote.py serve --socket /run/user/1000/boggle.sock \
+        --path boggle --preload requests --preload tui
+
+    ghostty -e python -S engine/zygote.py run --socket /run/user/1000/boggle.sock \
+        -- boggle/tui.py timer
+
+`run` is a tiny stdlib-only client (hence `-S`). It passes its stdin/stdout/
+stderr to the zygote over the Unix socket (SCM_RIGHTS), together with argv,
+cwd and environment. The zygote forks, and the child takes over those file
+descriptors and runs the script or `-m module` as `__main__`. The client
+stays alive as the terminal's foreground process: it forwards signals
+(Ctrl+C, resize, hangup) to the worker and exits with the worker's status.
+Modules imported before the fork are shared copy-on-write (`gc.freeze`
+keeps the collector from dirtying them), so a new window is up in a few
+milliseconds.
+
+Preloaded modules must not start threads: forking a threaded process only
+carries the forking thread over.
+"""
+import marshal
+import os
+import signal
+import socket
+import sys
+
+# Messages are one marshal'd dict per datagram (SOCK_SEQPACKET keeps the
+# boundaries). marshal rather than json: the client starts once per window
+# and json's import alone would double its startup. The socket is only
+# reachable by this user, so its peers are trusted.
+MAX_MESSAGE = 1 << 20
+
+# Signals the client relays to its worker
+FORWARDED = ("SIGINT", "SIGTERM", "SIGHUP", "SIGQUIT", "SIGWINCH", "SIGUSR1", "SIGUSR2")
+
+
+def _send(sock, message, fds=()):
+    data = marshal.dumps(message)
+    if fds:
+        socket.send_fds(sock, [data], list(fds))
+    else:
+        sock.send(data)
+
+
+# --- client ----------------------------------------------------------------------
+
+def connect(socket_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def wait_ready(socket_path, timeout=10.0, interval=0.02):
+    """True once a zygote accepts connections on `socket_path` (it binds after preloading)."""
+    import time
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connect(socket_path).close()
+            return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+
+def launch(socket_path, argv, cwd=None, env=None, fds=(0, 1, 2), forward_signals=True):
+    """
+    Run `argv` (a script path plus arguments, or "-m", module, ...) in a worker
+    forked from the zygote, wired to `fds` as its stdin/stdout/stderr. Blocks
+    until it exits and returns its exit status (128+N if killed by signal N).
+    """
+    sock = connect(socket_path)
+    with sock:
+        request = {
+            "argv": list(argv),
+            "cwd": cwd or os.getcwd(),
+            "env": dict(os.environ if env is None else env),
+        }
+        _send(sock, request, fds)
+        data = sock.recv(MAX_MESSAGE)
+        reply = marshal.loads(data) if data else {}
+        if "pid" not in reply:
+            raise RuntimeError(reply.get("error", "zygote closed the connection"))
+        pid = reply["pid"]
+
+        if forward_signals:
+            def relay(signum, frame):
+                try:
+                    os.kill(pid, signum)
+                except ProcessLookupError:
+                    pass
+            for name in FORWARDED:
+                if hasattr(signal, name):
+                    signal.signal(getattr(signal, name), relay)
+
+        while True:
+            try:
+                data = sock.recv(MAX_MESSAGE)
+                break
+            except InterruptedError:
+                continue
+        if not data:
+            return 1  # zygote went away
+        return marshal.loads(data)["exit"]
+
+
+# --- server ----------------------------------------------------------------------
+
+class Zygote:
+    """Preloads modules, then forks a worker per request on a Unix socket."""
+
+    def __init__(self, socket_path, preload=(), paths=()):
+        self.socket_path = socket_path
+        self.preload = list(preload)
+        self.paths = list(paths)
+        self.listener = None
+        self.clients = {}  # worker pid -> client connection
+        self.conns = {}  # client connection -> worker pid
+
+    def prepare(self):
+        import gc
+        import importlib
+        for path in reversed(self.paths):
+            sys.path.insert(0, os.path.abspath(path))
+        for name in self.preload:
+            importlib.import_module(name)
+        # Everything imported so far is shared with the workers; moving it
+        # to the permanent generation stops GC passes from touching (and so
+        # copying) those pages in every child
+        gc.collect()
+        gc.freeze()
+
+    def serve(self):
+        import selectors
+        self.prepare()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.listener.bind(self.socket_path)
+        self.listener.listen(64)
+
+        # Children are reaped from the main loop: SIGCHLD only writes a
+        # byte to the wakeup pipe. Staying single-threaded keeps fork safe.
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_w, False)
+        signal.set_wakeup_fd(wake_w)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        # Terminate cleanly so the socket file is removed
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        self._wake = (wake_r, wake_w)
+
+        sel = selectors.DefaultSelector()
+        sel.register(self.listener, selectors.EVENT_READ, "accept")
+        sel.register(wake_r, selectors.EVENT_READ, "reap")
+        try:
+            while True:
+                for key, _ in sel.select():
+                    if key.data == "accept":
+                        conn, _ = self.listener.accept()
+                        self._handle(conn, sel)
+                    elif key.data == "reap":
+                        os.read(wake_r, 4096)
+                        self._reap(sel)
+                    else:
+                        # The client hung up before its worker finished: the
+                        # terminal is gone, so tell the worker the same way
+                        self._hangup(key.fileobj, sel)
+        finally:
+            self.listener.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _handle(self, conn, sel):
+        import selectors
+        try:
+            data, fds, _, _ = socket.recv_fds(conn, MAX_MESSAGE, 3)
+        except OSError:
+            conn.close()
+            return
+        if not data:
+            # Readiness probe (see wait_ready)
+            conn.close()
+            return
+        try:
+            request = marshal.loads(data)
+            if len(fds) != 3 or not isinstance(request, dict) or not request.get("argv"):
+                raise ValueError("expected argv and three file descriptors")
+        except (ValueError, EOFError, TypeError) as e:
+            for fd in fds:
+                os.close(fd)
+            _send(conn, {"error": str(e)})
+            conn.close()
+            return
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            self._child(request, fds)  # never returns
+        for fd in fds:
+            os.close(fd)
+        self.clients[pid] = conn
+        self.conns[conn] = pid
+        _send(conn, {"pid": pid})
+        sel.register(conn, selectors.EVENT_READ, "client")
+
+    def _reap(self, sel):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            conn = self.clients.pop(pid, None)
+            if conn is None:
+                continue
+            self.conns.pop(conn, None)
+            code = os.waitstatus_to_exitcode(status)
+            sel.unregister(conn)
+            try:
+                _send(conn, {"exit": code if code >= 0 else 128 - code})
+            except OSError:
+                pass
+            conn.close()
+
+    def _hangup(self, conn, sel):
+        pid = self.conns.pop(conn, None)
+        sel.unregister(conn)
+        conn.close()
+        if pid is not None:
+            self.clients.pop(pid, None)
+            try:
+                os.kill(pid, signal.SIGHUP)
+            except ProcessLookupError:
+                pass
+
+    def _child(self, request, fds):
+        code = 1
+        try:
+            os.setsid()
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            self.listener.close()
+            for conn in self.conns:
+                conn.close()
+            signal.set_wakeup_fd(-1)
+            for fd in self._wake:
+                os.close(fd)
+            for name in ("SIGCHLD", "SIGTERM", "SIGHUP", "SIGWINCH", "SIGPIPE"):
+                signal.signal(getattr(signal, name), signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["env"])
+            self._reopen_stdio()
+            # Forked workers would otherwise share one random sequence
+            import random
+            random.seed()
+            code = self._run(request["argv"])
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(code)
+
+    @staticmethod
+    def _reopen_stdio():
+        # The zygote's streams were set up for its own (non-tty) fds;
+        # rebuild them so buffering matches the worker's terminal
+        sys.stdin = sys.__stdin__ = open(0, "r", closefd=False)
+        # buffering=1 is line buffering in text mode
+        sys.stdout = sys.__stdout__ = open(1, "w", buffering=1 if os.isatty(1) else -1,
+                                           closefd=False)
+        sys.stderr = sys.__stderr__ = open(2, "w", buffering=1, closefd=False,
+                                           errors="backslashreplace")
+
+    @staticmethod
+    def _run(argv):
+        import runpy
+        try:
+            if argv[0] == "-m":
+                sys.argv = argv[1:]
+                runpy.run_module(argv[1], run_name="__main__", alter_sys=True)
+            else:
+                script = os.path.abspath(argv[0])
+                sys.argv = [script] + argv[1:]
+                sys.path[0] = os.path.dirname(script)
+                runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            if isinstance(e.code, int):
+                return e.code
+            print(e.code, file=sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            return 128 + signal.SIGINT
+        return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["run"] and len(argv) > 3 and argv[1] == "--socket":
+        # The per-window fast path: skip argparse (and the re import it drags in)
+        command = argv[3:]
+        if command[:1] == ["--"]:
+            command = command[1:]
+        if command:
+            sys.exit(launch(argv[2], command))
+    import argparse
+    parser = argparse.ArgumentParser(description="Fork server for game windows")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="preload modules and fork workers on request")
+    serve.add_argument("--socket", required=True)
+    serve.add_argument("--preload", action="append", default=[], metavar="MODULE")
+    serve.add_argument("--path", action="append", default=[], metavar="DIR",
+                       help="prepend DIR to sys.path before preloading")
+    run = sub.add_parser("run", help="run a script in a forked worker, on this terminal")
+    run.add_argument("--socket", required=True)
+    run.add_argument("argv", nargs=argparse.REMAINDER, help="-- script.py args | -- -m module args")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        # Running as a script put engine/ at the front of sys.path; workers
+        # get their own script directory instead
+        if sys.path and os.path.abspath(sys.path[0]) == os.path.dirname(os.path.abspath(__file__)):
+            del sys.path[0]
+        Zygote(args.socket, args.preload, args.path).serve()
+    else:
+        command = args.argv[1:] if args.argv[:1] == ["--"] else args.argv
+        if not command:
+            parser.error("run needs a script or -m module")
+        sys.exit(launch(args.socket, command))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Static asset pipeline for the Lexigraph controller.
+
+At startup `AssetStore` reads every file under the asset directory once,
+gives it a content-hashed alias (`main.ts` -> `main.3f9a1c0b2d4e.ts`) and
+precompresses it with gzip (and brotli when the `brotli` package is
+installed), keeping only encodings that actually save bytes. Responses then
+come straight from memory:
+
+- Hashed names never change content, so they are served with
+  `Cache-Control: public, max-age=31536000, immutable`. A phone that joined
+  once doesn't ask for them again.
+- Entry pages (`index.html`) and plain names are served `no-cache` with an
+  ETag, so a reconnect costs one conditional request answered with a 304.
+- HTML pages have their `src`/`href` references to other assets rewritten to
+  the hashed names, which is what makes the immutable caching safe.
+
+Relative imports *inside* scripts are left alone; they resolve against the
+same directory and hit the plain-name path, which still revalidates cheaply.
+
+    python -m lexigraph_py.assets lexigraph_py/static/controller
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+from flask import Request, Response
+
+try:
+    import brotli  # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# mimetypes knows .ts as a Qt translation file
+MIMETYPES = {
+    ".ts": "text/javascript",
+    ".js": "text/javascript",
+    ".mjs": "text/javascript",
+    ".map": "application/json",
+    ".wasm": "application/wasm",
+}
+
+# Already-compressed formats aren't worth another pass
+INCOMPRESSIBLE = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".woff", ".woff2",
+                  ".mp3", ".ogg", ".mp4", ".gz", ".br", ".zip")
+
+# Smaller than this and the encoding overhead eats the gain
+MIN_COMPRESS = 256
+
+HASH_LENGTH = 12
+
+REFERENCE = re.compile(r'''(\b(?:src|href)\s*=\s*["'])(\./)?([^"'?#:]+)(["'?#])''')
+
+
+class Variant(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class Asset:
+    __slots__ = ("name", "hashed", "mimetype", "variants")
+
+    def __init__(self, name: str, hashed: str, mimetype: str, variants: Dict[str, Variant]):
+        self.name = name
+        self.hashed = hashed
+        self.mimetype = mimetype
+        self.variants = variants  # encoding ("identity", "gzip", "br") -> Variant
+
+
+def content_type(name: str) -> str:
+    ext = os.path.splitext(name)[1].lower()
+    if ext in MIMETYPES:
+        return MIMETYPES[ext]
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
+def hashed_name(name: str, digest: str) -> str:
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+
+def encode(name: str, body: bytes, digest: str) -> Dict[str, Variant]:
+    """The identity body plus every precompressed encoding that is smaller."""
+    variants = {"identity": Variant(body, digest[:HASH_LENGTH])}
+    if len(body) < MIN_COMPRESS or name.lower().endswith(INCOMPRESSIBLE):
+        return variants
+    # mtime=0 keeps the gzip output (and so its ETag) stable across restarts
+    candidates = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        candidates["br"] = brotli.compress(body, quality=11)
+    for encoding, data in candidates.items():
+        if len(data) < len(body):
+            variants[encoding] = Variant(data, f"{digest[:HASH_LENGTH]}-{encoding}")
+    return variants
+
+
+class AssetStore:
+    """Every file under `root`, hashed and precompressed in memory."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.by_name: Dict[str, Asset] = {}
+        self.by_hash: Dict[str, Asset] = {}
+        self._load()
+
+    def _load(self) -> None:
+        files: Dict[str, bytes] = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, self.root).replace(os.sep, "/")
+                with open(path, "rb") as f:
+                    files[name] = f.read()
+        # Hash leaf assets first; pages are hashed after their references
+        # are rewritten, so a changed script also changes the page's ETag
+        pages = [name for name in files if name.endswith((".html", ".htm"))]
+        for name in sorted(files):
+            if name not in pages:
+                self._add(name, files[name])
+        for name in sorted(pages):
+            self._add(name, self.rewrite(name, files[name]))
+
+    def _add(self, name: str, body: bytes) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        asset = Asset(name, hashed_name(name, digest), content_type(name),
+                      encode(name, body, digest))
+        self.by_name[name] = asset
+        self.by_hash[asset.hashed] = asset
+
+    def rewrite(self, name: str, body: bytes) -> bytes:
+        """Point the page's relative src/href references at hashed names."""
+        base = os.path.dirname(name)
+
+        def swap(m: "re.Match[str]") -> str:
+            target = os.path.normpath(os.path.join(base, m.group(3))).replace(os.sep, "/")
+            asset = self.by_name.get(target)
+            if asset is None:
+                return m.group(0)
+            ref = m.group(3)
+            ref = ref[: len(ref) - len(os.path.basename(ref))] + os.path.basename(asset.hashed)
+            return f"{m.group(1)}{m.group(2) or ''}{ref}{m.group(4)}"
+
+        return REFERENCE.sub(swap, body.decode("utf-8")).encode("utf-8")
+
+    def url(self, name: str) -> str:
+        """The hashed name to link to for `name` (or `name` itself if unknown)."""
+        asset = self.by_name.get(name)
+        return asset.hashed if asset else name
+
+    def lookup(self, path: str) -> Optional[Asset]:
+        return self.by_hash.get(path) or self.by_name.get(path)
+
+    def respond(self, path: str, request: Request) -> Optional[Response]:
+        """The response for `path`, or None if there is no such asset."""
+        asset = self.lookup(path)
+        if asset is None:
+            return None
+        encoding = self.negotiate(asset, request)
+        variant = asset.variants[encoding]
+        response = Response(variant.body, mimetype=asset.mimetype)
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        # Only a hashed URL is guaranteed to keep its content
+        response.headers["Cache-Control"] = IMMUTABLE if path == asset.hashed else REVALIDATE
+        response.set_etag(variant.etag)
+        return response.make_conditional(request)
+
+    @staticmethod
+    def negotiate(asset: Asset, request: Request) -> str:
+        accepted = request.accept_encodings
+        # Brotli first: it's the smaller of the two when we have it
+        for encoding in ("br", "gzip"):
+            if encoding in asset.variants and accepted[encoding] > 0:
+                return encoding
+        return "identity"
+
+    def summary(self) -> List[str]:
+        lines = []
+        for name, asset in sorted(self.by_name.items()):
+            sizes = "  ".join(f"{enc} {len(v.body)}" for enc, v in asset.variants.items())
+            lines.append(f"{name:<28} {asset.hashed:<40} {sizes}")
+        return lines
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m lexigraph_py.assets ASSET_DIR")
+        sys.exit(1)
+    for line in AssetStore(sys.argv[1]).summary():
+        print(line)
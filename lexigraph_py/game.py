@@ -1,61 +1,215 @@
+import logging
 import random
 import string
+import threading
+from array import array
+
+from . import solver
+from .territory import TerritoryTracker
+
+log = logging.getLogger('lexigraph.game')
 
 class Player:
-    def __init__(self, pid, name, color):
+    __slots__ = ('id', 'name', 'color', 'score', 'index')
+
+    def __init__(self, pid, name, color, index=0):
         self.id = pid
         self.name = name
         self.color = color
         self.score = 0
+        self.index = index # Small owner number used in compact updates
+
+    def info(self):
+        return {'index': self.index, 'id': self.id, 'name': self.name,
+                'color': self.color, 'score': self.score}
 
 class Tile:
-    def __init__(self, char, x, y):
-        self.char = char.upper()
+    """
+    Lightweight view of one cell. The data lives in the Grid's arrays; a Tile
+    is created on demand by `Grid.get_tile` and reads/writes through to them.
+    """
+    __slots__ = ('grid', 'x', 'y')
+
+    def __init__(self, grid, x, y):
+        self.grid = grid
         self.x = x
         self.y = y
-        self.owner = None  # Player object
+
+    @property
+    def char(self):
+        return chr(self.grid.letters[self.y * self.grid.width + self.x])
+
+    @char.setter
+    def char(self, value):
+        self.grid.set_tile(self.x, self.y, value)
+
+    @property
+    def owner(self):
+        return self.grid.owner_at(self.x, self.y)
+
+    @owner.setter
+    def owner(self, player):
+        self.grid.set_owner(self.x, self.y, player)
 
 class Grid:
+    """
+    Structure-of-arrays board: one byte per letter and one small int per
+    owner (an index into `owner_table`, NO_OWNER when unclaimed), stored
+    row-major at `y * width + x`. Memory is a few bytes per cell regardless
+    of board size, and serialisation is a flat loop over two arrays.
+
+    `owned[index]` is the set of cells held by each owner, kept in step with
+    `owners` so per-player queries cost O(owned tiles), not O(board).
+    `territory` tracks connected regions incrementally (see territory.py);
+    every ownership change goes through `assign` to keep it in sync.
+    `letters_version` changes whenever a letter does, so the solver's cached
+    `solutions` know when to search again.
+    """
+    __slots__ = ('width', 'height', 'letters', 'owners', 'owner_table', 'owned', 'territory',
+                 'letters_version', 'solutions')
+
+    NO_OWNER = -1
+
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.tiles = self._generate_grid()
+        self.letters = self._generate_letters()
+        self.owners = array('h', [self.NO_OWNER]) * (width * height)
+        self.owner_table = [] # owner index -> Player
+        self.owned = [] # owner index -> set of cell indices
+        self.territory = TerritoryTracker(width, height, self.owners, self.neighbours)
+        self.letters_version = 0
+        self.solutions = None # solver cache, see solver.solve
 
-    def _generate_grid(self):
+    def _generate_letters(self):
         # Simple random generation for now (weighted would be better)
         # Using standard English frequencies roughly
         COMMON_LETTERS = "EEEEEEEEEEEEAAAAAAAAAIIIIIIIIIOOOOOOOONNNNNNRRRRRRTTTTTTLLLLSSSSUUUDDDDGGGBBCCMMPPFFHHVVWWYYKJXQZ"
-        grid = []
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                char = random.choice(COMMON_LETTERS)
-                row.append(Tile(char, x, y))
-            grid.append(row)
-        return grid
+        chars = random.choices(COMMON_LETTERS, k=self.width * self.height)
+        return bytearray("".join(chars), 'ascii')
+
+    @property
+    def tiles(self):
+        """Rows of Tile views (compatibility; prefer the array accessors)."""
+        return [[Tile(self, x, y) for x in range(self.width)] for y in range(self.height)]
+
+    def in_bounds(self, x, y):
+        return 0 <= y < self.height and 0 <= x < self.width
 
     def get_tile(self, x, y):
-        if 0 <= y < self.height and 0 <= x < self.width:
-            return self.tiles[y][x]
+        if self.in_bounds(x, y):
+            return Tile(self, x, y)
         return None
 
     def set_tile(self, x, y, char):
-        tile = self.get_tile(x, y)
-        if tile:
-            tile.char = char.upper()
+        if self.in_bounds(x, y):
+            self.letters[y * self.width + x] = ord(char.upper()[0])
+            self.letters_version += 1
+
+    def load_letters(self, letters):
+        """Replace the whole board's letters (row-major bytes)."""
+        self.letters[:] = letters
+        self.letters_version += 1
+
+    def char_at(self, x, y):
+        return chr(self.letters[y * self.width + x])
+
+    def owner_index(self, x, y):
+        return self.owners[y * self.width + x]
+
+    def owner_at(self, x, y):
+        index = self.owners[y * self.width + x]
+        return None if index == self.NO_OWNER else self.owner_table[index]
+
+    def set_owner(self, x, y, player):
+        self.assign([y * self.width + x], player)
+
+    def assign(self, cells, player):
+        """Give a batch of cells (e.g. a word path) to `player`, or free them with None."""
+        index = self.NO_OWNER if player is None else player.index
+        if index != self.NO_OWNER:
+            if index >= len(self.owner_table):
+                grow = index + 1 - len(self.owner_table)
+                self.owner_table.extend([None] * grow)
+                self.owned.extend(set() for _ in range(grow))
+            self.owner_table[index] = player
+
+        released = {} # previous owner -> cells it lost
+        claimed = []
+        for cell in cells:
+            previous = self.owners[cell]
+            if previous == index:
+                continue
+            if previous != self.NO_OWNER:
+                self.owned[previous].discard(cell)
+                released.setdefault(previous, []).append(cell)
+            self.owners[cell] = index
+            if index != self.NO_OWNER:
+                self.owned[index].add(cell)
+                claimed.append(cell)
+
+        # Victims first: their old roots are still reachable through the
+        # cells we are about to relabel
+        for previous, lost in released.items():
+            self.territory.released(previous, lost)
+        if claimed:
+            self.territory.claimed(index, claimed)
+
+    def owned_cells(self, index):
+        """Cell indices held by an owner (empty if it never owned anything)."""
+        return self.owned[index] if index < len(self.owned) else set()
+
+    def clear_owner(self, index):
+        """Release every cell held by `index`; returns the freed cell indices."""
+        cells = self.owned_cells(index)
+        for cell in cells:
+            self.owners[cell] = self.NO_OWNER
+        freed = sorted(cells)
+        cells.clear()
+        self.territory.reset_owner(index)
+        return freed
+
+    def neighbours(self, cell):
+        x, y = cell % self.width, cell // self.width
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if (dx or dy) and self.in_bounds(x + dx, y + dy):
+                    yield (y + dy) * self.width + x + dx
+
+    def regions(self, index):
+        """
+        Connected (8-way, like paths) groups of an owner's cells, via BFS over
+        owned cells. Full recomputation; `territory` answers the same
+        question incrementally.
+        """
+        remaining = set(self.owned_cells(index))
+        regions = []
+        while remaining:
+            start = remaining.pop()
+            region, frontier = [start], [start]
+            while frontier:
+                cell = frontier.pop()
+                for n in self.neighbours(cell):
+                    if n in remaining:
+                        remaining.remove(n)
+                        region.append(n)
+                        frontier.append(n)
+            regions.append(region)
+        return regions
 
     def serialize(self):
-        return [
-            [
-                {
-                    'char': tile.char,
-                    'ownerId': tile.owner.id if tile.owner else None,
-                    'ownerColor': tile.owner.color if tile.owner else None
-                }
-                for tile in row
-            ]
-            for row in self.tiles
-        ]
+        # Resolve each owner once instead of once per tile
+        owners = [(p.id, p.color) if p else (None, None) for p in self.owner_table]
+        letters = self.letters.decode('ascii')
+        rows = []
+        for y in range(self.height):
+            base = y * self.width
+            row = []
+            for i in range(base, base + self.width):
+                owner_id, color = owners[self.owners[i]] if self.owners[i] >= 0 else (None, None)
+                row.append({'char': letters[i], 'ownerId': owner_id, 'ownerColor': color})
+            rows.append(row)
+        return rows
 
 # Simple dictionary loading (placeholder or use py-enchant/similar later)
 # For now, we'll just check against a small set or trust inputs if we don't have a dict file handy
@@ -67,35 +221,113 @@ except FileNotFoundError:
     DICTIONARY = {"TEST", "HELLO", "WORLD", "LEXIGRAPH"} 
 
 class LexigraphGame:
+    """
+    Every change is published to `listeners` as a compact delta stamped with
+    a sequence number (`seq`). Clients apply deltas on top of a `snapshot()`
+    and ask for a fresh snapshot whenever they see a gap in the numbers.
+
+    Deltas hold only what changed:
+      'tiles':  [[x, y, ownerIndex or None], ...]
+      'scores': [[ownerIndex, totalScore], ...]
+      'joined': [player info, ...]
+      'left':   [ownerIndex, ...]
+    """
     def __init__(self):
         self.grid = Grid(7, 7)
         self.players = {} # id -> Player
         self.available_colors = ['#FF0055', '#00FF99', '#00CCFF', '#FFDD00', '#FF9900', '#CC00FF']
         self.used_colors = set()
+        # SocketIO handlers run concurrently; every read-modify-write of the
+        # grid or the player table happens under this lock.
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self.seq = 0
+        self.listeners = [] # callables receiving each delta, called under the lock
+        self.journal = None # optional persistence.GameJournal, also called under the lock
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def _publish(self, delta):
+        # Must be called with the lock held so seq order matches mutation order
+        self.seq += 1
+        delta['seq'] = self.seq
+        self.changed.notify_all()
+        for listener in self.listeners:
+            try:
+                listener(delta)
+            except Exception:
+                log.exception("Delta listener failed")
+
+    def wait_for_change(self, seq, timeout=None):
+        """Block until `seq` moves past the given value; returns the current one."""
+        with self.lock:
+            self.changed.wait_for(lambda: self.seq != seq, timeout)
+            return self.seq
 
     def add_player(self, pid, name):
-        if pid in self.players:
-            return self.players[pid]
-            
-        # Assign color
-        color = next((c for c in self.available_colors if c not in self.used_colors), '#FFFFFF')
-        self.used_colors.add(color)
-        
-        player = Player(pid, name, color)
-        self.players[pid] = player
-        return player
+        with self.lock:
+            if pid in self.players:
+                return self.players[pid]
+
+            # Assign color
+            color = next((c for c in self.available_colors if c not in self.used_colors), '#FFFFFF')
+            self.used_colors.add(color)
+
+            # Lowest free owner index keeps indices small as players come and go
+            taken = {p.index for p in self.players.values()}
+            index = next(i for i in range(len(taken) + 1) if i not in taken)
+
+            player = Player(pid, name, color, index)
+            self.players[pid] = player
+            if self.journal:
+                self.journal.join(pid, name)
+            self._publish({'joined': [player.info()]})
+            return player
 
     def remove_player(self, pid):
-        if pid in self.players:
-            player = self.players[pid]
-            if player.color in self.used_colors:
-                self.used_colors.remove(player.color)
-            del self.players[pid]
-            # Clear ownership
-            for row in self.grid.tiles:
-                for tile in row:
-                    if tile.owner == player:
-                        tile.owner = None
+        with self.lock:
+            if pid in self.players:
+                player = self.players[pid]
+                if player.color in self.used_colors:
+                    self.used_colors.remove(player.color)
+                del self.players[pid]
+                if self.journal:
+                    self.journal.leave(pid)
+                # Clear ownership, O(tiles the player held)
+                width = self.grid.width
+                cleared = [[cell % width, cell // width, None]
+                           for cell in self.grid.clear_owner(player.index)]
+                self._publish({'left': [player.index], 'tiles': cleared})
+
+    def snapshot(self):
+        """Consistent full copy of the board and players, for connects and resyncs."""
+        with self.lock:
+            return {
+                'seq': self.seq,
+                'grid': self.grid.serialize(),
+                'players': [p.info() for p in self.players.values()],
+            }
+
+    def territory(self, pid):
+        """Tiles held and largest connected region for a player, O(1)."""
+        with self.lock:
+            player = self.players.get(pid)
+            if player is None:
+                return {'tiles': 0, 'largest_region': 0, 'regions': 0}
+            return self.grid.territory.stats(player.index)
+
+    def hint(self, pid, limit=3):
+        """Best moves for a player right now (see solver.rank), best first."""
+        with self.lock:
+            player = self.players.get(pid)
+            index = player.index if player else Grid.NO_OWNER
+            return solver.rank(self.grid, index, limit)
+
+    def has_moves(self):
+        """False once no dictionary word can be traced on the board."""
+        with self.lock:
+            return bool(solver.solve(self.grid))
 
     def validate_move(self, coords):
         """
@@ -144,31 +376,59 @@ class LexigraphGame:
 
         return {'success': True, 'word': word, 'tiles': tiles}
 
+    def apply_move(self, pid, coords, score):
+        """
+        Capture an already-validated path for `score` points, as recorded in
+        a move log. Replay uses this so a changed word list can't alter a
+        restored game.
+        """
+        with self.lock:
+            player = self.players.get(pid)
+            if not player:
+                raise ValueError(f"move by unknown player {pid!r}")
+            for coord in coords:
+                if not self.grid.in_bounds(coord['x'], coord['y']):
+                    raise ValueError(f"move outside the board: {coord}")
+            self._capture(player, coords, score)
+
+    def _capture(self, player, coords, score):
+        # Called with the lock held
+        width = self.grid.width
+        cells = [c['y'] * width + c['x'] for c in coords]
+        changed = [[c['x'], c['y'], player.index] for c in coords]
+        # One batch so the territory tracker merges/splits regions once per move
+        self.grid.assign(cells, player)
+
+        player.score += score
+        if self.journal:
+            self.journal.move(player.id, coords, score)
+        self._publish({'tiles': changed, 'scores': [[player.index, player.score]]})
+
     def process_move(self, pid, coords):
-        player = self.players.get(pid)
-        if not player:
-            return {'success': False, 'message': "Player not found"}
-
-        validation = self.validate_move(coords)
-        if not validation['success']:
-            return validation
-
-        # Calculate Score & Capture
-        word = validation['word']
-        move_score = len(word) * 10
-        
-        for tile in validation['tiles']:
-            # Capture bonus?
-            if tile.owner and tile.owner != player:
-                move_score += 5 # Steal bonus
-            
-            tile.owner = player
-        
-        player.score += move_score
-        
-        return {
-            'success': True,
-            'word': word,
-            'score': move_score,
-            'total_score': player.score
-        }
+        with self.lock:
+            player = self.players.get(pid)
+            if not player:
+                return {'success': False, 'message': "Player not found"}
+
+            validation = self.validate_move(coords)
+            if not validation['success']:
+                return validation
+
+            # Calculate Score & Capture
+            word = validation['word']
+            move_score = len(word) * 10
+            for tile in validation['tiles']:
+                # Capture bonus?
+                owner = self.grid.owner_index(tile.x, tile.y)
+                if owner != Grid.NO_OWNER and owner != player.index:
+                    move_score += 5 # Steal bonus
+
+            self._capture(player, coords, move_score)
+
+            return {
+                'success': True,
+                'word': word,
+                'score': move_score,
+                'total_score': player.score,
+                'territory': self.grid.territory.stats(player.index),
+            }
@@ -0,0 +1,352 @@
+"""
+Crash recovery for Lexigraph: an append-only binary move log plus periodic
+compact snapshots.
+
+Every accepted change (board letters, joins, leaves, successful moves) is
+appended to `moves.log` as a small binary record. Every `snapshot_every`
+records the whole game (letters, owners, players, scores) is written to
+`snapshot.bin` via a temp file + rename, together with the log offset it
+covers. Restoring is "load snapshot, replay the log tail", so a restarted
+server is back where it was after a handful of replayed moves.
+
+The log is never rewritten, so it doubles as a full history for offline
+analysis and benchmarks:
+
+    python -m lexigraph_py.persistence games/moves.log
+
+Record layout (little endian):
+    header  kind:u8  time:f64  length:u32
+    BOARD   width:u16 height:u16 letters[width*height]
+    JOIN    pid:str name:str
+    LEAVE   pid:str
+    MOVE    pid:str score:i32 steps:u16 (x:u16 y:u16)*steps
+where str is a u16 length followed by UTF-8 bytes.
+"""
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexigraph_py.game import Grid, LexigraphGame, Player
+
+LOG_MAGIC = b"LXGLOG2\n"  # 2: 16-bit coordinates, 32-bit scores
+SNAPSHOT_MAGIC = b"LXGSNP1\n"
+
+BOARD, JOIN, LEAVE, MOVE = 1, 2, 3, 4
+KIND_NAMES = {BOARD: "board", JOIN: "join", LEAVE: "leave", MOVE: "move"}
+
+RECORD_HEADER = struct.Struct("<BdI")
+U16 = struct.Struct("<H")
+SNAPSHOT_HEADER = struct.Struct("<QQHHH")  # seq, log offset, width, height, players
+MOVE_HEADER = struct.Struct("<iH")  # score, steps
+
+
+class Record(NamedTuple):
+    kind: int
+    time: float
+    data: Tuple[Any, ...]
+    end: int  # log offset just past this record
+
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return U16.pack(len(raw)) + raw
+
+
+def _unpack_str(buf: bytes, pos: int) -> Tuple[str, int]:
+    (length,) = U16.unpack_from(buf, pos)
+    pos += U16.size
+    return buf[pos:pos + length].decode("utf-8"), pos + length
+
+
+def _decode(kind: int, payload: bytes) -> Tuple[Any, ...]:
+    if kind == BOARD:
+        width, height = struct.unpack_from("<HH", payload)
+        return width, height, bytes(payload[4:4 + width * height])
+    pid, pos = _unpack_str(payload, 0)
+    if kind == JOIN:
+        name, _ = _unpack_str(payload, pos)
+        return pid, name
+    if kind == LEAVE:
+        return (pid,)
+    if kind == MOVE:
+        score, steps = MOVE_HEADER.unpack_from(payload, pos)
+        pos += MOVE_HEADER.size
+        flat = struct.unpack_from(f"<{2 * steps}H", payload, pos)
+        path = [{"x": flat[2 * i], "y": flat[2 * i + 1]} for i in range(steps)]
+        return pid, score, path
+    raise ValueError(f"unknown record kind {kind}")
+
+
+def read_log(path: str, offset: int = 0) -> Iterator[Record]:
+    """
+    Yield records from `offset` on (0 means the start of the file). A record
+    cut short by a crash mid-write ends the iteration instead of raising.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(LOG_MAGIC)) != LOG_MAGIC:
+            raise ValueError(f"{path} is not a Lexigraph move log")
+        if offset:
+            f.seek(offset)
+        pos = f.tell()
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            kind, stamp, length = RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            pos += RECORD_HEADER.size + length
+            yield Record(kind, stamp, _decode(kind, payload), pos)
+
+
+class MoveLog:
+    """Append-only writer. Call `close()` (or use as a context manager) when done."""
+
+    def __init__(self, path: str, fsync: bool = False, valid_end: Optional[int] = None):
+        self.path = path
+        self.fsync = fsync
+        fresh = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not fresh:
+            self._truncate_torn_tail(path, valid_end)
+        self.file: BinaryIO = open(path, "ab")
+        if fresh:
+            self.file.write(LOG_MAGIC)
+            self.file.flush()
+
+    @staticmethod
+    def _truncate_torn_tail(path: str, end: Optional[int]) -> None:
+        # Drop a half-written last record so new records append cleanly.
+        # `end` (from a replay that just read the log) saves rescanning it.
+        if end is None:
+            end = len(LOG_MAGIC)
+            for record in read_log(path):
+                end = record.end
+        if end < os.path.getsize(path):
+            os.truncate(path, end)
+
+    def offset(self) -> int:
+        return self.file.tell()
+
+    def _append(self, kind: int, payload: bytes) -> None:
+        self.file.write(RECORD_HEADER.pack(kind, time.time(), len(payload)) + payload)
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+
+    def board(self, grid: Grid) -> None:
+        self._append(BOARD, struct.pack("<HH", grid.width, grid.height) + bytes(grid.letters))
+
+    def join(self, pid: str, name: str) -> None:
+        self._append(JOIN, _pack_str(pid) + _pack_str(name))
+
+    def leave(self, pid: str) -> None:
+        self._append(LEAVE, _pack_str(pid))
+
+    def move(self, pid: str, coords: List[Dict[str, int]], score: int) -> None:
+        path = struct.pack(f"<{2 * len(coords)}H", *(v for c in coords for v in (c["x"], c["y"])))
+        self._append(MOVE, _pack_str(pid) + MOVE_HEADER.pack(score, len(coords)) + path)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "MoveLog":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def write_snapshot(game: LexigraphGame, path: str, log_offset: int) -> None:
+    """Atomically replace `path` with the current game state. Call with the game lock held."""
+    grid = game.grid
+    parts = [
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_HEADER.pack(game.seq, log_offset, grid.width, grid.height, len(game.players)),
+        bytes(grid.letters),
+        grid.owners.tobytes(),
+    ]
+    for player in game.players.values():
+        parts += [_pack_str(player.id), _pack_str(player.name), _pack_str(player.color),
+                  struct.pack("<Hi", player.index, player.score)]
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"".join(parts))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_snapshot(game: LexigraphGame, path: str) -> int:
+    """Load a snapshot into a fresh game; returns the log offset it covers."""
+    with open(path, "rb") as f:
+        buf = f.read()
+    if not buf.startswith(SNAPSHOT_MAGIC):
+        raise ValueError(f"{path} is not a Lexigraph snapshot")
+    pos = len(SNAPSHOT_MAGIC)
+    seq, offset, width, height, count = SNAPSHOT_HEADER.unpack_from(buf, pos)
+    pos += SNAPSHOT_HEADER.size
+    cells = width * height
+
+    grid = Grid(width, height)
+    grid.load_letters(buf[pos:pos + cells])
+    pos += cells
+    owners = array("h")
+    owners.frombytes(buf[pos:pos + 2 * cells])
+    pos += 2 * cells
+
+    game.players.clear()
+    game.used_colors.clear()
+    by_index: Dict[int, Player] = {}
+    for _ in range(count):
+        pid, pos = _unpack_str(buf, pos)
+        name, pos = _unpack_str(buf, pos)
+        color, pos = _unpack_str(buf, pos)
+        index, score = struct.unpack_from("<Hi", buf, pos)
+        pos += 6
+        player = Player(pid, name, color, index)
+        player.score = score
+        game.players[pid] = player
+        game.used_colors.add(color)
+        by_index[index] = player
+
+    # Re-assign through the grid so the owned sets and territory stay in sync
+    for index, player in by_index.items():
+        grid.assign([cell for cell in range(cells) if owners[cell] == index], player)
+
+    game.grid = grid
+    game.seq = seq
+    return offset
+
+
+def replay(game: LexigraphGame, records: Iterator[Record]) -> Tuple[int, Optional[int]]:
+    """
+    Apply log records to `game` (journal detached). Returns how many were
+    applied and the offset after the last one (None if there were none).
+    Moves are applied with their logged path and score, not re-validated:
+    the dictionary may have changed since they were played.
+    """
+    applied, end = 0, None
+    for record in records:
+        end = record.end
+        if record.kind == BOARD:
+            width, height, letters = record.data
+            game.grid = Grid(width, height)
+            game.grid.load_letters(letters)
+        elif record.kind == JOIN:
+            game.add_player(*record.data)
+        elif record.kind == LEAVE:
+            game.remove_player(record.data[0])
+        elif record.kind == MOVE:
+            pid, score, path = record.data
+            game.apply_move(pid, path, score)
+        applied += 1
+    return applied, end
+
+
+class GameJournal:
+    """
+    Hooks a LexigraphGame to a move log in `directory`. `open()` restores
+    whatever the directory holds, then attaches so new changes are recorded.
+    """
+
+    def __init__(self, game: LexigraphGame, directory: str, snapshot_every: int = 256,
+                 fsync: bool = False):
+        self.game = game
+        self.directory = directory
+        self.log_path = os.path.join(directory, "moves.log")
+        self.snapshot_path = os.path.join(directory, "snapshot.bin")
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.log: Optional[MoveLog] = None
+        self.since_snapshot = 0
+
+    @classmethod
+    def open(cls, game: LexigraphGame, directory: str, **kwargs: Any) -> "GameJournal":
+        journal = cls(game, directory, **kwargs)
+        journal.restore()
+        return journal
+
+    def restore(self) -> int:
+        """Rebuild the game from disk and start recording; returns records replayed."""
+        os.makedirs(self.directory, exist_ok=True)
+        with self.game.lock:
+            self.game.journal = None
+            offset = 0
+            if os.path.exists(self.snapshot_path) and os.path.exists(self.log_path):
+                offset = load_snapshot(self.game, self.snapshot_path)
+            replayed, end = 0, None
+            if os.path.exists(self.log_path) and os.path.getsize(self.log_path):
+                replayed, end = replay(self.game, read_log(self.log_path, offset))
+                end = end or offset or len(LOG_MAGIC)
+
+            self.log = MoveLog(self.log_path, fsync=self.fsync, valid_end=end)
+            if self.log.offset() == len(LOG_MAGIC):
+                # New log: record the letters so it can be replayed on its own
+                self.log.board(self.game.grid)
+            self.game.journal = self
+            self.since_snapshot = replayed
+            if replayed:
+                self.snapshot()
+            return replayed
+
+    def snapshot(self) -> None:
+        with self.game.lock:
+            write_snapshot(self.game, self.snapshot_path, self.log.offset())
+            self.since_snapshot = 0
+
+    def _recorded(self) -> None:
+        # Called with the game lock held, right after a record was appended
+        self.since_snapshot += 1
+        if self.since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def join(self, pid: str, name: str) -> None:
+        self.log.join(pid, name)
+        self._recorded()
+
+    def leave(self, pid: str) -> None:
+        self.log.leave(pid)
+        self._recorded()
+
+    def move(self, pid: str, coords: List[Dict[str, int]], score: int) -> None:
+        self.log.move(pid, coords, score)
+        self._recorded()
+
+    def close(self) -> None:
+        with self.game.lock:
+            self.game.journal = None
+            if self.log:
+                self.snapshot()
+                self.log.close()
+                self.log = None
+
+
+def summarize(path: str) -> Dict[str, Any]:
+    """Counts and totals for a log, for quick offline analysis."""
+    counts = {name: 0 for name in KIND_NAMES.values()}
+    points: Dict[str, int] = {}
+    first = last = None
+    for record in read_log(path):
+        counts[KIND_NAMES[record.kind]] += 1
+        first = record.time if first is None else first
+        last = record.time
+        if record.kind == MOVE:
+            pid, score, _ = record.data
+            points[pid] = points.get(pid, 0) + score
+    duration = (last - first) if first is not None else 0.0
+    return {"records": counts, "duration": duration, "points": points}
+
+
+if __name__ == "__main__":
+    for log_path in sys.argv[1:] or ["moves.log"]:
+        summary = summarize(log_path)
+        print(f"{log_path}: {summary['records']} over {summary['duration']:.1f}s")
+        for pid, score in sorted(summary["points"].items(), key=lambda kv: -kv[1]):
+            print(f"  {pid:>24} {score:>6}")
@@ -1,59 +1,137 @@
 from flask import Flask, send_from_directory, request
 from flask_socketio import SocketIO, emit
+import argparse
+import logging
+import logging.handlers
 import os
+import queue
 import sys
+import time
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from lexigraph_py.assets import AssetStore
 from lexigraph_py.game import LexigraphGame
+from lexigraph_py.throttle import DeltaBatcher, TokenBucket
+
+# Handlers only enqueue log records; a listener thread does the slow I/O
+log = logging.getLogger('lexigraph')
+log_queue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(log_queue))
+log.setLevel(logging.INFO)
+log.propagate = False
+# Started by run_server; until then records just wait in the queue
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
 
 app = Flask(__name__, static_folder='static')
 socketio = SocketIO(app, cors_allowed_origins="*")
 
 game = LexigraphGame()
 
+# Sustained moves/sec per connection, far above human speed; 0 turns the
+# limit off (load tests that drive the server as fast as they can)
+MOVE_RATE = float(os.environ.get('LEXIGRAPH_MOVE_RATE', 5))
+MOVE_BURST = 10
+BROADCAST_WINDOW = 0.04 # seconds of deltas merged into one broadcast
+
+buckets = {} # sid -> TokenBucket
+
+# Clients get one full snapshot on connect (or when they ask to resync) and
+# compact deltas after that, so a move costs O(path) on the wire. Once the
+# server runs, deltas within BROADCAST_WINDOW are merged into one message.
+def broadcast_delta(delta):
+    socketio.emit('state_delta', delta)
+
+batcher = DeltaBatcher(broadcast_delta, BROADCAST_WINDOW)
+game.subscribe(batcher.add)
+
+# The controller bundle is hashed and precompressed once at startup; phones
+# cache the hashed files forever and only revalidate index.html on rejoin
+assets = AssetStore(os.path.join(app.root_path, 'static', 'controller'))
+
 @app.route('/')
 def index():
-    return send_from_directory('static/controller', 'index.html')
+    return serve_static('index.html')
 
 @app.route('/<path:path>')
 def serve_static(path):
-    return send_from_directory('static/controller', path)
+    response = assets.respond(path, request)
+    if response is None:
+        # Not in the startup snapshot (e.g. added while running)
+        return send_from_directory('static/controller', path)
+    return response
 
 @socketio.on('connect')
 def handle_connect():
-    print(f"Client connected: {request.sid}")
+    log.info("Client connected: %s", request.sid)
+    if MOVE_RATE > 0:
+        buckets[request.sid] = TokenBucket(MOVE_RATE, MOVE_BURST)
     # Send current state immediately on connect
-    emit('state_update', {'grid': game.grid.serialize()})
+    emit('state_update', game.snapshot())
+
+@socketio.on('resync')
+def handle_resync():
+    # Client saw a gap in delta sequence numbers
+    emit('state_update', game.snapshot())
 
 @socketio.on('join_game')
 def handle_join(name):
     player = game.add_player(request.sid, name)
-    print(f"Player joined: {name} ({player.color})")
+    log.info("Player joined: %s (%s)", name, player.color)
     emit('player_joined', {'id': player.id, 'name': player.name, 'color': player.color}, broadcast=True)
-    # Broadcast full state update to everyone
-    emit('state_update', {'grid': game.grid.serialize()}, broadcast=True)
 
 @socketio.on('submit_move')
 def handle_move(coords):
-    print(f"Move received from {request.sid}: {coords}")
+    bucket = buckets.get(request.sid)
+    if bucket is not None and not bucket.allow():
+        # Flooding: drop without validating and keep the reply tiny
+        log.debug("Rate limited move from %s", request.sid)
+        emit('move_result', {'success': False, 'message': "Too many moves, slow down",
+                             'rate_limited': True})
+        return
+    log.debug("Move received from %s: %s", request.sid, coords)
     result = game.process_move(request.sid, coords)
-    
+    # Successful moves reach everyone through broadcast_delta
     emit('move_result', result)
-    
-    if result['success']:
-        # Broadcast grid update to everyone
-        emit('state_update', {'grid': game.grid.serialize()}, broadcast=True)
+
+@socketio.on('request_hint')
+def handle_hint(limit=3):
+    # Only the asking player sees its suggestions
+    limit = max(1, min(int(limit) if isinstance(limit, int) else 3, 20))
+    emit('hint', {'moves': game.hint(request.sid, limit), 'exhausted': not game.has_moves()})
 
 @socketio.on('disconnect')
 def handle_disconnect():
-    print(f"Client disconnected: {request.sid}")
+    log.info("Client disconnected: %s", request.sid)
+    buckets.pop(request.sid, None)
     game.remove_player(request.sid)
-    emit('state_update', {'grid': game.grid.serialize()}, broadcast=True)
 
-def run_server(port=3000):
-    socketio.run(app, host='0.0.0.0', port=port)
+def run_server(port=3000, log_dir=None):
+    log_listener.start()
+    try:
+        journal = None
+        if log_dir:
+            # Restore the previous game (snapshot + log tail) before accepting clients
+            from lexigraph_py.persistence import GameJournal
+            start = time.perf_counter()
+            journal = GameJournal.open(game, log_dir)
+            log.info("Restored game from %s in %.1fms", log_dir, (time.perf_counter() - start) * 1000)
+        batcher.start(socketio.start_background_task, socketio.sleep)
+        try:
+            socketio.run(app, host='0.0.0.0', port=port)
+        finally:
+            batcher.stop()
+            if journal:
+                journal.close()
+    finally:
+        # Flushes whatever is still queued
+        log_listener.stop()
 
 if __name__ == '__main__':
-    run_server()
+    parser = argparse.ArgumentParser(description="Lexigraph game server")
+    parser.add_argument('--port', type=int, default=3000)
+    parser.add_argument('--log', metavar='DIR',
+                        help="persist moves and snapshots in DIR and restore from it on start")
+    args = parser.parse_args()
+    run_server(args.port, args.log)
@@ -0,0 +1,135 @@
+"""
+Board search for Lexigraph: every dictionary word that can be traced on a
+grid, found with a DFS over precomputed neighbour tables that stops as soon
+as the letters so far are not a prefix of any word (a trie walk).
+
+Results are cached on the Grid and keyed by its `letters_version`, which
+`set_tile` bumps, so the search runs once per board rather than once per
+move. Ownership changes don't invalidate anything: captures only change how
+moves *rank*, and ranking is a cheap pass over the cached paths.
+
+Used for hints, bots and detecting a board with no moves left.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+WORD = ""  # trie key holding the word that ends at a node
+MIN_LENGTH = 3
+MAX_PATHS_PER_WORD = 4  # alternative paths kept for ranking by steals
+
+Trie = dict
+Solutions = Dict[str, List[Tuple[int, ...]]]
+
+
+def build_trie(words: Iterable[str], min_length: int = MIN_LENGTH) -> Trie:
+    root: Trie = {}
+    for word in words:
+        word = word.upper()
+        if len(word) < min_length or not word.isalpha():
+            continue
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[WORD] = word
+    return root
+
+
+@lru_cache(maxsize=1)
+def default_trie() -> Trie:
+    """Trie over the game's DICTIONARY, built on first use."""
+    from .game import DICTIONARY
+    return build_trie(DICTIONARY)
+
+
+@lru_cache(maxsize=None)
+def neighbour_table(width: int, height: int) -> Tuple[Tuple[int, ...], ...]:
+    """8-way neighbours of every cell (row-major), shared by all grids of a size."""
+    table = []
+    for cell in range(width * height):
+        x, y = cell % width, cell // width
+        table.append(tuple(
+            (y + dy) * width + x + dx
+            for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+            if (dx or dy) and 0 <= x + dx < width and 0 <= y + dy < height
+        ))
+    return tuple(table)
+
+
+def search(letters: str, width: int, height: int, trie: Trie,
+           max_paths: int = MAX_PATHS_PER_WORD) -> Solutions:
+    """All words on a row-major board -> up to `max_paths` cell paths each."""
+    table = neighbour_table(width, height)
+    found: Solutions = {}
+    used = [False] * (width * height)
+    path: List[int] = []
+
+    def walk(cell: int, node: Trie) -> None:
+        used[cell] = True
+        path.append(cell)
+        word = node.get(WORD)
+        if word is not None:
+            paths = found.setdefault(word, [])
+            if len(paths) < max_paths:
+                paths.append(tuple(path))
+        for n in table[cell]:
+            if not used[n]:
+                child = node.get(letters[n])
+                if child is not None:
+                    walk(n, child)
+        used[cell] = False
+        path.pop()
+
+    for cell in range(width * height):
+        child = trie.get(letters[cell])
+        if child is not None:
+            walk(cell, child)
+    return found
+
+
+def find_words(rows: Sequence[str], trie: Trie) -> Solutions:
+    """`search` for a board given as rows of letters (e.g. a Boggle board)."""
+    height = len(rows)
+    width = len(rows[0]) if rows else 0
+    return search("".join(rows).upper(), width, height, trie)
+
+
+def solve(grid, trie: Optional[Trie] = None) -> Solutions:
+    """Every word on `grid`, cached until its letters change."""
+    trie = default_trie() if trie is None else trie
+    key = (grid.letters_version, id(trie))
+    cached = grid.solutions
+    if cached is None or cached[0] != key:
+        words = search(grid.letters.decode("ascii"), grid.width, grid.height, trie)
+        # The trie is kept alive with the result so its id can't be reused
+        cached = grid.solutions = (key, words, trie)
+    return cached[1]
+
+
+def rank(grid, owner: int, limit: Optional[int] = None,
+         trie: Optional[Trie] = None) -> List[dict]:
+    """
+    Moves for `owner` (an owner index), best first, scored like
+    `LexigraphGame.process_move`: 10 per letter plus 5 per tile stolen.
+    Ties go to moves claiming more tiles the player doesn't hold yet.
+    """
+    owners, free = grid.owners, grid.NO_OWNER
+    width = grid.width
+    moves = []
+    for word, paths in solve(grid, trie).items():
+        best = None
+        for path in paths:
+            steals = sum(1 for c in path if owners[c] != free and owners[c] != owner)
+            gained = sum(1 for c in path if owners[c] != owner)
+            candidate = (len(word) * 10 + 5 * steals, gained, path)
+            if best is None or candidate[:2] > best[:2]:
+                best = candidate
+        score, gained, path = best
+        moves.append((score, gained, word, path))
+    moves.sort(key=lambda m: (-m[0], -m[1], m[2]))
+    if limit is not None:
+        moves = moves[:limit]
+    return [
+        {'word': word, 'score': score, 'gained': gained,
+         'path': [{'x': c % width, 'y': c // width} for c in path]}
+        for score, gained, word, path in moves
+    ]
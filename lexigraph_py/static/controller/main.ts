@@ -69,18 +69,22 @@ function renderGame() {
         }
     });
 
-    socket.on('state_update', (state: any) => {
-        if (!activeGrid) return;
+    // Local copy of the board; the server sends one snapshot, then deltas
+    let seq = -1;
+    let rows: any[][] = [];
+    const owners = new Map<number, { id: string, color: string }>();
+
+    const renderBoard = () => {
+        if (!activeGrid || rows.length === 0) return;
 
-        const rows = state.grid;
         const height = rows.length;
         const width = rows[0].length;
-        
-        const cells = rows.map((row: any[], y: number) => 
+
+        const cells = rows.map((row: any[], y: number) =>
           row.map((tile: any, x: number) => ({
             id: `${x}-${y}`,
             char: tile.char,
-            value: 1, 
+            value: 1,
             ownerId: tile.ownerId,
             locked: false
           }))
@@ -88,6 +92,42 @@ function renderGame() {
 
         const board: Board = { width, height, cells };
         activeGrid.render(board);
+    };
+
+    socket.on('state_update', (state: any) => {
+        seq = state.seq;
+        rows = state.grid;
+        owners.clear();
+        (state.players || []).forEach((p: any) => owners.set(p.index, { id: p.id, color: p.color }));
+        renderBoard();
+    });
+
+    socket.on('state_delta', (delta: any) => {
+        if (delta.seq <= seq) return; // already covered by the snapshot
+        // Deltas may be merged server-side: `base` is the seq they build on.
+        // Their values are absolute, so any base up to our seq is safe.
+        const base = delta.base ?? delta.seq - 1;
+        if (base > seq) {
+            // Missed an update; ask for a fresh snapshot
+            seq = Infinity;
+            socket.emit('resync');
+            return;
+        }
+        seq = delta.seq;
+
+        // left before joined: an owner index can be reused within one batch
+        (delta.left || []).forEach((index: number) => owners.delete(index));
+        (delta.joined || []).forEach((p: any) => owners.set(p.index, { id: p.id, color: p.color }));
+        (delta.tiles || []).forEach(([x, y, owner]: [number, number, number | null]) => {
+            const info = owner === null ? undefined : owners.get(owner);
+            rows[y][x] = {
+                ...rows[y][x],
+                ownerId: info ? info.id : null,
+                ownerColor: info ? info.color : null
+            };
+        });
+
+        if (delta.tiles && delta.tiles.length) renderBoard();
     });
 }
 
@@ -0,0 +1,158 @@
+"""
+Incremental connected-territory tracking for Lexigraph.
+
+Regions are groups of tiles with the same owner connected 8-way (the same
+adjacency as word paths). Captures merge regions with union-find; a steal
+can split the victim's region, so the surviving pieces are relabelled by a
+BFS seeded from the stolen cells' neighbours, which only touches the
+regions that actually lost tiles.
+
+Per-owner stats (tiles, region count, largest region) are kept up to date
+after every change, so reading them is O(1).
+"""
+from array import array
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence
+
+NO_OWNER = -1
+
+
+class TerritoryTracker:
+    def __init__(self, width: int, height: int, owners: Sequence[int],
+                 neighbours: Callable[[int], Iterator[int]]):
+        self.width = width
+        self.height = height
+        self.owners = owners  # the grid's owner array, read-only here
+        self.neighbours = neighbours
+        cells = width * height
+        self.parent = array('i', range(cells))
+        self.size = array('i', [1]) * cells  # valid at roots only
+        self.tiles: List[int] = []
+        self.region_count: List[int] = []
+        self.largest: List[int] = []
+        self.sizes: List[Counter] = []  # owner -> {region size: how many}
+
+    # --- stats -----------------------------------------------------------
+
+    def stats(self, owner: int) -> Dict[str, int]:
+        if owner >= len(self.tiles):
+            return {'tiles': 0, 'regions': 0, 'largest_region': 0}
+        return {
+            'tiles': self.tiles[owner],
+            'regions': self.region_count[owner],
+            'largest_region': self.largest[owner],
+        }
+
+    # --- updates ---------------------------------------------------------
+
+    def claimed(self, owner: int, cells: Iterable[int]) -> None:
+        """Cells just assigned to `owner` (the grid's owner array is already updated)."""
+        self._ensure(owner)
+        sizes = self.sizes[owner]
+        cells = list(cells)
+        # Every new cell starts as its own region before any merging, so a
+        # neighbour claimed in the same batch never has a stale parent
+        for cell in cells:
+            self.parent[cell] = cell
+            self.size[cell] = 1
+            self.tiles[owner] += 1
+            self.region_count[owner] += 1
+            sizes[1] += 1
+        if cells and self.largest[owner] == 0:
+            self.largest[owner] = 1
+        for cell in cells:
+            for n in self.neighbours(cell):
+                if self.owners[n] == owner:
+                    self._union(owner, cell, n)
+
+    def released(self, owner: int, cells: List[int]) -> None:
+        """
+        Cells just taken away from `owner`. Must be called before `claimed`
+        reuses them, since the old roots are looked up through their parents.
+        """
+        if owner >= len(self.tiles) or not cells:
+            return
+        sizes = self.sizes[owner]
+        removed = set(cells)
+
+        # Retire every region that lost at least one tile...
+        roots = {self._find(cell) for cell in cells}
+        for root in roots:
+            sizes[self.size[root]] -= 1
+            self.region_count[owner] -= 1
+        self.tiles[owner] -= len(removed)
+
+        # ...and re-add whatever is left of them as fresh regions
+        seeds = {n for cell in removed for n in self.neighbours(cell)
+                 if self.owners[n] == owner}
+        seen: set = set()
+        for seed in seeds:
+            if seed in seen:
+                continue
+            seen.add(seed)
+            piece, frontier = [seed], [seed]
+            while frontier:
+                cell = frontier.pop()
+                for n in self.neighbours(cell):
+                    if n not in seen and self.owners[n] == owner:
+                        seen.add(n)
+                        piece.append(n)
+                        frontier.append(n)
+            for cell in piece:
+                self.parent[cell] = seed
+            self.size[seed] = len(piece)
+            sizes[len(piece)] += 1
+            self.region_count[owner] += 1
+
+        self._refresh_largest(owner)
+
+    def reset_owner(self, owner: int) -> None:
+        """Owner left the game and all its cells were freed."""
+        if owner < len(self.tiles):
+            self.tiles[owner] = 0
+            self.region_count[owner] = 0
+            self.largest[owner] = 0
+            self.sizes[owner].clear()
+
+    # --- internals -------------------------------------------------------
+
+    def _ensure(self, owner: int) -> None:
+        while owner >= len(self.tiles):
+            self.tiles.append(0)
+            self.region_count.append(0)
+            self.largest.append(0)
+            self.sizes.append(Counter())
+
+    def _find(self, cell: int) -> int:
+        parent = self.parent
+        root = cell
+        while parent[root] != root:
+            root = parent[root]
+        while parent[cell] != root:  # path compression
+            parent[cell], cell = root, parent[cell]
+        return root
+
+    def _union(self, owner: int, a: int, b: int) -> None:
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        sizes = self.sizes[owner]
+        sizes[self.size[ra]] -= 1
+        sizes[self.size[rb]] -= 1
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        sizes[self.size[ra]] += 1
+        self.region_count[owner] -= 1
+        if self.size[ra] > self.largest[owner]:
+            self.largest[owner] = self.size[ra]
+
+    def _refresh_largest(self, owner: int) -> None:
+        sizes = self.sizes[owner]
+        if sizes[self.largest[owner]] > 0:
+            return
+        # Only reached when the largest region itself shrank; distinct sizes are few
+        for size in [s for s, n in sizes.items() if n <= 0]:
+            del sizes[size]
+        self.largest[owner] = max(sizes, default=0)
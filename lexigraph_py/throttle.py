@@ -0,0 +1,124 @@
+"""
+Flood control for the Lexigraph server.
+
+`TokenBucket` caps how fast one connection may submit moves. `DeltaBatcher`
+merges the deltas published within a short tick window into a single
+broadcast, so a burst of moves costs every client one message instead of
+one per move.
+
+A merged delta carries `base`, the seq it applies on top of, next to `seq`,
+the last change it covers. Every field holds absolute values (who owns a
+tile now, a player's total score now), so applying a delta whose base is at
+or before the client's seq is safe; only base > seq means a gap.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class TokenBucket:
+    """`rate` tokens per second, holding at most `burst`."""
+    __slots__ = ('rate', 'burst', 'tokens', 'stamp', 'clock')
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.clock = clock
+        self.stamp = clock()
+
+    def allow(self, cost: float = 1.0) -> bool:
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True
+        return False
+
+
+class DeltaBatcher:
+    """
+    Collects game deltas (see LexigraphGame) and emits them merged, at most
+    once per `window` seconds. Until `start()` runs the ticker, every delta
+    is emitted straight away (still with `base`), which keeps embedding and
+    tests synchronous.
+    """
+
+    def __init__(self, emit: Callable[[dict], Any], window: float = 0.04):
+        self.emit = emit
+        self.window = window
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock() # keeps emits in seq order
+        self.running = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self.base: Optional[int] = None
+        self.seq = 0
+        self.tiles: Dict[tuple, Any] = {}
+        self.scores: Dict[int, int] = {}
+        self.joined: Dict[int, dict] = {}
+        self.left: Dict[int, None] = {}  # ordered set
+
+    def add(self, delta: dict) -> None:
+        with self.lock:
+            if self.base is None:
+                self.base = delta['seq'] - 1
+            self.seq = delta['seq']
+            for index in delta.get('left', ()):
+                # A leave cancels anything pending for that owner index
+                self.joined.pop(index, None)
+                self.scores.pop(index, None)
+                self.left[index] = None
+            for info in delta.get('joined', ()):
+                self.joined[info['index']] = info
+                self.scores.pop(info['index'], None)
+            for x, y, owner in delta.get('tiles', ()):
+                self.tiles[(x, y)] = owner
+            for index, score in delta.get('scores', ()):
+                self.scores[index] = score
+            immediate = not self.running
+        if immediate:
+            self.flush()
+
+    def take(self) -> Optional[dict]:
+        """The merged delta so far (None if nothing happened), and start a new one."""
+        with self.lock:
+            if self.base is None:
+                return None
+            merged: Dict[str, Any] = {'base': self.base, 'seq': self.seq}
+            # Clients apply left -> joined -> tiles -> scores, so owner
+            # indices reused inside one window resolve to the new player
+            if self.left:
+                merged['left'] = list(self.left)
+            if self.joined:
+                merged['joined'] = list(self.joined.values())
+            if self.tiles:
+                merged['tiles'] = [[x, y, owner] for (x, y), owner in self.tiles.items()]
+            if self.scores:
+                merged['scores'] = [[index, score] for index, score in self.scores.items()]
+            self._reset()
+            return merged
+
+    def flush(self) -> None:
+        with self.flush_lock:
+            merged = self.take()
+            if merged is not None:
+                self.emit(merged)
+
+    def start(self, spawn: Callable[..., Any], sleep: Callable[[float], Any]) -> None:
+        """Run the flush ticker with the server's task primitives (e.g. socketio's)."""
+        if self.running:
+            return
+        self.running = True
+        spawn(self._tick, sleep)
+
+    def _tick(self, sleep: Callable[[float], Any]) -> None:
+        while self.running:
+            sleep(self.window)
+            self.flush()
+
+    def stop(self) -> None:
+        self.running = False
+        self.flush()
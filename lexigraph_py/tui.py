@@ -8,69 +8,84 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.live import Live
 from rich.align import Align
+from rich.text import Text
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from lexigraph_py.game import LexigraphGame
 from lexigraph_py.server import run_server, game as server_game
 
+MIN_FRAME_INTERVAL = 0.1 # cap redraws at 10/s however fast moves arrive
+
 class LexigraphTUI:
-    def __init__(self):
+    """
+    Redraws only when the game publishes a change (or the console resizes):
+    `run` blocks in `game.wait_for_change` and refreshes Live by hand.
+    Cell renderables are cached per (letter, owner colour), so a frame reuses
+    the Text objects of every tile that looks the same as before.
+    """
+    def __init__(self, game=None):
         self.console = Console()
-        self.game = server_game # Use the shared game instance from server module
+        self.game = game or server_game # Default: the shared game instance from server module
+        self.cells = {} # (char, owner colour) -> Text
+        self.leaderboard = None
+        self.leaderboard_rows = None
         self.layout = Layout()
-        
-    def generate_grid_table(self):
+        self.layout.split_row(
+            Layout(name="grid", ratio=2),
+            Layout(name="sidebar", ratio=1)
+        )
+
+    def cell(self, char, color):
+        key = (char, color)
+        text = self.cells.get(key)
+        if text is None:
+            # Make it look like a block; owned tiles get black text on the owner's colour
+            style = f"black on {color}" if color else "white on black"
+            text = self.cells[key] = Text(f"   \n {char} \n   ", style=style)
+        return text
+
+    def generate_grid_table(self, letters, owners, colors, width, height):
         table = Table(show_header=False, show_edge=False, padding=0, expand=True)
-        
-        # Add columns
-        for _ in range(self.game.grid.width):
+        for _ in range(width):
             table.add_column(justify="center")
-            
-        for y in range(self.game.grid.height):
-            cells = []
-            for x in range(self.game.grid.width):
-                tile = self.game.grid.get_tile(x, y)
-                color = "white"
-                bg_color = "black"
-                
-                if tile.owner:
-                    # Convert hex to generic color name or leave as hex if rich supports it (it does usually)
-                    # Mapping generic hexes to rich colors for better compatibility if needed
-                    # but rich handles hex like #FF0055 directly.
-                    color = "black" # Text color on colored tile
-                    bg_color = tile.owner.color
-                
-                cell_content = f"[{color} on {bg_color}] {tile.char} [/{color} on {bg_color}]"
-                # Make it look like a block
-                cell_block = f"[{color} on {bg_color}]   \n {tile.char} \n   [/{color} on {bg_color}]"
-                cells.append(cell_block)
-            table.add_row(*cells)
-            # Add spacer row?
-            
+        for y in range(height):
+            base = y * width
+            table.add_row(*[
+                self.cell(letters[i], colors[owners[i]] if owners[i] >= 0 else None)
+                for i in range(base, base + width)
+            ])
         return Panel(Align.center(table), title="Lexigraph Grid", border_style="green")
 
-    def generate_leaderboard(self):
+    def generate_leaderboard(self, rows):
+        # Unchanged standings (most moves just touch the board) reuse the panel
+        if rows == self.leaderboard_rows:
+            return self.leaderboard
         table = Table(title="Leaderboard", expand=True)
         table.add_column("Rank", justify="right", style="cyan", no_wrap=True)
         table.add_column("Player", style="magenta")
         table.add_column("Score", justify="right", style="green")
-
-        sorted_players = sorted(self.game.players.values(), key=lambda p: p.score, reverse=True)
-        
-        for i, player in enumerate(sorted_players):
-            table.add_row(str(i+1), f"[{player.color}]{player.name}[/]", str(player.score))
-            
-        return Panel(table, title="Scores", border_style="blue")
+        table.add_column("Region", justify="right", style="yellow")
+        for i, (name, color, score, region) in enumerate(rows):
+            table.add_row(str(i+1), f"[{color}]{name}[/]", str(score), str(region))
+        self.leaderboard_rows = rows
+        self.leaderboard = Panel(table, title="Scores", border_style="blue")
+        return self.leaderboard
 
     def make_layout(self):
-        self.layout.split_row(
-            Layout(name="grid", ratio=2),
-            Layout(name="sidebar", ratio=1)
-        )
-        self.layout["grid"].update(self.generate_grid_table())
-        self.layout["sidebar"].update(self.generate_leaderboard())
+        # Copy what a frame needs under the lock, build renderables outside it
+        with self.game.lock:
+            grid = self.game.grid
+            letters = grid.letters.decode('ascii')
+            owners = grid.owners.tolist()
+            colors = [p.color if p else None for p in grid.owner_table]
+            width, height = grid.width, grid.height
+            players = sorted(self.game.players.values(), key=lambda p: p.score, reverse=True)
+            # Largest connected territory, read straight from the tracker
+            rows = tuple((p.name, p.color, p.score, grid.territory.stats(p.index)['largest_region'])
+                         for p in players)
+        self.layout["grid"].update(self.generate_grid_table(letters, owners, colors, width, height))
+        self.layout["sidebar"].update(self.generate_leaderboard(rows))
         return self.layout
 
     def run(self):
@@ -80,10 +95,19 @@ class LexigraphTUI:
         
         self.console.clear()
         
-        with Live(self.make_layout(), refresh_per_second=4, screen=True) as live:
+        seq = None
+        size = None
+        with Live(self.make_layout(), console=self.console, auto_refresh=False, screen=True) as live:
             while True:
-                live.update(self.make_layout())
-                time.sleep(0.25)
+                # Sleeps until a move/join/leave is published; the timeout
+                # only lets us notice terminal resizes
+                latest = self.game.wait_for_change(seq, timeout=1.0)
+                if latest == seq and self.console.size == size:
+                    continue
+                seq, size = latest, self.console.size
+                live.update(self.make_layout(), refresh=True)
+                # Moves landing while we draw are picked up together next frame
+                time.sleep(MIN_FRAME_INTERVAL)
 
 if __name__ == "__main__":
     tui = LexigraphTUI()
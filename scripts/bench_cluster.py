@@ -0,0 +1,116 @@
+"""
+Throughput benchmark for the sharded Boggle cluster (boggle/cluster.py).
+
+For each worker count it starts a cluster, opens a batch of rooms, then runs
+client processes hammering /submit and /state across those rooms on
+keep-alive connections. Prints requests/sec and the speedup over one worker.
+
+    python scripts/bench_cluster.py --max-workers 4 --duration 5
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLUSTER = os.path.join(ROOT_DIR, "boggle", "cluster.py")
+
+
+def wait_for_port(port: int, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"cluster did not open port {port}")
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str,
+            payload: Optional[dict] = None) -> bytes:
+    body = json.dumps(payload) if payload is not None else None
+    headers = {"Content-Type": "application/json"} if body else {}
+    conn.request(method, path, body=body, headers=headers)
+    return conn.getresponse().read()
+
+
+def client(port: int, rooms: List[str], duration: float, counter) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    done = 0
+    stop = time.monotonic() + duration
+    name = f"bench{os.getpid()}"
+    for code in rooms:
+        request(conn, "POST", f"/room/{code}/join", {"name": name})
+    while time.monotonic() < stop:
+        code = random.choice(rooms)
+        request(conn, "POST", f"/room/{code}/submit", {"name": name, "word": f"W{done}"})
+        request(conn, "GET", f"/room/{code}/state")
+        done += 2
+    with counter.get_lock():
+        counter.value += done
+
+
+def run(workers: int, clients: int, rooms: int, duration: float, port: int) -> float:
+    proc = subprocess.Popen(
+        [sys.executable, CLUSTER, "--workers", str(workers), "--routers", str(workers),
+         "--host", "127.0.0.1", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port)
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        codes = [json.loads(request(conn, "POST", "/rooms"))["room"] for _ in range(rooms)]
+        for code in codes:
+            request(conn, "POST", f"/room/{code}/start")
+
+        counter = multiprocessing.Value("l", 0)
+        procs = [
+            multiprocessing.Process(target=client, args=(port, codes, duration, counter))
+            for _ in range(clients)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        return counter.value / duration
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Boggle cluster scaling benchmark")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--clients", type=int, default=0,
+                        help="load processes (default: 2 per worker)")
+    parser.add_argument("--rooms", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--port", type=int, default=8190)
+    args = parser.parse_args()
+
+    counts, n = [], 1
+    while n <= args.max_workers:
+        counts.append(n)
+        n *= 2
+    if counts[-1] != args.max_workers:
+        counts.append(args.max_workers)
+
+    print(f"{'workers':>7} {'clients':>7} {'req/s':>10} {'speedup':>8}")
+    baseline = None
+    for i, workers in enumerate(counts):
+        clients = args.clients or 2 * workers
+        rate = run(workers, clients, args.rooms, args.duration, args.port + i)
+        baseline = baseline or rate
+        print(f"{workers:>7} {clients:>7} {rate:>10.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
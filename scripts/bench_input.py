@@ -0,0 +1,55 @@
+"""
+Publish-to-receive latency on the engine's input bus.
+
+Starts an InputBus on a temporary socket, connects a publisher and
+--subscribers subscribers, and times --events round trips: each event is
+published and then read by every subscriber. Reports p50/p99/max of the
+time until the last subscriber has it.
+
+    python scripts/bench_input.py --events 5000 --subscribers 4
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from engine.input import InputBus, InputClient  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Input bus latency benchmark")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--subscribers", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bus = InputBus(os.path.join(tmp, "input.sock")).start()
+        subscribers = [InputClient.connect(bus.socket_path, topics=["key"])
+                       for _ in range(args.subscribers)]
+        publisher = InputClient.connect(bus.socket_path)
+        latencies = []
+        for _ in range(args.events):
+            start = time.perf_counter()
+            publisher.publish("key", key="a")
+            for sub in subscribers:
+                if sub.recv(timeout=1) is None:
+                    sys.exit("event lost")
+            latencies.append(time.perf_counter() - start)
+        for client in subscribers + [publisher]:
+            client.close()
+        bus.stop()
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{args.events} events to {args.subscribers} subscriber(s): "
+          f"p50 {statistics.median(latencies) * 1e6:.0f}us  p99 {p99 * 1e6:.0f}us  "
+          f"max {latencies[-1] * 1e6:.0f}us  bus dropped {bus.dropped}")
+
+
+if __name__ == "__main__":
+    main()
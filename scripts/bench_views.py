@@ -0,0 +1,84 @@
+"""
+Requests/sec for the Boggle view routes, before and after template caching.
+
+"before" re-creates the old handlers on a side route: the same inline
+templates, compiled by render_template_string on every request. "after" hits
+the real routes. Both go through Flask's test client in-process, so the
+numbers are handler + framework cost without any network.
+
+    python scripts/bench_views.py --duration 2
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+from flask import render_template_string  # noqa: E402
+from markupsafe import Markup  # noqa: E402
+from qr import qr_svg  # noqa: E402
+
+import server  # noqa: E402
+from server import app, game  # noqa: E402
+
+
+def add_baseline_routes() -> None:
+    @app.route("/_before/view/timer")
+    def before_timer():
+        state = game.to_json()
+        return render_template_string(server.TIMER_HTML, state=state["state"],
+                                      time=state["time_remaining"], timer_end=state["timer_end"])
+
+    @app.route("/_before/view/leaderboard")
+    def before_leaderboard():
+        players = [{"name": n, "score": p["score"]} for n, p in game.to_json()["players"].items()]
+        return render_template_string(server.LEADERBOARD_HTML, players=players)
+
+    @app.route("/_before/view/join")
+    def before_join():
+        url = server.join_url()
+        return render_template_string(server.JOIN_HTML, url=url, qr=Markup(qr_svg(url)))
+
+    @app.route("/_before/controller")
+    def before_controller():
+        return render_template_string(server.CONTROLLER_HTML)
+
+
+def rate(fetch: Callable[[], object], duration: float) -> float:
+    done = 0
+    stop = time.perf_counter() + duration
+    while time.perf_counter() < stop:
+        fetch()
+        done += 1
+    return done / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Boggle view route benchmark")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per measurement")
+    args = parser.parse_args()
+
+    add_baseline_routes()
+    client = app.test_client()
+    game.start_game()
+
+    print(f"{'route':<18} {'before':>10} {'after':>10} {'after+304':>10} {'speedup':>8}")
+    for path in ("/view/timer", "/view/leaderboard", "/view/join", "/controller"):
+        before = rate(lambda: client.get("/_before" + path), args.duration)
+        after = rate(lambda: client.get(path), args.duration)
+        etag = client.get(path).headers.get("ETag")
+        if etag:
+            # What a browser with the page cached actually costs us
+            revalidate = rate(lambda: client.get(path, headers={"If-None-Match": etag}),
+                              args.duration)
+            cached = f"{revalidate:>10.0f}"
+        else:
+            cached = f"{'-':>10}"
+        print(f"{path:<18} {before:>10.0f} {after:>10.0f} {cached} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Load test for the Boggle server.
+
+Simulates a party: N phones joining and submitting words, plus TV windows
+polling /state, each on its own persistent (keep-alive) HTTP connection.
+Reports requests/sec and p50/p99 latency per endpoint.
+
+    python boggle/server.py --server asgi &
+    python scripts/load_test_boggle.py --players 30 --pollers 6 --duration 10
+"""
+import argparse
+import http.client
+import json
+import random
+import string
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+
+class Client:
+    """One keep-alive connection; reconnects if the server closes it."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.conn: Optional[http.client.HTTPConnection] = None
+
+    def request(self, method: str, path: str, payload: Optional[dict] = None) -> int:
+        body = json.dumps(payload) if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body else {}
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=10)
+            try:
+                self.conn.request(method, path, body=body, headers=headers)
+                resp = self.conn.getresponse()
+                resp.read()
+                if resp.will_close:
+                    self.conn.close()
+                    self.conn = None
+                return resp.status
+            except (ConnectionError, http.client.HTTPException):
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    raise
+        return 0
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Boggle server load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--players", type=int, default=30, help="phones submitting words")
+    parser.add_argument("--pollers", type=int, default=6, help="TV windows polling /state")
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--think", type=float, default=0.05, help="pause between submits")
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    url = urlparse(args.url)
+    host, port = url.hostname or "127.0.0.1", url.port or 80
+
+    setup = Client(host, port)
+    setup.request("POST", "/start")
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    lock = threading.Lock()
+    stop = time.monotonic() + args.duration
+
+    def timed(client: Client, name: str, method: str, path: str,
+              payload: Optional[dict] = None) -> None:
+        start = time.perf_counter()
+        try:
+            status = client.request(method, path, payload)
+        except Exception:
+            status = 0
+        elapsed = time.perf_counter() - start
+        with lock:
+            if status == 200:
+                latencies[name].append(elapsed)
+            else:
+                errors[name] += 1
+
+    def player(i: int) -> None:
+        client = Client(host, port)
+        name = f"load{i}"
+        timed(client, "/join", "POST", "/join", {"name": name})
+        while time.monotonic() < stop:
+            word = "".join(random.choices(string.ascii_uppercase, k=random.randint(3, 7)))
+            timed(client, "/submit", "POST", "/submit", {"name": name, "word": word})
+            time.sleep(args.think)
+
+    def poller() -> None:
+        client = Client(host, port)
+        while time.monotonic() < stop:
+            timed(client, "/state", "GET", "/state")
+            time.sleep(args.poll_interval)
+
+    threads = [threading.Thread(target=player, args=(i,)) for i in range(args.players)]
+    threads += [threading.Thread(target=poller) for _ in range(args.pollers)]
+    started = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.monotonic() - started
+
+    print(f"{'endpoint':<10} {'reqs':>7} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name in ("/submit", "/state", "/join"):
+        samples = latencies[name]
+        print(f"{name:<10} {len(samples):>7} {len(samples) / wall:>8.1f} "
+              f"{percentile(samples, 50) * 1000:>8.2f} {percentile(samples, 99) * 1000:>8.2f} "
+              f"{errors[name]:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+"""
+Headless game simulation and load generator for Lexigraph and Boggle.
+
+Bot players find valid words on the current board with lexigraph_py.solver and
+play them as fast as they can (or with --think pauses), either straight into
+the game object or through the real server interfaces:
+
+    lexigraph  direct    LexigraphGame.process_move
+               socketio  lexigraph_py/server.py handlers (in-process test
+                         clients, or a running server with --url)
+    boggle     direct    BoggleGame.submit_word
+               http      boggle/server.py routes (in-process test clients,
+                         or a running server with --url)
+
+Every --interval it prints moves/sec (all, and accepted by the game),
+p50/p99 handling latency and the RSS of this process (which includes the
+server when it runs in-process). The in-process Lexigraph server runs
+without its per-connection move limit, which would otherwise be what gets
+measured; start a server for --url with LEXIGRAPH_MOVE_RATE=0 for the same.
+
+    python scripts/simulate.py --game lexigraph --transport socketio --players 50
+    python scripts/simulate.py --game boggle --transport http --url http://127.0.0.1:8080
+
+As a regression benchmark: save a run with --json and compare later runs
+against it with --baseline; the exit status is 1 when throughput or p99
+regress by more than --tolerance.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+from lexigraph_py import solver  # noqa: E402
+
+Path = List[Tuple[int, int]]
+STEPS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+
+
+# --- board helpers -------------------------------------------------------------
+
+def find_words(rows: Sequence[str], trie: dict) -> Dict[str, Path]:
+    """Every dictionary word that can be traced on the board, with one path for it."""
+    width = len(rows[0]) if rows else 0
+    return {
+        word: [(c % width, c // width) for c in paths[0]]
+        for word, paths in solver.find_words(rows, trie).items()
+    }
+
+
+def plant_path(width: int, height: int, length: int, rng: random.Random) -> Optional[Path]:
+    """Random self-avoiding walk, used to write a word onto an in-process board."""
+    for _ in range(100):
+        path = [(rng.randrange(width), rng.randrange(height))]
+        while len(path) < length:
+            x, y = path[-1]
+            options = [(x + dx, y + dy) for dx, dy in STEPS
+                       if 0 <= x + dx < width and 0 <= y + dy < height
+                       and (x + dx, y + dy) not in path]
+            if not options:
+                break
+            path.append(rng.choice(options))
+        if len(path) == length:
+            return path
+    return None
+
+
+# --- measurement -------------------------------------------------------------
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+class Histogram:
+    """
+    Log-bucketed latency histogram (~2% resolution). Recording is O(1) and
+    memory is fixed, so a long run neither slows the reporter down nor
+    inflates the RSS it is measuring.
+    """
+    GROWTH = 1.02
+    BUCKETS = 1200  # 1us * 1.02**1200 is well past any sane latency
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        micros = seconds * 1e6
+        bucket = int(math.log(micros, self.GROWTH)) if micros > 1 else 0
+        self.counts[min(bucket, self.BUCKETS - 1)] += 1
+        self.total += 1
+
+    def merge(self, other: "Histogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+
+    def percentile(self, pct: float) -> float:
+        """Upper edge of the bucket holding the pct-th sample, in seconds."""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.total))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.GROWTH ** (bucket + 1) / 1e6
+        return self.GROWTH ** self.BUCKETS / 1e6
+
+
+class Stats:
+    """
+    Per-bot counters. Each bot records into its own object so the bots never
+    contend with each other; the reporter only briefly takes each bot's lock
+    to swap its window out.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.window = Histogram()
+        self.window_accepted = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.replants = 0
+
+    def record(self, seconds: float, ok: bool) -> None:
+        with self.lock:
+            self.window.record(seconds)
+            if ok:
+                self.accepted += 1
+                self.window_accepted += 1
+            else:
+                self.rejected += 1
+
+    def drain(self) -> Tuple[Histogram, int]:
+        """The window's latencies and how many of its moves were accepted."""
+        with self.lock:
+            window, self.window = self.window, Histogram()
+            accepted, self.window_accepted = self.window_accepted, 0
+        return window, accepted
+
+
+# --- transports ----------------------------------------------------------------
+# Each transport exposes: join(bot), board() -> rows, play(bot, word, path) -> bool,
+# and plant(word, rng) (in-process only) for boards with nothing left to find.
+
+class LexigraphDirect:
+    def __init__(self, args: argparse.Namespace):
+        from lexigraph_py.game import LexigraphGame
+        self.game = LexigraphGame()
+
+    def join(self, bot: int) -> None:
+        self.game.add_player(f"bot{bot}", f"Bot {bot}")
+
+    def board(self) -> List[str]:
+        grid = self.game.grid
+        letters = grid.letters.decode("ascii")
+        return [letters[y * grid.width:(y + 1) * grid.width] for y in range(grid.height)]
+
+    def play(self, bot: int, word: str, path: Path) -> bool:
+        coords = [{"x": x, "y": y} for x, y in path]
+        return self.game.process_move(f"bot{bot}", coords)["success"]
+
+    def plant(self, word: str, rng: random.Random) -> bool:
+        grid = self.game.grid
+        path = plant_path(grid.width, grid.height, len(word), rng)
+        if path is None:
+            return False
+        with self.game.lock:
+            for ch, (x, y) in zip(word, path):
+                grid.set_tile(x, y, ch)
+        return True
+
+
+class LexigraphSocketIO(LexigraphDirect):
+    def __init__(self, args: argparse.Namespace):
+        self.url = args.url
+        self.clients: Dict[int, object] = {}
+        self.results: Dict[int, Tuple[threading.Event, list]] = {}
+        self.rows: List[str] = []
+        if not self.url:
+            from lexigraph_py import server
+            self.server = server
+            self.game = server.game
+            # The bots play far faster than people; without this the run
+            # would measure the rate limiter's rejections
+            server.MOVE_RATE = 0
+            # Broadcast batching is normally started by run_server
+            server.batcher.start(server.socketio.start_background_task, server.socketio.sleep)
+
+    def join(self, bot: int) -> None:
+        if self.url:
+            import socketio
+            client = socketio.Client()
+            done, box = threading.Event(), []
+            self.results[bot] = (done, box)
+            client.on("state_update", self._on_state)
+            client.on("move_result", lambda result: (box.append(result), done.set()))
+            client.connect(self.url, wait_timeout=10)
+        else:
+            client = self.server.socketio.test_client(self.server.app)
+        client.emit("join_game", f"Bot {bot}")
+        self.clients[bot] = client
+
+    def _on_state(self, state: dict) -> None:
+        self.rows = ["".join(cell["char"] for cell in row) for row in state["grid"]]
+
+    def board(self) -> List[str]:
+        if self.url:
+            return self.rows
+        return super().board()
+
+    def play(self, bot: int, word: str, path: Path) -> bool:
+        coords = [{"x": x, "y": y} for x, y in path]
+        client = self.clients[bot]
+        if self.url:
+            done, box = self.results[bot]
+            done.clear()
+            box.clear()
+            client.emit("submit_move", coords)
+            if not done.wait(10):
+                return False
+            return box[0]["success"]
+        client.emit("submit_move", coords)
+        # Draining also discards the broadcast deltas every client receives
+        results = [e["args"][0] for e in client.get_received() if e["name"] == "move_result"]
+        return bool(results) and results[-1]["success"]
+
+    def plant(self, word: str, rng: random.Random) -> bool:
+        return False if self.url else super().plant(word, rng)
+
+
+class BoggleDirect:
+    def __init__(self, args: argparse.Namespace):
+        from game_state import BoggleGame
+        self.game = BoggleGame()
+        self.game.duration = 10 ** 6  # one round lasts the whole run
+        self.game.start_game()
+
+    def join(self, bot: int) -> None:
+        self.game.add_player(f"bot{bot}")
+
+    def board(self) -> List[str]:
+        return ["".join(row) for row in self.game.to_json()["board"]]
+
+    def play(self, bot: int, word: str, path: Path) -> bool:
+        return self.game.submit_word(f"bot{bot}", word)
+
+    def plant(self, word: str, rng: random.Random) -> bool:
+        return False
+
+
+class BoggleHTTP(BoggleDirect):
+    def __init__(self, args: argparse.Namespace):
+        self.url = args.url
+        self.local = threading.local()
+        if not self.url:
+            import server
+            self.app = server.app
+            server.rooms.get("MAIN").duration = 10 ** 6
+        self.request("POST", "/start")
+
+    def request(self, method: str, path: str, payload: Optional[dict] = None) -> Tuple[int, bytes]:
+        if not self.url:
+            client = getattr(self.local, "client", None)
+            if client is None:
+                client = self.local.client = self.app.test_client()
+            resp = client.open(path, method=method, json=payload)
+            return resp.status_code, resp.data
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            url = urlparse(self.url)
+            conn = self.local.conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=10)
+        body = json.dumps(payload) if payload is not None else None
+        conn.request(method, path, body=body,
+                     headers={"Content-Type": "application/json"} if body else {})
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+
+    def join(self, bot: int) -> None:
+        self.request("POST", "/join", {"name": f"bot{bot}"})
+
+    def board(self) -> List[str]:
+        _, content = self.request("GET", "/state")
+        return ["".join(row) for row in json.loads(content)["board"]]
+
+    def play(self, bot: int, word: str, path: Path) -> bool:
+        status, content = self.request("POST", "/submit", {"name": f"bot{bot}", "word": word})
+        return status == 200 and json.loads(content)["accepted"]
+
+
+TRANSPORTS = {
+    ("lexigraph", "direct"): LexigraphDirect,
+    ("lexigraph", "socketio"): LexigraphSocketIO,
+    ("boggle", "direct"): BoggleDirect,
+    ("boggle", "http"): BoggleHTTP,
+}
+
+
+def load_words(args: argparse.Namespace) -> List[str]:
+    for path in (args.words, "/usr/share/dict/words"):
+        if path and os.path.exists(path):
+            with open(path) as f:
+                return [w.strip().upper() for w in f if w.strip().isalpha()]
+    # No word list here: fall back to what the games themselves know
+    if args.game == "lexigraph":
+        from lexigraph_py.game import DICTIONARY
+        return sorted(DICTIONARY)
+    from game_state import BoggleGame
+    return list(BoggleGame().generator.long_words)
+
+
+# --- bots ----------------------------------------------------------------------
+
+def bot_loop(bot: int, transport, words: List[str], trie: dict, stats: Stats, go: threading.Event,
+             stop: threading.Event, think: float, seed: int) -> None:
+    rng = random.Random(seed + bot)
+    go.wait()
+    known: Dict[str, Path] = {}
+    board_key: Tuple[str, ...] = ()
+    while not stop.is_set():
+        rows = tuple(transport.board())
+        if rows != board_key:
+            board_key, known = rows, find_words(rows, trie)
+        if not known:
+            # Nothing on the board: write a word onto it (in-process only)
+            if transport.plant(rng.choice(words), rng):
+                with stats.lock:
+                    stats.replants += 1
+            else:
+                stop.wait(0.05)
+            continue
+        word = rng.choice(list(known))
+        start = time.perf_counter()
+        ok = transport.play(bot, word, known[word])
+        stats.record(time.perf_counter() - start, ok)
+        if think:
+            stop.wait(rng.uniform(0, 2 * think))
+
+
+def run(args: argparse.Namespace) -> dict:
+    transport = TRANSPORTS[(args.game, args.transport)](args)
+    words = load_words(args)
+    trie = solver.build_trie(words)
+    for bot in range(args.players):
+        transport.join(bot)
+
+    stats = [Stats() for _ in range(args.players)]
+    # Bots start together: threads started while others already hammer the
+    # game lock can take seconds to get going
+    go, stop = threading.Event(), threading.Event()
+    overall = Histogram()
+    threads = [
+        threading.Thread(target=bot_loop, daemon=True,
+                         args=(bot, transport, words, trie, stats[bot], go, stop, args.think, args.seed))
+        for bot in range(args.players)
+    ]
+
+    def drain() -> Tuple[Histogram, int]:
+        window, accepted = Histogram(), 0
+        for bot_stats in stats:
+            bot_window, bot_accepted = bot_stats.drain()
+            window.merge(bot_window)
+            accepted += bot_accepted
+        overall.merge(window)
+        return window, accepted
+
+    for t in threads:
+        t.start()
+    start = time.monotonic()
+    go.set()
+
+    timeline = []
+    print(f"{'t':>6} {'moves/s':>9} {'accepted':>9} {'p50 ms':>8} {'p99 ms':>8} {'rss MB':>8}")
+    last = start
+    while last - start < args.duration:
+        time.sleep(min(args.interval, args.duration - (last - start)))
+        window, accepted = drain()
+        now = time.monotonic()
+        point = {
+            "t": round(now - start, 2),
+            "moves_per_sec": window.total / (now - last),
+            "accepted_per_sec": accepted / (now - last),
+            "p50_ms": window.percentile(50) * 1000,
+            "p99_ms": window.percentile(99) * 1000,
+            "rss_mb": rss_mb(),
+        }
+        last = now
+        timeline.append(point)
+        print(f"{point['t']:>6.1f} {point['moves_per_sec']:>9.1f} {point['accepted_per_sec']:>9.1f} "
+              f"{point['p50_ms']:>8.2f} {point['p99_ms']:>8.2f} {point['rss_mb']:>8.1f}")
+    stop.set()
+    for t in threads:
+        t.join(timeout=5)
+    elapsed = time.monotonic() - start
+    drain()
+
+    return {
+        "game": args.game,
+        "transport": args.transport,
+        "players": args.players,
+        "moves": overall.total,
+        "accepted": sum(s.accepted for s in stats),
+        "rejected": sum(s.rejected for s in stats),
+        "replants": sum(s.replants for s in stats),
+        "moves_per_sec": overall.total / elapsed,
+        "accepted_per_sec": sum(s.accepted for s in stats) / elapsed,
+        "p50_ms": overall.percentile(50) * 1000,
+        "p99_ms": overall.percentile(99) * 1000,
+        "peak_rss_mb": max((p["rss_mb"] for p in timeline), default=rss_mb()),
+        "timeline": timeline,
+    }
+
+
+def compare(summary: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Regressions beyond `tolerance` (a fraction) against a saved run."""
+    problems = []
+    # Rejected moves are cheap; only moves the game accepted count as
+    # throughput (older baselines only have the combined figure)
+    key = "accepted_per_sec" if "accepted_per_sec" in baseline else "moves_per_sec"
+    if summary[key] < baseline[key] * (1 - tolerance):
+        problems.append(f"throughput {summary[key]:.1f}/s vs baseline {baseline[key]:.1f}/s")
+    if summary["p99_ms"] > baseline["p99_ms"] * (1 + tolerance):
+        problems.append(f"p99 {summary['p99_ms']:.2f}ms vs baseline {baseline['p99_ms']:.2f}ms")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless bot simulation / load generator")
+    parser.add_argument("--game", choices=["lexigraph", "boggle"], default="lexigraph")
+    parser.add_argument("--transport", choices=["direct", "socketio", "http"], default="direct")
+    parser.add_argument("--url", help="drive a running server instead of an in-process one")
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=1.0, help="report period (s)")
+    parser.add_argument("--think", type=float, default=0.0, help="mean pause between moves (s)")
+    parser.add_argument("--words", help="word list (default: /usr/share/dict/words)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the summary to this file")
+    parser.add_argument("--baseline", help="summary JSON from an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if (args.game, args.transport) not in TRANSPORTS:
+        parser.error(f"{args.game} does not support the {args.transport} transport")
+
+    summary = run(args)
+    print(f"\n{summary['moves']} moves ({summary['accepted']} accepted, {summary['rejected']} rejected) "
+          f"by {args.players} bots: {summary['moves_per_sec']:.1f} moves/s "
+          f"({summary['accepted_per_sec']:.1f} accepted/s), p50 {summary['p50_ms']:.2f}ms, "
+          f"p99 {summary['p99_ms']:.2f}ms, peak RSS {summary['peak_rss_mb']:.1f}MB")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems = compare(summary, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION: {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
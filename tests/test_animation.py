@@ -0,0 +1,142 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.animation import Animator, Tween, linear  # noqa: E402
+
+
+class FakeHyprctl:
+    def __init__(self, clients=(), delay=0.0):
+        self.clients = list(clients)
+        self.delay = delay
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def get_clients(self):
+        return self.clients
+
+    def batch(self, cmds):
+        time.sleep(self.delay)
+        with self.lock:
+            self.batches.append(list(cmds))
+        return "ok"
+
+
+class TestTween(unittest.TestCase):
+    def test_interpolates_and_finishes(self):
+        tween = Tween((0, 0, 100, 100), (100, 50, 200, 100), began=10.0, duration=1.0, easing=linear)
+        self.assertEqual(tween.at(10.5), ((50, 25, 150, 100), False))
+        self.assertEqual(tween.at(11.5), ((100, 50, 200, 100), True))
+        self.assertEqual(tween.at(9.0)[0], (0, 0, 100, 100))
+
+
+class TestAnimator(unittest.TestCase):
+    def test_one_batch_per_frame(self):
+        hypr = FakeHyprctl()
+        animator = Animator(hypr, clock=lambda: 0.0)
+        for i in range(25):
+            animator.tweens[f"0x{i}"] = Tween((0, 0, 50, 50), (100, i, 50, 50), 0.0, 1.0, linear)
+            animator.current[f"0x{i}"] = (0, 0, 50, 50)
+        self.assertEqual(animator.tick(0.5), 25)
+        self.assertEqual(len(hypr.batches), 1)
+        # Only moves: sizes didn't change
+        self.assertTrue(all("movewindowpixel exact 50 " in cmd for cmd in hypr.batches[0]))
+        # Nothing changed since the last frame, nothing is sent
+        self.assertEqual(animator.tick(0.5), 0)
+        self.assertEqual(len(hypr.batches), 1)
+        animator.tick(1.0)
+        self.assertEqual(animator.tweens, {})
+        self.assertEqual(animator.current["0x7"], (100, 7, 50, 50))
+
+    def test_start_from_hyprland_and_retarget(self):
+        hypr = FakeHyprctl([{"address": "0xa", "at": [10, 20], "size": [300, 200]}])
+        now = [0.0]
+        animator = Animator(hypr, clock=lambda: now[0])
+        animator.running = True  # no frame thread: ticks are driven by hand
+        animator.move("0xa", 110, 20, duration=1.0, easing=linear)
+        self.assertEqual(animator.tweens["0xa"].start, (10, 20, 300, 200))
+        now[0] = 0.5
+        animator.tick()
+        self.assertEqual(animator.current["0xa"], (60, 20, 300, 200))
+        # A new target starts from where the window is now
+        animator.animate("0xa", (60, 20, 400, 200), duration=1.0, easing=linear)
+        self.assertEqual(animator.tweens["0xa"].start, (60, 20, 300, 200))
+        now[0] = 1.5
+        animator.tick()
+        self.assertEqual(hypr.batches[-1], ["dispatch resizewindowpixel exact 400 200,address:0xa"])
+        self.assertRaises(KeyError, animator.move, "0xmissing", 0, 0)
+
+    def test_runs_at_frame_rate(self):
+        hypr = FakeHyprctl()
+        animator = Animator(hypr, fps=50)
+        animator.current.update({f"0x{i}": (0, 0, 10, 10) for i in range(30)})
+        for i in range(30):
+            animator.animate(f"0x{i}", (200, 200, 10, 10), duration=0.3)
+        self.assertTrue(animator.wait(timeout=2))
+        animator.stop()
+        # ~15 frames of 30 windows, each frame a single batch
+        self.assertLessEqual(len(hypr.batches), 20)
+        self.assertGreaterEqual(len(hypr.batches), 8)
+        self.assertTrue(all(len(batch) <= 30 for batch in hypr.batches))
+        self.assertEqual(animator.current["0x0"], (200, 200, 10, 10))
+        # Frames where nothing moved a whole pixel send no batch
+        self.assertGreaterEqual(animator.stats.frames, len(hypr.batches))
+
+    def test_slow_frames_are_dropped(self):
+        # Each batch takes three frame intervals
+        hypr = FakeHyprctl(delay=0.03)
+        animator = Animator(hypr, fps=100)
+        animator.current["0xa"] = (0, 0, 10, 10)
+        animator.animate("0xa", (500, 0, 10, 10), duration=0.3, easing=linear)
+        start = time.monotonic()
+        self.assertTrue(animator.wait(timeout=2))
+        elapsed = time.monotonic() - start
+        animator.stop()
+        # Still done on schedule, by skipping frames rather than queueing them
+        self.assertLess(elapsed, 0.45)
+        self.assertGreater(animator.stats.dropped, 10)
+        self.assertIn("dropped", animator.stats.format())
+
+    def test_wait_returns_after_the_last_frame_is_sent(self):
+        # Batches take longer than a frame: the final one is still in
+        # flight when the tween finishes
+        hypr = FakeHyprctl(delay=0.05)
+        animator = Animator(hypr, fps=60)
+        animator.current["0xa"] = (0, 0, 10, 10)
+        animator.animate("0xa", (100, 0, 10, 10), duration=0.2, easing=linear)
+        self.assertTrue(animator.wait(timeout=2))
+        with hypr.lock:
+            self.assertEqual(hypr.batches[-1], ["dispatch movewindowpixel exact 100 0,address:0xa"])
+        animator.stop()
+
+    def test_lookup_does_not_hold_the_frame_lock(self):
+        animator = Animator(FakeHyprctl(), clock=lambda: 0.0)
+        animator.running = True  # no frame thread
+        free = []
+
+        def get_clients():
+            # What the frame thread would do while the IPC round trip is pending
+            def probe():
+                if animator.cond.acquire(timeout=1):
+                    free.append(True)
+                    animator.cond.release()
+                else:
+                    free.append(False)
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            return [{"address": "0xa", "at": [10, 20], "size": [300, 200]}]
+
+        animator.hyprctl.get_clients = get_clients
+        animator.move("0xa", 110, 20)
+        self.assertEqual(free, [True])
+        self.assertEqual(animator.tweens["0xa"].start, (10, 20, 300, 200))
+
+
+if __name__ == "__main__":
+    unittest.main()
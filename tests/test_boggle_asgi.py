@@ -0,0 +1,61 @@
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+import server as boggle_server  # noqa: E402
+from asgi import WSGIBridge  # noqa: E402
+
+
+def call(bridge, method, path, payload=None):
+    """Drive one HTTP request through the ASGI app and collect the response."""
+    body = json.dumps(payload).encode() if payload is not None else b""
+    headers = [(b"content-type", b"application/json")] if payload is not None else []
+    scope = {
+        "type": "http", "method": method, "path": path, "query_string": b"",
+        "headers": headers, "server": ("testserver", 80), "client": ("127.0.0.1", 1234),
+    }
+    sent = []
+    inbox = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if inbox:
+            return inbox.pop(0)
+        await asyncio.sleep(3600)  # client stays connected
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(bridge(scope, receive, send))
+    status = sent[0]["status"]
+    content = b"".join(m.get("body", b"") for m in sent[1:])
+    return status, content
+
+
+class TestWSGIBridge(unittest.TestCase):
+    def setUp(self):
+        self.bridge = WSGIBridge(boggle_server.app, max_workers=4)
+        boggle_server.game.reset(host="MVB")
+
+    def tearDown(self):
+        self.bridge.executor.shutdown()
+
+    def test_routes_round_trip(self):
+        status, _ = call(self.bridge, "POST", "/join", {"name": "Alice"})
+        self.assertEqual(status, 200)
+        status, content = call(self.bridge, "GET", "/state")
+        self.assertEqual(status, 200)
+        self.assertIn("Alice", json.loads(content)["players"])
+
+    def test_bad_request_passes_through(self):
+        status, _ = call(self.bridge, "POST", "/join", {})
+        self.assertEqual(status, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import unittest
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+import server as boggle_server  # noqa: E402
+from flask import render_template_string  # noqa: E402
+
+
+class TestCachedViews(unittest.TestCase):
+    def setUp(self):
+        self.client = boggle_server.app.test_client()
+
+    def test_controller_revalidates_with_etag(self):
+        first = self.client.get("/controller")
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["ETag"]
+        self.assertIn("max-age", first.headers["Cache-Control"])
+        again = self.client.get("/controller", headers={"If-None-Match": etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.data, b"")
+
+    def test_join_page_per_room(self):
+        lobby = self.client.get("/view/join")
+        code, _ = boggle_server.rooms.create()
+        room = self.client.get(f"/room/{code}/view/join")
+        self.assertIn(f"/room/{code}/controller".encode(), room.data)
+        self.assertNotEqual(lobby.headers["ETag"], room.headers["ETag"])
+
+    def test_join_qr_is_local(self):
+        page = self.client.get("/view/join").data.decode()
+        self.assertNotIn("qrserver", page)
+        self.assertIn("<svg", page)
+        self.assertIn(boggle_server.join_url(), page)
+        svg = self.client.get("/qr.svg")
+        self.assertEqual(svg.mimetype, "image/svg+xml")
+        self.assertIn("ETag", svg.headers)
+
+    def test_compiled_templates_match_render_template_string(self):
+        players = (("Bob", 3), ("Alice", 7))
+        with boggle_server.app.test_request_context():
+            expected = render_template_string(
+                boggle_server.LEADERBOARD_HTML,
+                players=[{"name": n, "score": s} for n, s in players])
+            self.assertEqual(boggle_server.leaderboard_page(players), expected)
+            expected = render_template_string(boggle_server.TIMER_HTML, state="PLAYING", time=42,
+                                              timer_end=1000.5)
+            self.assertEqual(boggle_server.timer_page("PLAYING", 42, 1000.5), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
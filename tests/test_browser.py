@@ -0,0 +1,133 @@
+import json
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.browser import Browser, app_class  # noqa: E402
+
+
+class FakeDevTools(BaseHTTPRequestHandler):
+    pages = []
+
+    def do_GET(self):
+        if self.path == "/json/list":
+            body = json.dumps(self.pages).encode()
+        elif self.path.startswith("/json/close/"):
+            target = self.path.rsplit("/", 1)[1]
+            self.pages[:] = [p for p in self.pages if p["id"] != target]
+            body = b"Target is closing"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBrowser(unittest.TestCase):
+    def setUp(self):
+        self.profile = tempfile.TemporaryDirectory()
+        self.browser = Browser(self.profile.name, binary="chromium")
+
+    def tearDown(self):
+        self.profile.cleanup()
+
+    def test_app_class(self):
+        self.assertEqual(app_class("http://127.0.0.1:8080/view/board"),
+                         "chrome-127.0.0.1__view_board-Default")
+        self.assertEqual(app_class("http://localhost/"), "chrome-localhost__-Default")
+
+    def test_windows_share_the_profile(self):
+        board, join = (self.browser.app_window(f"http://127.0.0.1:8080/view/{view}", 0, 0, 10, 10)
+                       for view in ("board", "join"))
+        for cfg in (board, join):
+            argv = shlex.split(cfg["command"])
+            self.assertEqual(argv[0], "chromium")
+            self.assertIn(f"--user-data-dir={self.profile.name}", argv)
+            self.assertTrue(cfg["is_class"])
+        self.assertIn("--app=http://127.0.0.1:8080/view/join", shlex.split(join["command"]))
+        self.assertEqual(join["name_pattern"], "chrome-127.0.0.1__view_join-Default")
+
+    def test_not_running(self):
+        self.assertIsNone(self.browser.pid())
+        self.assertIsNone(self.browser.devtools_port())
+        self.assertEqual(self.browser.pages(), [])
+        self.assertEqual(self.browser.close("http://127.0.0.1:8080/view/board"), 0)
+        self.browser.shutdown()  # nothing to stop
+
+    def _wait_for_exec(self, proc):
+        # Until it execs, the child's cmdline is still ours
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            with open(f"/proc/{proc.pid}/cmdline", "rb") as f:
+                if b"--user-data-dir=" in f.read():
+                    return
+            time.sleep(0.01)
+        self.fail("dummy browser did not start")
+
+    def _lock(self, target):
+        os.symlink(target, os.path.join(self.profile.name, "SingletonLock"))
+
+    def test_pid_from_singleton_lock(self):
+        # Stands in for the profile's Chromium: same --user-data-dir in its argv
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)",
+                                 f"--user-data-dir={self.profile.name}"])
+        self.addCleanup(proc.wait)
+        self.addCleanup(proc.kill)
+        self._wait_for_exec(proc)
+        self._lock(f"{socket.gethostname()}-{proc.pid}")
+        self.assertEqual(self.browser.pid(), proc.pid)
+        self.assertTrue(self.browser.running())
+        self.browser.shutdown()
+        self.assertEqual(proc.wait(timeout=5), -signal.SIGTERM)
+
+    def test_stale_lock_names_another_process(self):
+        # The PID is alive but isn't a browser on this profile
+        self._lock(f"{socket.gethostname()}-{os.getpid()}")
+        self.assertIsNone(self.browser.pid())
+        self.browser.shutdown()  # must not signal us
+
+    def test_lock_from_another_host(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)",
+                                 f"--user-data-dir={self.profile.name}"])
+        self.addCleanup(proc.wait)
+        self.addCleanup(proc.kill)
+        self._wait_for_exec(proc)
+        self._lock(f"not-{socket.gethostname()}-{proc.pid}")
+        self.assertIsNone(self.browser.pid())
+
+    def test_close_through_devtools(self):
+        FakeDevTools.pages = [
+            {"id": "A", "type": "page", "url": "http://127.0.0.1:8080/view/board"},
+            {"id": "B", "type": "page", "url": "http://127.0.0.1:8080/view/join"},
+            {"id": "C", "type": "service_worker", "url": "http://127.0.0.1:8080/view/board"},
+        ]
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeDevTools)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        with open(os.path.join(self.profile.name, "DevToolsActivePort"), "w") as f:
+            f.write(f"{server.server_address[1]}\n/devtools/browser/xyz\n")
+
+        self.assertEqual([p["id"] for p in self.browser.pages()], ["A", "B"])
+        self.assertEqual(self.browser.close("http://127.0.0.1:8080/view/board"), 1)
+        self.assertEqual([p["id"] for p in self.browser.pages()], ["B"])
+
+
+if __name__ == "__main__":
+    unittest.main()
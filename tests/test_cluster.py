@@ -0,0 +1,82 @@
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+from cluster import ClusterRouter, start_workers, worker_for  # noqa: E402
+
+
+def call(router, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    headers = [(b"content-type", b"application/json")] if payload is not None else []
+    scope = {"type": "http", "method": method, "path": path, "query_string": b"",
+             "headers": headers}
+    sent = []
+    inbox = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if inbox:
+            return inbox.pop(0)
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(router(scope, receive, send))
+    return sent[0]["status"], b"".join(m.get("body", b"") for m in sent[1:])
+
+
+class TestWorkerMapping(unittest.TestCase):
+    def test_mapping_is_stable_and_case_insensitive(self):
+        self.assertEqual(worker_for("ABCD", 4), worker_for("abcd", 4))
+        self.assertEqual({worker_for(c, 1) for c in ("ABCD", "WXYZ", "MAIN")}, {0})
+
+
+class TestClusterRouter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sock_dir = tempfile.mkdtemp(prefix="boggle-test-")
+        cls.procs, sockets = start_workers(2, cls.sock_dir, server_mode="dev")
+        cls.router = ClusterRouter(sockets)
+
+    @classmethod
+    def tearDownClass(cls):
+        for proc in cls.procs:
+            proc.terminate()
+            proc.wait()
+        shutil.rmtree(cls.sock_dir, ignore_errors=True)
+
+    def test_rooms_are_routed_to_their_worker(self):
+        codes = []
+        for _ in range(6):
+            status, content = call(self.router, "POST", "/rooms")
+            self.assertEqual(status, 201)
+            codes.append(json.loads(content)["room"])
+
+        for code in codes:
+            status, _ = call(self.router, "POST", f"/room/{code}/join", {"name": code})
+            self.assertEqual(status, 200)
+            status, content = call(self.router, "GET", f"/room/{code}/state")
+            self.assertEqual(list(json.loads(content)["players"]), [code])
+
+        status, content = call(self.router, "GET", "/rooms")
+        listed = json.loads(content)["rooms"]
+        self.assertEqual(sorted(listed), sorted(codes + ["MAIN"]))
+
+    def test_default_table_and_missing_rooms(self):
+        status, content = call(self.router, "GET", "/state")
+        self.assertEqual(status, 200)
+        self.assertIn("MVB", json.loads(content)["players"])
+        status, _ = call(self.router, "GET", "/room/ZZZZ/state")
+        self.assertEqual(status, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
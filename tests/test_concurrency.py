@@ -0,0 +1,120 @@
+import os
+import sys
+import threading
+import unittest
+
+# Add project root and the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+import server as boggle_server  # noqa: E402
+from game_state import BoggleGame  # noqa: E402
+
+from lexigraph_py.game import LexigraphGame  # noqa: E402
+
+THREADS = 16
+ITERATIONS = 50
+
+
+def hammer(worker, threads=THREADS):
+    """Run `worker(i)` on many threads at once and collect any exceptions."""
+    errors = []
+    barrier = threading.Barrier(threads)
+
+    def run(i):
+        barrier.wait()
+        try:
+            worker(i)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    pool = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return errors
+
+
+class TestBoggleServerStress(unittest.TestCase):
+    def setUp(self):
+        boggle_server.game.reset(host="MVB")
+        boggle_server.game.start_game()
+
+    def test_join_submit_state_hammer(self):
+        """Concurrent /join, /submit and /state must not corrupt or crash the game."""
+        accepted = [0] * THREADS
+
+        def worker(i):
+            client = boggle_server.app.test_client()
+            name = f"P{i}"
+            r = client.post('/join', json={"name": name})
+            assert r.status_code == 200, r.status_code
+            for n in range(ITERATIONS):
+                r = client.post('/submit', json={"name": name, "word": f"W{i}X{n}"})
+                assert r.status_code == 200, r.status_code
+                if r.get_json()["accepted"]:
+                    accepted[i] += 1
+                r = client.get('/state')
+                assert r.status_code == 200, r.status_code
+                r = client.get('/view/leaderboard')
+                assert r.status_code == 200, r.status_code
+
+        errors = hammer(worker)
+        self.assertEqual(errors, [])
+
+        state = boggle_server.game.to_json()
+        for i in range(THREADS):
+            self.assertIn(f"P{i}", state["players"])
+            self.assertEqual(len(state["players"][f"P{i}"]["words"]), ITERATIONS)
+            self.assertEqual(accepted[i], ITERATIONS)
+
+
+class TestBoggleGameConcurrency(unittest.TestCase):
+    def test_round_is_scored_once(self):
+        """Many pollers racing past the deadline must only score the round once."""
+        game = BoggleGame()
+        game.add_player("Alice")
+        game.start_game()
+        game.submit_word("Alice", "UNIQUE")  # 3 pts
+        game.timer_end = 0
+
+        errors = hammer(lambda i: [game.to_json() for _ in range(ITERATIONS)])
+        self.assertEqual(errors, [])
+        self.assertEqual(game.state, "SCORING")
+        self.assertEqual(game.players["Alice"].score, 3)
+
+    def test_snapshot_is_cached_until_mutation(self):
+        game = BoggleGame()
+        game.add_player("Alice")
+        first = game.to_json()
+        self.assertIs(first["players"], game.to_json()["players"])
+        game.add_player("Bob")
+        self.assertIn("Bob", game.to_json()["players"])
+
+
+class TestLexigraphConcurrency(unittest.TestCase):
+    def test_concurrent_moves_and_leaves(self):
+        game = LexigraphGame()
+        for i, ch in enumerate("TEST"):
+            game.grid.set_tile(i, 0, ch)
+        coords = [{'x': i, 'y': 0} for i in range(4)]
+
+        def worker(i):
+            pid = f"id{i}"
+            game.add_player(pid, f"P{i}")
+            for _ in range(ITERATIONS):
+                result = game.process_move(pid, coords)
+                assert result['success'], result
+                game.snapshot()
+            game.remove_player(pid)
+
+        errors = hammer(worker)
+        self.assertEqual(errors, [])
+        self.assertEqual(game.players, {})
+        self.assertIsNone(game.grid.get_tile(0, 0).owner)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.input import InputBus, InputClient, decode_keys, key_handler_window  # noqa: E402
+
+
+class TestDecodeKeys(unittest.TestCase):
+    def test_keys(self):
+        self.assertEqual(decode_keys(b"a\x1b[A\x1bOB\r\x7f\x03 \t"),
+                         ["a", "up", "down", "enter", "backspace", "ctrl+c", "space", "tab"])
+        self.assertEqual(decode_keys(b"\x1b"), ["escape"])
+        self.assertEqual(decode_keys(b"\x1b[5~\x1bOP"), ["pageup", "f1"])
+        # Unknown sequences are skipped whole; Alt+x is escape, x
+        self.assertEqual(decode_keys(b"\x1b[1;5Cz\x1bx"), ["z", "escape", "x"])
+        self.assertEqual(decode_keys("é".encode()), ["é"])
+
+
+class TestInputBus(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "input.sock")
+        self.bus = InputBus(self.path).start()
+
+    def tearDown(self):
+        self.bus.stop()
+        self.dir.cleanup()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_topics(self):
+        with InputClient.connect(self.path, topics=["key"]) as keys, \
+                InputClient.connect(self.path, topics=[]) as everything, \
+                InputClient.connect(self.path) as publisher:
+            publisher.publish("key", key="up")
+            publisher.publish("score", value=3)
+            self.assertEqual(keys.recv(timeout=1)["key"], "up")
+            self.assertEqual(everything.recv(timeout=1)["key"], "up")
+            self.assertEqual(everything.recv(timeout=1)["value"], 3)
+            self.assertIsNone(keys.recv(timeout=0.1))
+            # Publishers don't hear themselves
+            self.assertIsNone(publisher.recv(timeout=0.1))
+
+    def test_delivery_in_order(self):
+        # Latency is measured by scripts/bench_input.py, not asserted here
+        with InputClient.connect(self.path, topics=["key"]) as sub, \
+                InputClient.connect(self.path) as publisher:
+            for n in range(200):
+                publisher.publish("key", key="a", n=n)
+            received = [sub.recv(timeout=1) for _ in range(200)]
+            self.assertEqual([e["n"] for e in received], list(range(200)))
+            self.assertTrue(all(e["key"] == "a" and "t" in e for e in received))
+
+    def test_malformed_messages_are_ignored(self):
+        with InputClient.connect(self.path, topics=["key"]) as sub, \
+                InputClient.connect(self.path) as bad:
+            for junk in (b'{"subscribe": 5}', b'{"subscribe": [1, 2]}', b'{"topic": []}',
+                         b'{"topic": {"a": 1}}', b"[1, 2]", b"not json"):
+                bad.sock.send(junk)
+            bad.publish("key", key="still-alive")
+            self.assertEqual(sub.recv(timeout=1)["key"], "still-alive")
+            self.assertTrue(self.bus.thread.is_alive())
+
+    def test_slow_subscriber_does_not_block(self):
+        with InputClient.connect(self.path, topics=["key"]) as slow, \
+                InputClient.connect(self.path, topics=["key"]) as fast, \
+                InputClient.connect(self.path) as publisher:
+            received = 0
+            for i in range(5000):
+                publisher.publish("key", key="x", n=i)
+                if fast.recv(timeout=1):
+                    received += 1
+            self.assertEqual(received, 5000)
+            self.assertGreater(self.bus.dropped, 0)
+            self.assertEqual(slow.recv(timeout=1)["n"], 0)
+
+    def test_key_handler_window(self):
+        cfg = key_handler_window(self.path, 0, 0, 200, 80)
+        self.assertEqual(cfg["name_pattern"], "KeyHandler")
+        self.assertIn(f"capture --socket {self.path}", cfg["command"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import base64
+import io
+import os
+import re
+import sys
+import unittest
+import zlib
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+import kitty  # noqa: E402
+
+BOARD = [["A", "B", "C"], ["D", "Qu", "E"], ["F", "G", "H"]]
+
+
+def pixel(width, rgb, x, y):
+    start = (y * width + x) * 3
+    return rgb[start:start + 3]
+
+
+class TestRasterize(unittest.TestCase):
+    def test_layout_matches_svg(self):
+        width, height, rgb = kitty.rasterize(BOARD)
+        self.assertEqual((width, height), (340, 340))
+        self.assertEqual(len(rgb), width * height * 3)
+        self.assertEqual(pixel(width, rgb, 5, 5), kitty.BACKGROUND)
+        # Tile edge, and its rounded-off corner
+        self.assertEqual(pixel(width, rgb, 15, 60), kitty.TILE)
+        self.assertEqual(pixel(width, rgb, 10, 10), kitty.BACKGROUND)
+        # Every tile has some ink on it
+        for r in range(3):
+            for c in range(3):
+                px, py = 10 + c * 110, 10 + r * 110
+                ink = sum(pixel(width, rgb, x, y) == kitty.INK
+                          for y in range(py + 20, py + 80) for x in range(px + 20, px + 80))
+                self.assertGreater(ink, 100)
+
+    def test_transmit_roundtrip(self):
+        width, height, rgb = kitty.rasterize(BOARD)
+        data = kitty.transmit(7, width, height, rgb)
+        chunks = re.findall(r"\033_G([^;]*);([^\033]*)\033\\", data)
+        self.assertIn("a=t", chunks[0][0])
+        self.assertIn("i=7", chunks[0][0])
+        self.assertTrue(all(keys.endswith("m=1") for keys, _ in chunks[:-1]))
+        self.assertTrue(chunks[-1][0].endswith("m=0"))
+        self.assertTrue(all(len(payload) <= kitty.CHUNK for _, payload in chunks))
+        payload = "".join(payload for _, payload in chunks)
+        self.assertEqual(zlib.decompress(base64.b64decode(payload)), rgb)
+
+
+class TestBoardImages(unittest.TestCase):
+    def setUp(self):
+        self.out = io.StringIO()
+        self.images = kitty.BoardImages(self.out, capacity=2)
+
+    def written(self):
+        data = self.out.getvalue()
+        self.out.truncate(0)
+        self.out.seek(0)
+        return data
+
+    def test_unchanged_board_is_not_resent(self):
+        self.images.show(BOARD, 3, 2, 40, 20)
+        self.assertIn("a=t", self.written())
+        self.assertEqual(self.images.show(BOARD, 3, 2, 40, 20), 0)
+        # A resize re-places the cached image
+        self.images.show(BOARD, 3, 2, 30, 15)
+        data = self.written()
+        self.assertNotIn("a=t", data)
+        self.assertIn("a=p", data)
+        self.assertEqual(self.images.uploads, 1)
+
+    def test_new_board_replaces_old(self):
+        self.images.show(BOARD, 3, 2, 40, 20)
+        other = [["Z"] * 3] * 3
+        self.images.show(other, 3, 2, 40, 20)
+        data = self.written()
+        self.assertIn("a=t", data)
+        self.assertIn(kitty.hide(1), data)
+        # Switching back only places the first upload again
+        self.images.show(BOARD, 3, 2, 40, 20)
+        self.assertNotIn("a=t", self.written())
+        self.assertEqual(self.images.uploads, 2)
+
+    def test_eviction_frees_terminal_memory(self):
+        for letter in "XYZ":
+            self.images.show([[letter]], 0, 0, 10, 5)
+        self.assertIn(kitty.delete(1), self.out.getvalue())
+        self.assertEqual(len(self.images.ids), 2)
+
+    def test_clear_and_invalidate(self):
+        self.images.show(BOARD, 3, 2, 40, 20)
+        self.written()
+        # After a screen clear the same frame has to be placed again
+        self.images.invalidate()
+        self.images.show(BOARD, 3, 2, 40, 20)
+        data = self.written()
+        self.assertIn("a=p", data)
+        self.assertNotIn("a=t", data)
+        self.images.clear()
+        self.assertEqual(self.written(), kitty.hide(1))
+        self.assertEqual(self.images.clear(), 0)
+
+    def test_supported(self):
+        self.assertTrue(kitty.supported({"TERM": "xterm-ghostty"}))
+        self.assertFalse(kitty.supported({"TERM": "xterm-256color"}))
+        self.assertFalse(kitty.supported({"TERM": "xterm-kitty", "BOGGLE_GRAPHICS": "0"}))
+
+    def test_fit_keeps_aspect(self):
+        # Square image, 10x20 px cells: twice as many columns as rows
+        self.assertEqual(kitty.fit(340, 340, 100, 30, (10.0, 20.0)), (60, 30))
+        self.assertEqual(kitty.fit(340, 340, 40, 30, (10.0, 20.0)), (40, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, request  # noqa: E402
+
+from lexigraph_py.assets import IMMUTABLE, AssetStore  # noqa: E402
+
+
+class TestAssetStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        with open(os.path.join(root, "index.html"), "w") as f:
+            f.write('<script type="module" src="./main.ts"></script><a href="https://x.org/">x</a>')
+        with open(os.path.join(root, "main.ts"), "w") as f:
+            f.write("console.log('lexigraph');\n" * 40)
+        self.store = AssetStore(root)
+        self.app = Flask(__name__)
+        self.app.add_url_rule("/<path:path>", "asset",
+                              lambda path: self.store.respond(path, request))
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_index_links_hashed_names(self):
+        hashed = self.store.url("main.ts")
+        self.assertRegex(hashed, r"^main\.[0-9a-f]{12}\.ts$")
+        response = self.client.get("/index.html")
+        self.assertIn(f'src="./{hashed}"'.encode(), response.data)
+        self.assertIn(b'href="https://x.org/"', response.data)
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+
+    def test_hashed_asset_is_immutable_and_compressed(self):
+        hashed = self.store.url("main.ts")
+        response = self.client.get("/" + hashed, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Cache-Control"], IMMUTABLE)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.mimetype, "text/javascript")
+        self.assertEqual(gzip.decompress(response.data), b"console.log('lexigraph');\n" * 40)
+
+        plain = self.client.get("/" + hashed)
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertNotEqual(plain.headers["ETag"], response.headers["ETag"])
+
+    def test_revalidation_returns_304(self):
+        etag = self.client.get("/index.html").headers["ETag"]
+        again = self.client.get("/index.html", headers={"If-None-Match": etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.data, b"")
+
+    def test_unknown_path(self):
+        self.assertIsNone(self.store.lookup("missing.js"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import sys
+import threading
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexigraph_py.game import LexigraphGame
+from lexigraph_py import server as lexigraph_server
+
+TEST_PATH = [{'x': 0, 'y': 0}, {'x': 1, 'y': 0}, {'x': 2, 'y': 0}, {'x': 3, 'y': 0}]
+
+
+def place_test_word(game):
+    for i, ch in enumerate("TEST"):
+        game.grid.set_tile(i, 0, ch)
+
+
+class TestLexigraphDeltas(unittest.TestCase):
+    def setUp(self):
+        self.game = LexigraphGame()
+        self.deltas = []
+        self.game.subscribe(self.deltas.append)
+        place_test_word(self.game)
+
+    def test_move_delta_scales_with_path(self):
+        p1 = self.game.add_player("id1", "Alice")
+        self.game.process_move("id1", TEST_PATH)
+
+        joined, move = self.deltas
+        self.assertEqual(joined['joined'][0]['index'], p1.index)
+        self.assertEqual(move['seq'], joined['seq'] + 1)
+        self.assertEqual(move['tiles'], [[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0]])
+        self.assertEqual(move['scores'], [[0, 40]])
+
+    def test_failed_move_publishes_nothing(self):
+        self.game.add_player("id1", "Alice")
+        self.game.process_move("id1", [{'x': 0, 'y': 0}])
+        self.assertEqual(len(self.deltas), 1)
+
+    def test_leave_clears_owned_tiles(self):
+        self.game.add_player("id1", "Alice")
+        self.game.process_move("id1", TEST_PATH)
+        self.game.remove_player("id1")
+        left = self.deltas[-1]
+        self.assertEqual(left['left'], [0])
+        self.assertEqual(sorted(left['tiles']), [[i, 0, None] for i in range(4)])
+
+    def test_owner_indices_are_reused(self):
+        self.game.add_player("a", "A")
+        self.game.add_player("b", "B")
+        self.game.remove_player("a")
+        self.assertEqual(self.game.add_player("c", "C").index, 0)
+
+    def test_snapshot_carries_seq(self):
+        self.game.add_player("id1", "Alice")
+        snap = self.game.snapshot()
+        self.assertEqual(snap['seq'], self.game.seq)
+        self.assertEqual(snap['players'][0]['name'], "Alice")
+        self.assertEqual(len(snap['grid']), 7)
+
+    def test_wait_for_change(self):
+        seq = self.game.seq
+        self.assertEqual(self.game.wait_for_change(seq, timeout=0.05), seq)
+        threading.Timer(0.05, self.game.add_player, ("id9", "Late")).start()
+        self.assertEqual(self.game.wait_for_change(seq, timeout=5), seq + 1)
+
+
+class TestLexigraphServerDeltas(unittest.TestCase):
+    def test_connect_snapshot_then_deltas(self):
+        place_test_word(lexigraph_server.game)
+        client = lexigraph_server.socketio.test_client(lexigraph_server.app)
+        received = client.get_received()
+        self.assertEqual(received[0]['name'], 'state_update')
+        seq = received[0]['args'][0]['seq']
+
+        client.emit('join_game', 'Alice')
+        client.emit('submit_move', TEST_PATH)
+        events = client.get_received()
+        deltas = [e['args'][0] for e in events if e['name'] == 'state_delta']
+        self.assertEqual([d['seq'] for d in deltas], [seq + 1, seq + 2])
+        self.assertEqual(len(deltas[1]['tiles']), 4)
+        self.assertNotIn('state_update', [e['name'] for e in events])
+
+        client.emit('resync')
+        self.assertEqual(client.get_received()[0]['name'], 'state_update')
+        client.disconnect()
+
+
+if __name__ == '__main__':
+    unittest.main()
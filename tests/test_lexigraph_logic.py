@@ -1,3 +1,4 @@
+import random
 import unittest
 from lexigraph_py.game import LexigraphGame, Player, Tile, Grid
 
@@ -63,5 +64,97 @@ class TestLexigraphLogic(unittest.TestCase):
         # 4 letters * 10 pts = 40
         self.assertEqual(p1.score, 40)
 
+class TestCompactGrid(unittest.TestCase):
+    def test_tile_views_write_through(self):
+        grid = Grid(3, 2)
+        player = Player("id1", "Alice", "#FF0055", index=2)
+        tile = grid.get_tile(2, 1)
+        tile.char = 'q'
+        tile.owner = player
+        self.assertEqual(grid.letters[5], ord('Q'))
+        self.assertEqual(grid.owner_index(2, 1), 2)
+        self.assertIs(grid.get_tile(2, 1).owner, player)
+        self.assertIsNone(grid.get_tile(3, 0))
+
+    def test_serialize_format(self):
+        grid = Grid(2, 2)
+        player = Player("id1", "Alice", "#FF0055", index=0)
+        grid.set_tile(0, 0, 'a')
+        grid.set_owner(1, 1, player)
+        rows = grid.serialize()
+        self.assertEqual(rows[0][0], {'char': 'A', 'ownerId': None, 'ownerColor': None})
+        self.assertEqual(rows[1][1]['ownerId'], "id1")
+        self.assertEqual(rows[1][1]['ownerColor'], "#FF0055")
+
+    def test_large_board_is_compact(self):
+        grid = Grid(100, 100)
+        self.assertEqual(len(grid.letters), 10000)
+        self.assertEqual(grid.owners.itemsize * len(grid.owners), 20000)
+        self.assertEqual(len(grid.serialize()), 100)
+
+class TestTerritory(unittest.TestCase):
+    def setUp(self):
+        self.game = LexigraphGame()
+        for i, ch in enumerate("TEST"):
+            self.game.grid.set_tile(i, 0, ch)
+            self.game.grid.set_tile(i, 2, ch)
+        self.row0 = [{'x': i, 'y': 0} for i in range(4)]
+        self.row2 = [{'x': i, 'y': 2} for i in range(4)]
+
+    def test_owned_index_tracks_captures_and_steals(self):
+        p1 = self.game.add_player("id1", "Alice")
+        p2 = self.game.add_player("id2", "Bob")
+        self.game.process_move("id1", self.row0)
+        self.assertEqual(len(self.game.grid.owned_cells(p1.index)), 4)
+
+        self.game.process_move("id2", self.row0)
+        self.assertEqual(len(self.game.grid.owned_cells(p1.index)), 0)
+        self.assertEqual(len(self.game.grid.owned_cells(p2.index)), 4)
+
+    def test_regions(self):
+        self.game.add_player("id1", "Alice")
+        self.game.process_move("id1", self.row0)
+        self.game.process_move("id1", self.row2)
+        self.assertEqual(self.game.territory("id1"),
+                         {'tiles': 8, 'largest_region': 4, 'regions': 2})
+
+    def test_remove_player_only_touches_owned(self):
+        p1 = self.game.add_player("id1", "Alice")
+        self.game.process_move("id1", self.row0)
+        self.game.remove_player("id1")
+        self.assertEqual(len(self.game.grid.owned_cells(p1.index)), 0)
+        self.assertTrue(all(o == Grid.NO_OWNER for o in self.game.grid.owners))
+
+class TestTerritoryTracker(unittest.TestCase):
+    def assert_matches_bfs(self, grid, index):
+        regions = grid.regions(index)
+        self.assertEqual(grid.territory.stats(index), {
+            'tiles': len(grid.owned_cells(index)),
+            'regions': len(regions),
+            'largest_region': max((len(r) for r in regions), default=0),
+        })
+
+    def test_steal_splits_region(self):
+        grid = Grid(5, 5)
+        alice, bob = Player("a", "A", "#fff", 0), Player("b", "B", "#000", 1)
+        grid.assign([10, 11, 12, 13, 14], alice)
+        self.assertEqual(grid.territory.stats(0)['largest_region'], 5)
+        grid.assign([2, 7, 12, 17, 22], bob) # vertical cut through the middle
+        self.assertEqual(grid.territory.stats(0), {'tiles': 4, 'regions': 2, 'largest_region': 2})
+        self.assertEqual(grid.territory.stats(1), {'tiles': 5, 'regions': 1, 'largest_region': 5})
+
+    def test_random_moves_match_bfs(self):
+        rng = random.Random(7)
+        grid = Grid(7, 7)
+        players = [Player(str(i), str(i), "#fff", i) for i in range(3)]
+        for step in range(400):
+            player = rng.choice(players + [None])
+            cells = rng.sample(range(49), rng.randint(1, 6))
+            grid.assign(cells, player)
+            if step % 97 == 0:
+                grid.clear_owner(rng.randrange(3))
+            for p in players:
+                self.assert_matches_bfs(grid, p.index)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexigraph_py.game import LexigraphGame
+from lexigraph_py.persistence import GameJournal, MOVE, MoveLog, read_log, summarize
+
+ROW0 = [{'x': i, 'y': 0} for i in range(4)]
+ROW2 = [{'x': i, 'y': 2} for i in range(4)]
+
+
+def new_game():
+    game = LexigraphGame()
+    for i, ch in enumerate("TEST"):
+        game.grid.set_tile(i, 0, ch)
+        game.grid.set_tile(i, 2, ch)
+    return game
+
+
+def state(game):
+    snap = game.snapshot()
+    del snap['seq']
+    return snap, {pid: game.territory(pid) for pid in game.players}
+
+
+class TestGameJournal(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="lexigraph-test-")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def play(self, snapshot_every):
+        game = new_game()
+        journal = GameJournal.open(game, self.dir, snapshot_every=snapshot_every)
+        game.add_player("a", "Alice")
+        game.add_player("b", "Bob")
+        game.process_move("a", ROW0)
+        game.process_move("b", ROW0) # steal
+        game.process_move("a", ROW2)
+        game.process_move("a", [{'x': 0, 'y': 0}]) # rejected, not logged
+        game.add_player("c", "Carol")
+        game.remove_player("b")
+        # Simulate a crash: drop the journal without the closing snapshot
+        journal.log.close()
+        return game
+
+    def test_restore_from_log_only(self):
+        before = state(self.play(snapshot_every=10_000))
+        self.assertFalse(os.path.exists(os.path.join(self.dir, "snapshot.bin")))
+        restored = LexigraphGame()
+        self.assertEqual(GameJournal.open(restored, self.dir).since_snapshot, 0)
+        self.assertEqual(state(restored), before)
+
+    def test_restore_from_snapshot_plus_tail(self):
+        before = state(self.play(snapshot_every=3))
+        restored = LexigraphGame()
+        journal = GameJournal.open(restored, self.dir)
+        self.assertEqual(state(restored), before)
+
+        # The restored game keeps logging where the old one left off
+        restored.process_move("a", ROW0)
+        journal.log.close()
+        again = LexigraphGame()
+        GameJournal.open(again, self.dir)
+        self.assertEqual(state(again), state(restored))
+
+    def test_torn_tail_is_ignored(self):
+        before = state(self.play(snapshot_every=10_000))
+        log_path = os.path.join(self.dir, "moves.log")
+        with open(log_path, "ab") as f:
+            f.write(b"\x04\x00\x01") # half a record header
+        restored = LexigraphGame()
+        GameJournal.open(restored, self.dir)
+        self.assertEqual(state(restored), before)
+
+    def test_replay_uses_logged_moves(self):
+        before = state(self.play(snapshot_every=10_000))
+        restored = LexigraphGame()
+        # A changed word list must not change what the log says happened
+        with mock.patch.object(LexigraphGame, 'validate_move',
+                               side_effect=AssertionError("replay re-validated a move")):
+            GameJournal.open(restored, self.dir)
+        self.assertEqual(state(restored), before)
+
+    def test_large_boards_and_scores(self):
+        log_path = os.path.join(self.dir, "moves.log")
+        path = [{'x': 300, 'y': 1000}, {'x': 301, 'y': 1001}, {'x': 65535, 'y': 0}]
+        with MoveLog(log_path) as log:
+            log.move("a", path, 100_000)
+        (record,) = read_log(log_path)
+        self.assertEqual(record.data, ("a", 100_000, path))
+
+    def test_log_is_readable_offline(self):
+        self.play(snapshot_every=10_000)
+        log_path = os.path.join(self.dir, "moves.log")
+        moves = [r.data for r in read_log(log_path) if r.kind == MOVE]
+        self.assertEqual([(pid, score) for pid, score, _ in moves],
+                         [("a", 40), ("b", 60), ("a", 40)])
+        self.assertEqual(moves[0][2], ROW0)
+        summary = summarize(log_path)
+        self.assertEqual(summary['records'], {'board': 1, 'join': 3, 'leave': 1, 'move': 3})
+        self.assertEqual(summary['points'], {'a': 80, 'b': 60})
+
+
+if __name__ == '__main__':
+    unittest.main()
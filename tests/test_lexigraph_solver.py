@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexigraph_py import server as lexigraph_server
+from lexigraph_py import game as lexigraph_game
+from lexigraph_py import solver
+from lexigraph_py.game import LexigraphGame
+
+WORDS = ["TEST", "SET", "TEN", "NET", "ZZZ"]
+
+
+def fill(game, rows):
+    for y, row in enumerate(rows):
+        for x, ch in enumerate(row):
+            game.grid.set_tile(x, y, ch)
+
+
+class TestSolver(unittest.TestCase):
+    def setUp(self):
+        self.game = LexigraphGame()
+        self.trie = solver.build_trie(WORDS)
+        fill(self.game, ["TESTQQQ", "QNQQQQQ"] + ["QQQQQQQ"] * 5)
+
+    def test_finds_words_with_valid_paths(self):
+        words = solver.solve(self.game.grid, self.trie)
+        self.assertEqual(sorted(words), ["NET", "SET", "TEN", "TEST"])
+        # The game validates against its own word list; pin it to ours
+        with mock.patch.object(lexigraph_game, "DICTIONARY", set(WORDS)):
+            for word, paths in words.items():
+                for path in paths:
+                    coords = [{'x': c % 7, 'y': c // 7} for c in path]
+                    result = self.game.validate_move(coords)
+                    self.assertTrue(result['success'], result)
+                    self.assertEqual(result['word'], word)
+
+    def test_cache_follows_letter_changes(self):
+        first = solver.solve(self.game.grid, self.trie)
+        self.assertIs(solver.solve(self.game.grid, self.trie), first)
+        self.game.grid.set_tile(1, 1, 'Q') # breaks TEN and NET
+        self.assertEqual(sorted(solver.solve(self.game.grid, self.trie)), ["SET", "TEST"])
+
+    def test_ranking_prefers_steals(self):
+        self.game.add_player("a", "Alice")
+        bob = self.game.add_player("b", "Bob")
+        self.game.process_move("a", [{'x': i, 'y': 0} for i in range(4)])
+        best = solver.rank(self.game.grid, bob.index, trie=self.trie)[0]
+        self.assertEqual((best['word'], best['score']), ("TEST", 60))
+        # Alice already holds TEST; fresh tiles win the tie on score
+        mine = solver.rank(self.game.grid, 0, trie=self.trie)
+        self.assertEqual(mine[0]['word'], "TEST")
+        self.assertEqual(mine[0]['gained'], 0)
+
+    def test_default_dictionary_and_exhaustion(self):
+        self.game.add_player("a", "Alice")
+        self.assertEqual(self.game.hint("a")[0]['word'], "TEST")
+        self.assertTrue(self.game.has_moves())
+        fill(self.game, ["QQQQQQQ"] * 7)
+        self.assertFalse(self.game.has_moves())
+        self.assertEqual(self.game.hint("a"), [])
+
+    def test_find_words_on_rows(self):
+        self.assertEqual(sorted(solver.find_words(["TE", "NS"], self.trie)), ["NET", "SET", "TEN"])
+
+
+class TestHintEvent(unittest.TestCase):
+    def test_hint_goes_to_asking_client(self):
+        fill(lexigraph_server.game, ["TESTQQQ"] + ["QQQQQQQ"] * 6)
+        client = lexigraph_server.socketio.test_client(lexigraph_server.app)
+        client.emit('join_game', 'Alice')
+        client.get_received()
+        client.emit('request_hint', 1)
+        hint = [e for e in client.get_received() if e['name'] == 'hint'][0]['args'][0]
+        self.assertEqual([m['word'] for m in hint['moves']], ["TEST"])
+        self.assertFalse(hint['exhausted'])
+        client.disconnect()
+
+
+if __name__ == '__main__':
+    unittest.main()
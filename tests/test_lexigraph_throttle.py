@@ -0,0 +1,111 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexigraph_py import server as lexigraph_server
+from lexigraph_py.game import LexigraphGame
+from lexigraph_py.throttle import DeltaBatcher, TokenBucket
+
+TEST_PATH = [{'x': i, 'y': 0} for i in range(4)]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        self.assertEqual([bucket.allow() for _ in range(4)], [True, True, True, False])
+        clock.now += 0.5 # one token back
+        self.assertTrue(bucket.allow())
+        self.assertFalse(bucket.allow())
+        clock.now += 60 # never more than the burst
+        self.assertEqual(sum(bucket.allow() for _ in range(10)), 3)
+
+
+class TestDeltaBatcher(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        self.batcher = DeltaBatcher(self.sent.append)
+        self.batcher.running = True # hold deltas until flush()
+
+    def test_burst_becomes_one_delta(self):
+        game = LexigraphGame()
+        game.subscribe(self.batcher.add)
+        for i, ch in enumerate("TEST"):
+            game.grid.set_tile(i, 0, ch)
+        start = game.seq
+        game.add_player("a", "Alice")
+        game.add_player("b", "Bob")
+        game.process_move("a", TEST_PATH)
+        game.process_move("b", TEST_PATH)
+        self.batcher.flush()
+
+        self.assertEqual(len(self.sent), 1)
+        merged = self.sent[0]
+        self.assertEqual((merged['base'], merged['seq']), (start, start + 4))
+        self.assertEqual(sorted(merged['tiles']), [[i, 0, 1] for i in range(4)])
+        self.assertEqual(sorted(merged['scores']), [[0, 40], [1, 60]])
+        self.batcher.flush()
+        self.assertEqual(len(self.sent), 1) # nothing new, nothing sent
+
+    def test_reused_owner_index(self):
+        self.batcher.add({'seq': 1, 'tiles': [[0, 0, 0]], 'scores': [[0, 40]]})
+        self.batcher.add({'seq': 2, 'left': [0], 'tiles': [[0, 0, None]]})
+        self.batcher.add({'seq': 3, 'joined': [{'index': 0, 'name': 'New'}]})
+        merged = self.batcher.take()
+        self.assertEqual(merged['left'], [0])
+        self.assertEqual(merged['joined'], [{'index': 0, 'name': 'New'}])
+        self.assertEqual(merged['tiles'], [[0, 0, None]])
+        self.assertNotIn('scores', merged) # the old player's score is gone
+
+    def test_passthrough_until_started(self):
+        self.batcher.running = False
+        self.batcher.add({'seq': 7, 'left': [2]})
+        self.assertEqual(self.sent, [{'base': 6, 'seq': 7, 'left': [2]}])
+
+
+class TestServerRateLimit(unittest.TestCase):
+    def test_flood_is_rejected(self):
+        client = lexigraph_server.socketio.test_client(lexigraph_server.app)
+        client.emit('join_game', 'Spammer')
+        client.get_received()
+        for _ in range(lexigraph_server.MOVE_BURST + 5):
+            client.emit('submit_move', [{'x': 0, 'y': 0}])
+        results = [e['args'][0] for e in client.get_received() if e['name'] == 'move_result']
+        limited = [r for r in results if r.get('rate_limited')]
+        self.assertEqual(len(results), lexigraph_server.MOVE_BURST + 5)
+        self.assertGreaterEqual(len(limited), 4)
+        client.disconnect()
+
+    def test_zero_rate_disables_limit(self):
+        with mock.patch.object(lexigraph_server, 'MOVE_RATE', 0):
+            client = lexigraph_server.socketio.test_client(lexigraph_server.app)
+            client.emit('join_game', 'LoadBot')
+            client.get_received()
+            for _ in range(lexigraph_server.MOVE_BURST + 5):
+                client.emit('submit_move', [{'x': 0, 'y': 0}])
+            results = [e['args'][0] for e in client.get_received() if e['name'] == 'move_result']
+            self.assertEqual(len(results), lexigraph_server.MOVE_BURST + 5)
+            self.assertFalse(any(r.get('rate_limited') for r in results))
+            client.disconnect()
+
+
+class TestServerImport(unittest.TestCase):
+    def test_import_starts_no_log_thread(self):
+        # The queue listener belongs to run_server, not to every importer
+        self.assertIsNone(lexigraph_server.log_listener._thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
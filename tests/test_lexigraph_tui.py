@@ -0,0 +1,39 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexigraph_py.game import LexigraphGame
+from lexigraph_py.tui import LexigraphTUI
+
+
+def place_test_word(game):
+    for i, ch in enumerate("TEST"):
+        game.grid.set_tile(i, 0, ch)
+
+
+class TestLexigraphTUI(unittest.TestCase):
+    def test_cells_and_leaderboard_are_reused(self):
+        game = LexigraphGame()
+        place_test_word(game)
+        tui = LexigraphTUI(game)
+        tui.make_layout()
+        board_before = tui.layout["grid"].renderable
+        leaderboard = tui.leaderboard
+        cached = dict(tui.cells)
+
+        game.add_player("id1", "Alice")
+        tui.make_layout()
+        self.assertIsNot(tui.leaderboard, leaderboard) # a player joined
+        leaderboard = tui.leaderboard
+        tui.make_layout()
+        self.assertIs(tui.leaderboard, leaderboard) # nothing changed
+        self.assertIsNot(tui.layout["grid"].renderable, board_before)
+        for key, text in cached.items():
+            self.assertIs(tui.cell(*key), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
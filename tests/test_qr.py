@@ -0,0 +1,48 @@
+import hashlib
+import os
+import sys
+import unittest
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+import qr  # noqa: E402
+
+URL = "http://192.168.1.20:8080/room/ABCD/controller"
+
+
+def digest(modules):
+    return hashlib.sha1("\n".join("".join("1" if v else "0" for v in row)
+                                  for row in modules).encode()).hexdigest()
+
+
+class TestQREncoder(unittest.TestCase):
+    def test_matches_reference_symbols(self):
+        # Reference matrices produced by an independent encoder (segno)
+        self.assertEqual(digest(qr.encode(URL, "M", mask=2)),
+                         "cba630b7907a05f90dcd95c76563397d219b2201")
+        self.assertEqual(digest(qr.encode(URL, "H", mask=5)),
+                         "31365529abba8a1d3d2a64abdf086443de85eae9")
+
+    def test_reed_solomon(self):
+        # ISO/IEC 18004 annex example: "HELLO WORLD", version 1-M
+        data = [32, 91, 11, 120, 209, 114, 220, 77, 67, 64, 236, 17, 236, 17, 236, 17]
+        self.assertEqual(qr._rs_remainder(data, qr._rs_divisor(10)),
+                         [196, 35, 39, 119, 235, 215, 231, 226, 93, 23])
+
+    def test_picks_smallest_version(self):
+        self.assertEqual(len(qr.encode("hi")), 21)
+        self.assertEqual(len(qr.encode(URL)), 33)  # version 4
+        self.assertEqual(len(qr.encode("x" * 2331)), 177)  # version 40-M capacity
+        with self.assertRaises(ValueError):
+            qr.encode("x" * 2332)
+
+    def test_svg_is_cached(self):
+        svg = qr.qr_svg(URL)
+        self.assertTrue(svg.startswith("<svg"))
+        self.assertIs(qr.qr_svg(URL), svg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+import unittest
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+import server as boggle_server  # noqa: E402
+from rooms import RoomManager, RoundScheduler  # noqa: E402
+
+
+class TestRoomManager(unittest.TestCase):
+    def test_rooms_are_independent(self):
+        rooms = RoomManager()
+        a, game_a = rooms.create()
+        b, game_b = rooms.create()
+        self.assertNotEqual(a, b)
+        game_a.add_player("Alice")
+        self.assertIn("Alice", game_a.players)
+        self.assertNotIn("Alice", game_b.players)
+        self.assertIs(rooms.get(a.lower()), game_a)
+        self.assertIs(game_a.generator, game_b.generator)  # word list is shared
+
+    def test_reap_idle_keeps_pinned_and_playing(self):
+        rooms = RoomManager()
+        rooms.create("KEEP", pinned=True)
+        _, playing = rooms.create("PLAY")
+        rooms.create("LAZY")
+        playing.start_game()
+        self.assertEqual(rooms.reap_idle(0), ["LAZY"])
+        self.assertEqual(sorted(rooms.codes()), ["KEEP", "PLAY"])
+
+    def test_shared_scheduler_ends_rounds(self):
+        rooms = RoomManager(RoundScheduler())
+        games = [rooms.create()[1] for _ in range(3)]
+        for game in games:
+            game.duration = 0
+            rooms.start_round(game)
+        deadline = time.time() + 2
+        while time.time() < deadline and any(g.state == "PLAYING" for g in games):
+            time.sleep(0.01)
+        self.assertEqual([g.state for g in games], ["SCORING"] * 3)
+
+    def test_idle_lobbies_are_small(self):
+        rooms = RoomManager()
+        rooms.create()  # warm the shared generator
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(500):
+            rooms.create()[1].add_player("Host")
+        per_room = (tracemalloc.get_traced_memory()[0] - before) / 500
+        tracemalloc.stop()
+        self.assertLess(per_room, 4096)
+
+
+class TestRoomRoutes(unittest.TestCase):
+    def setUp(self):
+        self.client = boggle_server.app.test_client()
+
+    def test_room_scoped_endpoints(self):
+        code = self.client.post('/rooms').get_json()["room"]
+        self.assertIn(code, self.client.get('/rooms').get_json()["rooms"])
+
+        r = self.client.post(f'/room/{code}/join', json={"name": "Zed"})
+        self.assertEqual(r.status_code, 200)
+        players = self.client.get(f'/room/{code}/state').get_json()["players"]
+        self.assertEqual(list(players), ["Zed"])
+        self.assertNotIn("Zed", self.client.get('/state').get_json()["players"])
+
+        html = self.client.get(f'/room/{code}/view/join').get_data(as_text=True)
+        self.assertIn(f"/room/{code}/controller", html)
+
+    def test_requested_codes_are_normalized_and_checked(self):
+        r = self.client.post('/rooms', json={"room": "wxyz"})
+        self.assertEqual((r.status_code, r.get_json()["room"]), (201, "WXYZ"))
+        self.assertEqual(self.client.get('/room/wxyz/state').status_code, 200)
+        self.assertEqual(self.client.post('/rooms', json={"room": "WXYZ"}).status_code, 409)
+        self.assertTrue(boggle_server.rooms.remove("wxyz"))
+        for bad in (5, ["ABCD"], "AB/C", "AB C", "ABCDE", "IOIO"):
+            self.assertEqual(self.client.post('/rooms', json={"room": bad}).status_code, 400, bad)
+
+    def test_unknown_room_is_404(self):
+        self.assertEqual(self.client.get('/room/NOPE/state').status_code, 404)
+
+    def test_event_stream_pushes_changes(self):
+        code = self.client.post('/rooms').get_json()["room"]
+        resp = self.client.get(f'/room/{code}/events', buffered=False)
+        self.assertEqual(resp.mimetype, "text/event-stream")
+        chunks = iter(resp.response)
+
+        first = next(chunks).decode()
+        self.assertTrue(first.startswith("id: "))
+        boggle_server.rooms.get(code).add_player("Yan")
+        second = next(chunks).decode()
+        payload = json.loads(second.split("data: ", 1)[1])
+        self.assertIn("Yan", payload["players"])
+        resp.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import io
+import os
+import sys
+import unittest
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+from screen import CSI, Screen  # noqa: E402
+
+
+def frame(screen, lines):
+    screen.begin()
+    for y, (text, style) in enumerate(lines):
+        screen.text(0, y, text, style)
+    return screen.present()
+
+
+class TestScreen(unittest.TestCase):
+    def setUp(self):
+        self.out = io.StringIO()
+        self.screen = Screen(self.out, size=(20, 4))
+        self.screen.__enter__()
+        self.out.truncate(0)
+        self.out.seek(0)
+
+    def test_identical_frame_writes_nothing(self):
+        lines = [("HELLO", "\033[1m"), ("WORLD", "")]
+        self.assertGreater(frame(self.screen, lines), 0)
+        self.assertEqual(frame(self.screen, lines), 0)
+
+    def test_only_changed_cells_are_sent(self):
+        frame(self.screen, [("00:59", ""), ("board", "")])
+        self.out.truncate(0)
+        self.out.seek(0)
+        frame(self.screen, [("00:58", ""), ("board", "")])
+        written = self.out.getvalue()
+        self.assertIn(f"{CSI}1;5H", written) # jump straight to the last digit
+        self.assertIn("8", written)
+        self.assertNotIn("board", written)
+        self.assertNotIn("00:5", written)
+
+    def test_removed_rows_are_blanked(self):
+        frame(self.screen, [("A", ""), ("B", ""), ("C", "")])
+        self.out.truncate(0)
+        self.out.seek(0)
+        frame(self.screen, [("A", "")])
+        written = self.out.getvalue()
+        self.assertIn(f"{CSI}2;1H", written)
+        self.assertIn(f"{CSI}3;1H ", written)
+        self.assertEqual(written.count(" "), 2)
+
+    def test_wide_characters_take_two_cells(self):
+        self.screen.begin()
+        end = self.screen.text(0, 0, "🏆X")
+        self.assertEqual(end, 3)
+        self.assertEqual(self.screen.frame[0][2][0], "X")
+
+    def test_clipping(self):
+        self.screen.begin()
+        self.screen.text(18, 0, "ABCDEF")
+        self.screen.text(0, 10, "off screen")
+        self.assertEqual("".join(c for c, _ in self.screen.frame[0][18:]), "AB")
+
+
+if __name__ == '__main__':
+    unittest.main()
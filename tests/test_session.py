@@ -0,0 +1,98 @@
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.events import WindowEvents  # noqa: E402
+from engine.session import Session, SessionError  # noqa: E402
+
+
+class TestSession(unittest.TestCase):
+    def test_independent_steps_overlap(self):
+        session = Session()
+        session.step("server", lambda: time.sleep(0.2))
+        session.step("background", lambda: time.sleep(0.2))
+        session.step("windows", lambda: time.sleep(0.05), after=["server"])
+        start = time.monotonic()
+        report = session.run()
+        self.assertLess(time.monotonic() - start, 0.4)
+        windows = report.by_name["windows"]
+        self.assertGreaterEqual(windows.started, report.by_name["server"].ready)
+        self.assertEqual([s.name for s in report.critical_path()], ["server", "windows"])
+        self.assertIn("critical path", report.format())
+
+    def test_waits_for_probe(self):
+        ready_at = time.monotonic() + 0.1
+        order = []
+        session = Session()
+        session.step("server", lambda: order.append("server"),
+                     probe=lambda: time.monotonic() >= ready_at)
+        session.step("windows", lambda: order.append(("windows", time.monotonic() >= ready_at)),
+                     after=["server"])
+        report = session.run()
+        self.assertEqual(order, ["server", ("windows", True)])
+        self.assertGreater(report.by_name["server"].ready - report.by_name["server"].returned, 0.05)
+
+    def test_failure_skips_dependents(self):
+        session = Session()
+        session.step("server", lambda: 1 / 0)
+        session.step("windows", lambda: None, after=["server"])
+        session.step("overlay", lambda: None, after=["windows"])
+        session.step("animations", lambda: None)
+        with self.assertRaises(SessionError) as ctx:
+            session.run()
+        report = ctx.exception.report
+        self.assertIsInstance(report.by_name["server"].error, ZeroDivisionError)
+        self.assertTrue(report.by_name["windows"].skipped)
+        self.assertTrue(report.by_name["overlay"].skipped)
+        self.assertTrue(report.by_name["animations"].ok)
+
+    def test_rejects_cycles(self):
+        session = Session()
+        session.step("a", lambda: None, after=["b"])
+        session.step("b", lambda: None, after=["a"])
+        with self.assertRaises(ValueError):
+            session.run()
+
+
+class TestWindowEvents(unittest.TestCase):
+    def test_waits_for_announced_window(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, ".socket2.sock")
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(path)
+            server.listen(1)
+            accepted = []
+            threading.Thread(target=lambda: accepted.append(server.accept()[0]),
+                             daemon=True).start()
+            events = WindowEvents.connect(path)
+            self.assertIsNotNone(events)
+            since = events.mark()
+
+            def announce():
+                time.sleep(0.05)
+                conn = accepted[0]
+                conn.sendall(b"openwindow>>abc,1,ghostty,other\n"
+                             b"openwindow>>def,2,com.mitchellh.ghostty,ghostty\n")
+                conn.sendall(b"windowtitlev2>>def,BoggleTimer, with commas\n")
+            threading.Thread(target=announce, daemon=True).start()
+
+            address = events.wait_for(
+                lambda w: "BoggleTimer" in w["title"] and w["workspace"] == "2", since, timeout=2)
+            self.assertEqual(address, "0xdef")
+            self.assertIsNone(events.wait_for(lambda w: "Nope" in w["title"], since, timeout=0.05))
+            accepted[0].close()
+            server.close()
+
+    def test_missing_socket(self):
+        self.assertIsNone(WindowEvents.connect("/nonexistent/.socket2.sock"))
+
+
+if __name__ == "__main__":
+    unittest.main()
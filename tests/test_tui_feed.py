@@ -0,0 +1,63 @@
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+from werkzeug.serving import make_server
+
+# Add the boggle script directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "boggle"))
+
+import server as boggle_server  # noqa: E402
+from game_state import BoggleGame  # noqa: E402
+import tui  # noqa: E402
+
+
+class TestStateFeed(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.httpd = make_server("127.0.0.1", 0, boggle_server.app, threaded=True)
+        threading.Thread(target=cls.httpd.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.httpd.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+
+    def setUp(self):
+        # A table of our own behind the top-level routes, so the shared one
+        # is left as the other tests expect it
+        patcher = mock.patch.object(boggle_server, "game", BoggleGame())
+        self.game = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_updates_are_pushed(self):
+        game = self.game
+        feed = tui.StateFeed(self.url)
+        version, state = feed.wait(0, timeout=5)
+        self.assertIsNotNone(state)
+
+        game.add_player("Feedy")
+        version, state = feed.wait(version, timeout=5)
+        self.assertIn("Feedy", state["players"])
+
+        # Nothing changes, nothing arrives
+        self.assertEqual(feed.wait(version, timeout=0.3)[0], version)
+
+    def test_countdown_uses_server_deadline(self):
+        feed = tui.StateFeed(self.url)
+        feed.wait(0, timeout=5)
+        # Same machine, so the measured offset is just noise
+        self.assertLess(abs(feed.offset), 0.05)
+        game = self.game
+        game.start_game()
+        state = game.to_json()
+        self.assertAlmostEqual(state["timer_end"], state["server_time"] + game.duration,
+                               delta=1)
+        self.assertAlmostEqual(feed.remaining(state), game.duration, delta=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
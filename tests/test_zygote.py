@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add project root to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from engine import zygote  # noqa: E402
+
+SCRIPT = """
+import os, sys
+print("argv", sys.argv[1:], "preloaded", "decimal" in sys.modules, os.environ.get("ZYGOTE_TEST"))
+sys.stdout.flush()
+if sys.argv[1:] == ["wait"]:
+    sys.stdin.read()
+sys.exit(int(os.environ.get("EXIT_CODE", "0")))
+"""
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+class TestZygote(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.socket = os.path.join(cls.tmp.name, "zygote.sock")
+        cls.script = os.path.join(cls.tmp.name, "worker.py")
+        with open(cls.script, "w") as f:
+            f.write(SCRIPT)
+        cls.proc = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT_DIR, "engine", "zygote.py"), "serve",
+             "--socket", cls.socket, "--preload", "decimal"])
+        if not zygote.wait_ready(cls.socket, timeout=10):
+            cls.proc.kill()
+            raise RuntimeError("zygote did not start")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.proc.terminate()
+        cls.proc.wait()
+        cls.tmp.cleanup()
+
+    def run_worker(self, *args, env=None):
+        r, w = os.pipe()
+        null = os.open(os.devnull, os.O_RDONLY)
+        try:
+            code = zygote.launch(self.socket, [self.script, *args], env=env,
+                                 fds=(null, w, w), forward_signals=False)
+        finally:
+            os.close(w)
+            os.close(null)
+        with os.fdopen(r) as out:
+            return code, out.read()
+
+    def test_runs_script_on_passed_fds(self):
+        env = dict(os.environ, ZYGOTE_TEST="hello", EXIT_CODE="3")
+        code, out = self.run_worker("a", "b", env=env)
+        self.assertEqual(code, 3)
+        self.assertIn("argv ['a', 'b'] preloaded True hello", out)
+
+    def test_workers_run_concurrently(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.run_worker()))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        self.assertEqual([code for code, _ in results], [0] * 4)
+
+    def test_client_hangup_ends_worker(self):
+        r, w = os.pipe()
+        out_r, out_w = os.pipe()
+        client = subprocess.Popen(
+            [sys.executable, "-S", os.path.join(ROOT_DIR, "engine", "zygote.py"), "run",
+             "--socket", self.socket, "--", self.script, "wait"],
+            stdin=r, stdout=out_w)
+        os.close(out_w)
+        with os.fdopen(out_r) as out:
+            self.assertIn("argv ['wait']", out.readline())
+            client.kill()
+            client.wait()
+            # The worker got SIGHUP: its copy of stdout closes without output
+            self.assertEqual(out.read(), "")
+        os.close(r)
+        os.close(w)
+
+
+if __name__ == "__main__":
+    unittest.main()